@@ -0,0 +1,247 @@
+# app/api/async_bxm_client.py
+"""
+asyncio 기반 BXM API 클라이언트.
+BxmApiClient 와 같은 login / get_today_error_logs / _parse_logs 인터페이스를 코루틴으로 제공한다.
+하나의 aiohttp 세션(keep-alive 커넥션 풀)을 모든 채널이 공유하므로,
+스레드를 요청마다 두지 않고 이벤트 루프 하나에서 여러 채널/페이지를 동시에 조회할 수 있다.
+서버별 요청 한도(TokenBucket) / 서킷 브레이커는 BxmSessionRegistry 의 것을 함께 사용하므로
+동기 클라이언트와 같은 레지스트리를 넘기면 두 경로의 요청이 같은 한도 안에서 전송된다.
+
+사용 예)
+    async with AsyncBxmApiClient() as client:
+        ok, cookies, msg = await client.login(url, user_id, password)
+        async for page, rows in client.iter_error_log_pages(url, cookies, start, end):
+            aggregator.process_batch(rows)
+
+로컬 테스트: python -m app.api.bxm_stub_server --port 8099 (bxmAdmin/json 엔드포인트 모사)
+"""
+
+import asyncio
+
+import aiohttp
+
+from app.api import json_codec
+from app.api.bxm_client import (
+    BxmApiClient, JSON_HEADERS, build_error_log_payload, build_login_payload,
+    default_search_range, is_login_success,
+)
+from app.api.session_registry import BxmSessionRegistry
+from app.api.throttle import CircuitOpenError
+
+# 재시도 대상 HTTP 상태 (BxmApiClient 의 Retry 설정과 동일)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class AsyncBxmApiClient:
+    """
+    BXM 시스템 모니터링용 비동기 API 클라이언트
+    로그인 쿠키는 세션에 저장하지 않고 반환값으로 넘겨 요청마다 전달한다 (채널별 계정이 달라도 풀 공유 가능).
+    """
+    PAGE_SIZE = BxmApiClient.PAGE_SIZE
+
+    # 응답 해석/가상 로그 생성은 동기 클라이언트와 동일한 구현 사용
+    _extract_logs = BxmApiClient._extract_logs
+    _parse_logs = BxmApiClient._parse_logs
+    _build_mock_logs = BxmApiClient._build_mock_logs
+    _count = BxmApiClient._count
+    _record_failure = BxmApiClient._record_failure
+
+    def __init__(self, logger=None, pool_size=100, pool_size_per_host=20, keepalive_sec=30,
+                 retries=2, backoff_factor=0.3, session_registry=None, mock_fallback=False, metrics=None):
+        """
+        :param pool_size: 전체 동시 연결 수 상한
+        :param pool_size_per_host: 서버(채널)별 동시 연결 수 상한
+        :param keepalive_sec: 유휴 연결 유지 시간 (초)
+        :param retries: 연결 오류 / 재시도 대상 상태 코드 응답 시 재시도 횟수
+        :param session_registry: BxmSessionRegistry (서버별 요청 한도 / 서킷 브레이커 공유. None 이면 이 클라이언트 전용)
+        :param mock_fallback: 로그인 실패 시 가상(Mock) 모드로 전환할지 여부 (기본값 False: 로그인 실패로 반환)
+                              로그인 이후의 조회 오류는 Mock 으로 대체하지 않고 예외로 전달한다.
+        :param metrics: ScanMetrics (지정 시 재시도 / 요청 한도 대기 시간 등을 카운터로 기록)
+        """
+        self.timeout = 10
+        self.logger = logger
+        self.sessions = session_registry or BxmSessionRegistry()
+        self.mock_fallback = mock_fallback
+        self.metrics = metrics
+        self.is_mock_mode = False
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_sec = keepalive_sec
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _log(self, message, level="INFO"):
+        if self.logger:
+            self.logger(message, level)
+
+    def _get_session(self):
+        """공유 세션 (이벤트 루프 안에서 처음 사용할 때 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size_per_host,
+                                             keepalive_timeout=self.keepalive_sec)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=JSON_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _post(self, base_url, api_url, payload, cookies=None):
+        """
+        서버별 서킷 브레이커 / 요청 한도를 거쳐 JSON POST (재시도 포함)
+        - 서킷이 열려 있으면 요청하지 않고 CircuitOpenError
+        - 재시도 요청도 요청 한도를 적용하며, 최종 결과가 연결 오류 / 5xx·429 면 실패로 기록
+        :return: (응답 JSON, 응답 쿠키 dict)
+        """
+        breaker = self.sessions.breaker(base_url)
+        try:
+            breaker.before_request()
+        except CircuitOpenError:
+            self._count("circuit_open")
+            raise
+        limiter = self.sessions.limiter(base_url)
+        session = self._get_session()
+        attempt = 0
+        try:
+            while True:
+                # 토큰만 예약하고 대기는 이벤트 루프에서 (스레드를 막지 않음)
+                wait = limiter.reserve()
+                if wait > 0:
+                    self._count("rate_limit_wait_sec", wait)
+                    await asyncio.sleep(wait)
+                try:
+                    async with session.post(api_url, json=payload, cookies=cookies) as response:
+                        if response.status in RETRY_STATUSES and attempt < self.retries:
+                            raise aiohttp.ClientResponseError(response.request_info, response.history,
+                                                              status=response.status, message=response.reason)
+                        if response.status >= 500 or response.status == 429:
+                            self._record_failure(breaker)
+                        else:
+                            breaker.record_success()
+                        response.raise_for_status()
+                        res_json = json_codec.loads(await response.read())
+                        return res_json, {name: morsel.value for name, morsel in response.cookies.items()}
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    status_error = isinstance(e, aiohttp.ClientResponseError)
+                    retryable = not status_error or e.status in RETRY_STATUSES
+                    if not retryable or attempt >= self.retries:
+                        if not status_error:
+                            # 상태 코드 응답은 위에서 이미 기록
+                            self._count("request_errors")
+                            self._record_failure(breaker)
+                        raise
+                    self._count("http_retries")
+                    await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                    attempt += 1
+        except asyncio.CancelledError:
+            # 취소된 요청이 시험 요청이었다면 다음 요청이 다시 시험하도록 함
+            breaker.release()
+            raise
+
+    async def login(self, base_url, user_id, password):
+        """
+        로그인 시도 (BxmApiClient.login 과 동일한 반환값)
+        :return: (성공 여부, 쿠키 dict 또는 None, 메시지)
+        """
+        api_url = f"{base_url.rstrip('/')}/bxmAdmin/json/login"
+        payload = build_login_payload(user_id, password)
+
+        try:
+            res_json, cookies = await self._post(base_url, api_url, payload)
+
+            if is_login_success(res_json):
+                self._log(f"[{base_url}] 로그인 성공.", "SUCCESS")
+                return True, cookies, "Login Success"
+            else:
+                msg = res_json.get("header", {}).get("returnMessage", "Unknown Error")
+                if not self.mock_fallback:
+                    self._log(f"[{base_url}] 로그인 실패 (서버 응답): {msg}", "ERROR")
+                    return False, None, msg
+                self._log(f"[{base_url}] 로그인 실패 (서버 응답): {msg}", "WARN")
+                # 실패 시 Mock 전환
+                self.is_mock_mode = True
+                return True, None, "Mock Login Success"
+
+        except Exception as e:
+            if not self.mock_fallback:
+                self._log(f"[{base_url}] API 연결 실패 ({str(e)}).", "ERROR")
+                return False, None, str(e)
+            self._log(f"[{base_url}] API 연결 실패 ({str(e)}). 가상(Mock) 모드로 전환합니다.", "WARN")
+            self.is_mock_mode = True
+            return True, None, "Mock Login Success"
+
+    async def get_today_error_logs(self, base_url, cookies, start_dt=None, end_dt=None, page_num=1):
+        """
+        에러 로그 한 페이지 조회 (BxmApiClient.get_today_error_logs 와 동일한 반환값)
+        :raises CircuitOpenError: 서버 연속 실패로 요청을 차단 중인 경우
+        :raises aiohttp.ClientError, asyncio.TimeoutError: 그 밖의 조회 실패 (가상 로그로 대체하지 않음)
+        """
+        start_dt, end_dt = default_search_range(start_dt, end_dt)
+
+        if self.is_mock_mode:
+            return await self._generate_mock_logs(page_num)
+
+        api_url = f"{base_url.rstrip('/')}/bxmAdmin/json"
+        payload = build_error_log_payload(start_dt, end_dt, page_num, self.PAGE_SIZE)
+
+        try:
+            res_json, _cookies = await self._post(base_url, api_url, payload, cookies)
+            return self._extract_logs(res_json)
+
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self._log(f"API 호출 중 오류 발생: {e}", "WARN")
+            raise
+
+    async def iter_error_log_pages(self, base_url, cookies, start_dt=None, end_dt=None,
+                                   max_in_flight=4, start_page=1):
+        """
+        페이지를 최대 max_in_flight 개씩 동시에 요청하고 페이지 번호 순서대로 (page, rows) 반환
+        (PipelinedPageFetcher 의 비동기 버전 - 짧은 페이지를 받으면 종료하고 남은 요청은 취소)
+        """
+        start_dt, end_dt = default_search_range(start_dt, end_dt)
+        max_in_flight = max(1, int(max_in_flight))
+        tasks = {}
+        next_submit = start_page
+
+        def submit():
+            nonlocal next_submit
+            tasks[next_submit] = asyncio.ensure_future(
+                self.get_today_error_logs(base_url, cookies, start_dt, end_dt, page_num=next_submit))
+            next_submit += 1
+
+        try:
+            for _ in range(max_in_flight):
+                submit()
+            page = start_page
+            while page in tasks:
+                rows = await tasks.pop(page)
+                if not rows or len(rows) < self.PAGE_SIZE:
+                    if rows:
+                        yield page, rows
+                    return
+                submit()
+                yield page, rows
+                page += 1
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def _generate_mock_logs(self, page_num):
+        """테스트를 위한 가상 에러 로그 생성기 (이벤트 루프를 막지 않도록 비동기 대기)"""
+        await asyncio.sleep(0.5)
+        return self._build_mock_logs(page_num)
@@ -1,213 +1,419 @@
 # app/api/bxm_client.py
 
 import requests
-import json
 import random
 import time
 from datetime import datetime
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from operator import itemgetter
+from urllib3.exceptions import ReadTimeoutError
 
+from app.api import json_codec
+from app.api.session_registry import BxmSessionRegistry
+from app.api.throttle import CircuitOpenError
 from app.core.chnl_constants import CHNL_LABELS
+from app.core.message_template import default_templater
+
+# BXM 에러 로그 항목에서 사용하는 필드와 기본값 (나머지 필드는 읽지 않음)
+_LOG_FIELDS = ("logOccurDttm", "chlTypeCd", "application", "service", "operation", "errCd", "msgType")
+_LOG_DEFAULTS = ("Unknown", "Unknown", "Unknown", "Unknown", "Unknown", "FAIL", "Error")
+_LOG_GETTER = itemgetter(*_LOG_FIELDS)
+# 정상 처리 코드 (에러 코드로 결합하지 않음)
+_SUCCESS_CODES = frozenset(("0", "00", "0000", "S", "SUCCESS"))
+
+# 세션 만료 / 미인증으로 보는 HTTP 상태와 응답 메시지 키워드 (이 경우 재로그인 후 한 번 더 요청)
+AUTH_FAILURE_STATUSES = frozenset((401, 403))
+_AUTH_FAILURE_WORDS = ("session", "login", "세션", "로그인")
+
+# 요청 공통 헤더 (동기/비동기 클라이언트 공용)
+JSON_HEADERS = {
+    "Content-Type": "application/json; charset=UTF-8",
+    "Accept": "application/json"
+}
+
+
+def build_login_payload(user_id, password):
+    """bxmAdmin/json/login 요청 본문"""
+    return {
+        "header": {
+            "application": "bxmAdmin", "langCd": "ko",
+            "service": "AuthorityService", "operation": "loginOperation"
+        },
+        "LoginOMM": {
+            "userId": user_id, "userPwd": password, "lang": "ko", "domainId": "OKC"
+        }
+    }
+
+
+def build_error_log_payload(start_dt, end_dt, page_num, page_size):
+    """bxmAdmin/json getErrorLogList 요청 본문"""
+    return {
+        "header": {
+            "application": "bxmAdmin", "service": "OnlineLogService",
+            "operation": "getErrorLogList", "langCd": "ko"
+        },
+        "OnlineLogSearchConditionOMM": {
+            "brdyDt": "",
+            "bxmAppId": "",
+            "ci": "",
+            "custNm": "",
+            "errCd": "",
+            "guid": "",
+            "logOccurDttmEnd": end_dt,
+            "logOccurDttmStart": start_dt,
+            "nodeName": "",
+            "opNm": "",
+            "pageCount": str(page_size),
+            "pageNum": str(page_num),
+            "sendUserIp": "",
+            "svcNm": ""
+        }
+    }
+
+
+def is_login_success(res_json):
+    """로그인 응답 성공 여부 (참고 코드 방식)"""
+    if "ResponseCode" in res_json and res_json["ResponseCode"].get("code") == 100:
+        return True
+    return "header" in res_json and res_json["header"].get("returnCode") == "0"
+
+
+def is_auth_failure(res_json):
+    """정상 조회 결과 없이 세션/로그인 관련 오류 메시지를 돌려준 응답인지 여부"""
+    if not isinstance(res_json, dict) or "ErrorLogListOMM" in res_json:
+        return False
+    header = res_json.get("header") or {}
+    if header.get("returnCode") in (None, "0"):
+        return False
+    message = str(header.get("returnMessage", "")).lower()
+    return any(word in message for word in _AUTH_FAILURE_WORDS)
+
+
+def default_search_range(start_dt=None, end_dt=None):
+    """조회 기간 기본값 (오늘 00:00 ~ 23:59)"""
+    if not start_dt:
+        start_dt = datetime.now().strftime("%Y-%m-%d 00:00")
+    if not end_dt:
+        end_dt = datetime.now().strftime("%Y-%m-%d 23:59")
+    return start_dt, end_dt
+
+
+class PageTimeoutError(Exception):
+    """페이지 크기를 지정한 에러 로그 조회의 응답 시간 초과 (호출 측에서 페이지 크기를 줄여 재시도)"""
+
+    def __init__(self, page_size):
+        super().__init__(f"에러 로그 조회 응답 시간 초과 (pageCount={page_size})")
+        self.page_size = page_size
+
+
+class ErrorLogPage(list):
+    """
+    에러 로그 한 페이지 (파싱된 로그 리스트).
+    페이지 크기 조정용으로 서버 응답 시간(elapsed, 초)과 응답 크기(nbytes)를 함께 담는다.
+    캐시 적중 시에는 원래 조회했을 때의 값이며, 측정값이 없으면 elapsed 는 None.
+    """
+    __slots__ = ("elapsed", "nbytes", "cached")
+
+    def __init__(self, rows=(), elapsed=None, nbytes=0, cached=False):
+        super().__init__(rows)
+        self.elapsed = elapsed
+        self.nbytes = nbytes
+        self.cached = cached
+
+
+def _is_timeout(error):
+    """requests 읽기 시간 초과 여부 (재시도 소진 후 ConnectionError 로 감싸진 경우 포함)"""
+    if isinstance(error, requests.Timeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(error, requests.ConnectionError) and isinstance(reason, ReadTimeoutError)
+
 
 class BxmApiClient:
     """
     BXM 시스템 모니터링을 위한 API 클라이언트
     (Reference: api_service.py 패턴 적용)
     """
-    def __init__(self, logger=None):
+    # 에러 로그 조회 1회당 기본 요청 건수 (응답이 요청 건수보다 적으면 마지막 페이지)
+    PAGE_SIZE = 100
+
+    def __init__(self, logger=None, response_cache=None, page_size=None, session_registry=None, mock_fallback=True,
+                 metrics=None):
+        """
+        :param response_cache: ResponseCache (지정 시 에러 로그 조회 응답을 디스크에 캐시)
+        :param page_size: 기본 요청 건수 (None 이면 PAGE_SIZE)
+        :param session_registry: BxmSessionRegistry (커넥션 풀 / 로그인 쿠키 / 요청 한도 공유. None 이면 이 클라이언트 전용)
+        :param mock_fallback: 로그인 실패 시 가상(Mock) 모드로 전환할지 여부 (False 면 로그인 실패로 반환)
+                              로그인 이후의 조회 오류는 Mock 으로 대체하지 않고 예외로 전달한다.
+        :param metrics: ScanMetrics (지정 시 재시도 / 재로그인 / 요청 한도 대기 시간 등을 카운터로 기록)
+        """
         self.timeout = 10
         self.logger = logger
-        self.session_pool = {}  # {base_url: Session}
+        self.response_cache = response_cache
+        self.page_size = page_size or self.PAGE_SIZE
+        self.sessions = session_registry or BxmSessionRegistry()
+        self.mock_fallback = mock_fallback
+        self.metrics = metrics
         self.is_mock_mode = False
-        
-        # 재시도 전략 설정 (api_service.py 참조)
-        retry_strategy = Retry(
-            total=2,
-            backoff_factor=0.3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["POST"]
-        )
-        self.adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
-        )
 
     def _log(self, message, level="INFO"):
         if self.logger:
             self.logger(message, level)
 
+    def _count(self, name, value=1):
+        if self.metrics is not None:
+            self.metrics.add(name, value)
+
     def _get_session(self, base_url):
         """
-        URL별 세션 가져오기 (커넥션 재사용용)
+        URL별 세션 가져오기 (커넥션 재사용용, 레지스트리에서 스캔 간 공유)
         참고: 로그인 세션과는 별도로 관리되며, 쿠키는 인자로 받아서 사용함.
         """
-        if base_url not in self.session_pool:
-            session = requests.Session()
-            session.mount("http://", self.adapter)
-            session.mount("https://", self.adapter)
-            self.session_pool[base_url] = session
-        return self.session_pool[base_url]
+        return self.sessions.session(base_url)
+
+    def _send(self, session, base_url, api_url, count_timeouts=True, **kwargs):
+        """
+        서버별 요청 한도 / 서킷 브레이커를 거쳐 POST
+        - 서킷이 열려 있으면 요청하지 않고 CircuitOpenError
+        - 연결 오류 / 재시도 후에도 5xx·429 인 응답은 실패, 그 밖의 응답은 성공으로 기록
+        :param count_timeouts: False 면 응답 시간 초과를 실패로 세지 않음 (페이지 크기를 줄여 재시도하는 경우)
+        :return: (응답, 소요 시간 초 - 요청 한도 대기 제외)
+        """
+        breaker = self.sessions.breaker(base_url)
+        try:
+            breaker.before_request()
+        except CircuitOpenError:
+            self._count("circuit_open")
+            raise
+        wait = self.sessions.limiter(base_url).acquire()
+        if wait:
+            self._count("rate_limit_wait_sec", wait)
+        started = time.perf_counter()
+        try:
+            response = session.post(api_url, headers=JSON_HEADERS, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            self._count("request_errors")
+            if count_timeouts or not _is_timeout(e):
+                self._record_failure(breaker)
+            else:
+                breaker.release()
+            raise
+        # HTTPAdapter(Retry) 가 내부에서 다시 보낸 횟수
+        retries = getattr(getattr(response.raw, "retries", None), "history", None)
+        if retries:
+            self._count("http_retries", len(retries))
+        if response.status_code >= 500 or response.status_code == 429:
+            self._record_failure(breaker)
+        else:
+            breaker.record_success()
+        return response, time.perf_counter() - started
+
+    def _record_failure(self, breaker):
+        if breaker.record_failure():
+            self._log(f"[{breaker.name}] BXM 서버 연속 실패 {breaker.failures}회. "
+                      f"{breaker.reset_timeout_sec}초 동안 요청을 보내지 않습니다.", "ERROR")
+
+    def _authenticate(self, base_url, user_id, password):
+        """
+        로그인 요청 (독립적인 세션을 생성하여 로그인 후 쿠키 반환)
+        :return: (응답 JSON, 쿠키)
+        """
+        api_url = f"{base_url.rstrip('/')}/bxmAdmin/json/login"
+        payload = build_login_payload(user_id, password)
+        # 로그인은 풀(Pool)이 아닌 새 세션 사용
+        with requests.Session() as session:
+            response, _elapsed = self._send(session, base_url, api_url, json=payload)
+            response.raise_for_status()
+            return response.json(), session.cookies
 
     def login(self, base_url, user_id, password):
         """
         로그인 시도. (api_service.py의 login 메서드 패턴 적용)
-        - 독립적인 세션을 생성하여 로그인 후 쿠키 반환
+        - 레지스트리에 만료되지 않은 같은 (서버, 사용자)의 로그인 쿠키가 있으면 서버 호출 없이 재사용
         """
-        api_url = f"{base_url.rstrip('/')}/bxmAdmin/json/login"
-        
-        headers = {
-            "Content-Type": "application/json; charset=UTF-8", 
-            "Accept": "application/json"
-        }
-        
-        payload = {
-            "header": {
-                "application": "bxmAdmin", "langCd": "ko",
-                "service": "AuthorityService", "operation": "loginOperation"
-            },
-            "LoginOMM": {
-                "userId": user_id, "userPwd": password, "lang": "ko", "domainId": "OKC"
-            }
-        }
+        entry = self.sessions.get_login(base_url, user_id, password)
+        if entry is not None:
+            self._log(f"[{base_url}] 기존 로그인 세션 재사용.", "SUCCESS")
+            return True, entry.cookies, "Login Reused"
 
         try:
-            # 로그인은 풀(Pool)이 아닌 새 세션 사용
-            session = requests.Session()
-            
             # 실제 요청 시도
-            response = session.post(api_url, headers=headers, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-            res_json = response.json()
-            
-            # 성공 여부 판단 로직 (참고 코드 방식)
-            is_success = False
-            if "ResponseCode" in res_json and res_json["ResponseCode"].get("code") == 100:
-                is_success = True
-            elif "header" in res_json and res_json["header"].get("returnCode") == "0":
-                is_success = True
-
-            if is_success:
+            res_json, cookies = self._authenticate(base_url, user_id, password)
+
+            if is_login_success(res_json):
                 self._log(f"[{base_url}] 로그인 성공.", "SUCCESS")
-                # 세션 객체가 아닌 '쿠키'를 반환
-                return True, session.cookies, "Login Success"
+                # 세션 객체가 아닌 '쿠키'를 반환 (레지스트리에 저장하여 다음 스캔에서 재사용)
+                entry = self.sessions.store_login(base_url, user_id, password, cookies)
+                return True, entry.cookies, "Login Success"
             else:
                 msg = res_json.get("header", {}).get("returnMessage", "Unknown Error")
+                if not self.mock_fallback:
+                    self._log(f"[{base_url}] 로그인 실패 (서버 응답): {msg}", "ERROR")
+                    return False, None, msg
                 self._log(f"[{base_url}] 로그인 실패 (서버 응답): {msg}", "WARN")
                 # 실패 시 Mock 전환
                 self.is_mock_mode = True
                 return True, None, "Mock Login Success"
 
         except Exception as e:
+            if not self.mock_fallback:
+                self._log(f"[{base_url}] API 연결 실패 ({str(e)}).", "ERROR")
+                return False, None, str(e)
             self._log(f"[{base_url}] API 연결 실패 ({str(e)}). 가상(Mock) 모드로 전환합니다.", "WARN")
             self.is_mock_mode = True
             return True, None, "Mock Login Success"
 
-    def get_today_error_logs(self, base_url, cookies, start_dt=None, end_dt=None, page_num=1):
+    def get_today_error_logs(self, base_url, cookies, start_dt=None, end_dt=None, page_num=1, page_size=None):
         """
         에러 로그 조회.
         참고 코드의 get_system_logs 패턴 적용
+        :param page_size: 요청 건수 (pageCount). 지정한 경우 응답 시간 초과는
+                          PageTimeoutError 로 알려 호출 측이 더 작은 페이지로 나누어 재시도하도록 함
+        :return: ErrorLogPage (Mock 모드에서는 list)
+        :raises CircuitOpenError: 서버 연속 실패로 요청을 차단 중인 경우
+        :raises requests.RequestException: 그 밖의 조회 실패 (가상 로그로 대체하지 않음)
         """
 
-        if not start_dt:
-            start_dt = datetime.now().strftime("%Y-%m-%d 00:00")
-        if not end_dt:
-            end_dt = datetime.now().strftime("%Y-%m-%d 23:59")
+        start_dt, end_dt = default_search_range(start_dt, end_dt)
 
         if self.is_mock_mode:
             print(f"[BXM_DEBUG] Mock 모드 활성화 - 실제 API 호출 없이 가상 로그 반환 (page {page_num})")
             return self._generate_mock_logs(page_num)
 
         api_url = f"{base_url.rstrip('/')}/bxmAdmin/json"
-        
-        # [핵심 변경] 복잡한 헤더 제거하고 기본 헤더만 사용 (참고 코드 방식)
-        headers = {
-            "Content-Type": "application/json; charset=UTF-8", 
-            "Accept": "application/json"
-        }
+        size = page_size or self.page_size
+        payload = build_error_log_payload(start_dt, end_dt, page_num, size)
 
-        payload = {
-            "header": {
-                "application": "bxmAdmin", "service": "OnlineLogService",
-                "operation": "getErrorLogList", "langCd": "ko"
-            },
-            "OnlineLogSearchConditionOMM": {
-                "brdyDt": "",
-                "bxmAppId": "",
-                "ci": "",
-                "custNm": "",
-                "errCd": "",
-                "guid": "",
-                "logOccurDttmEnd": end_dt,
-                "logOccurDttmStart": start_dt,
-                "nodeName": "",
-                "opNm": "",
-                "pageCount": "100",
-                "pageNum": str(page_num),
-                "sendUserIp": "",
-                "svcNm": ""
-            }
-        }
+        # 같은 조회 조건의 응답이 캐시에 있으면 서버 호출 생략
+        cache = self.response_cache
+        if cache is not None:
+            entry = cache.get(base_url, start_dt, end_dt, page_num, size)
+            if entry is not None:
+                body, elapsed = entry
+                return ErrorLogPage(self._extract_logs(json_codec.loads(body)), elapsed, len(body), cached=True)
 
         try:
             # [핵심 변경] 세션 풀 사용 + 명시적 쿠키 전달
             session = self._get_session(base_url)
+            login = self.sessions.find(base_url, cookies)
+            generation = login.generation if login is not None else None
 
-            response = session.post(api_url, headers=headers, cookies=cookies, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-            res_json = response.json()
-
-            top_keys = list(res_json.keys()) if isinstance(res_json, dict) else []
-            has_omm = "ErrorLogListOMM" in res_json
-            has_list = has_omm and "errorLogList" in res_json.get("ErrorLogListOMM")
-
-            if has_omm and has_list:
-                raw_logs = res_json["ErrorLogListOMM"]["errorLogList"]
-                parsed = self._parse_logs(raw_logs)
-                self._log(f"에러 로그 조회 응답: 최상위 키={top_keys}, 건수={len(parsed)}", "INFO")
-                return parsed
-            else:
-                self._log(f"응답 내 로그 없음 (최상위 키: {top_keys})", "WARN")
-                return []
+            result = self._post_error_logs(session, base_url, api_url, cookies, payload, page_size is None,
+                                           check_auth=login is not None)
+            if result is None:
+                # 세션 만료: 재로그인 후 같은 요청 한 번 더 (쿠키 객체는 그대로이므로 이후 요청에도 적용)
+                self._relogin(login, generation)
+                result = self._post_error_logs(session, base_url, api_url, cookies, payload, page_size is None,
+                                               check_auth=False)
+            body, res_json, elapsed = result
+            if login is not None:
+                login.touch()
+            if cache is not None and isinstance(res_json, dict) and "ErrorLogListOMM" in res_json:
+                # 정상 조회 결과만 캐시 (오류 응답은 다음 실행에서 다시 조회)
+                cache.put(base_url, start_dt, end_dt, page_num, size, body, elapsed)
+            return ErrorLogPage(self._extract_logs(res_json), elapsed, len(body))
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
+            if page_size is not None and _is_timeout(e):
+                self._count("page_timeouts")
+                raise PageTimeoutError(size) from e
             self._log(f"API 호출 중 오류 발생: {e}", "WARN")
-            self.is_mock_mode = True
-            return self._generate_mock_logs(page_num)
+            raise
+
+    def _post_error_logs(self, session, base_url, api_url, cookies, payload, count_timeouts, check_auth):
+        """
+        getErrorLogList 요청
+        :param check_auth: True 면 인증 실패 응답을 예외 대신 None 으로 반환
+        :return: (응답 본문 bytes, 응답 JSON, 소요 시간 초) 또는 None (인증 실패)
+        """
+        response, elapsed = self._send(session, base_url, api_url, count_timeouts, cookies=cookies, json=payload)
+        if check_auth and response.status_code in AUTH_FAILURE_STATUSES:
+            return None
+        response.raise_for_status()
+        body = response.content
+        # 본문(bytes)을 바로 디코딩 (orjson 사용 가능 시 고속 경로)
+        res_json = json_codec.loads(body)
+        if check_auth and is_auth_failure(res_json):
+            return None
+        return body, res_json, elapsed
+
+    def _relogin(self, login, generation):
+        """
+        세션 만료 시 재로그인 (여러 페이지 요청이 동시에 실패해도 한 번만 로그인)
+        :param generation: 실패한 요청을 보낼 때의 login.generation
+        """
+        with login.lock:
+            if login.generation != generation:
+                # 다른 요청이 이미 재로그인함
+                return
+            self._log(f"[{login.base_url}] 로그인 세션 만료. 재로그인합니다.", "WARN")
+            self._count("relogins")
+            res_json, cookies = self._authenticate(login.base_url, login.user_id, login.password)
+            if not is_login_success(res_json):
+                self.sessions.invalidate(login.base_url, login.user_id)
+                msg = res_json.get("header", {}).get("returnMessage", "Unknown Error")
+                raise requests.HTTPError(f"[{login.base_url}] 재로그인 실패: {msg}")
+            self.sessions.store_login(login.base_url, login.user_id, login.password, cookies)
+
+    def _extract_logs(self, res_json):
+        """getErrorLogList 응답에서 에러 로그 목록 추출 및 파싱"""
+        top_keys = list(res_json.keys()) if isinstance(res_json, dict) else []
+        has_omm = "ErrorLogListOMM" in res_json
+        has_list = has_omm and "errorLogList" in res_json.get("ErrorLogListOMM")
+
+        if has_omm and has_list:
+            raw_logs = res_json["ErrorLogListOMM"]["errorLogList"]
+            parsed = self._parse_logs(raw_logs)
+            self._log(f"에러 로그 조회 응답: 최상위 키={top_keys}, 건수={len(parsed)}", "INFO")
+            return parsed
+        else:
+            self._log(f"응답 내 로그 없음 (최상위 키: {top_keys})", "WARN")
+            return []
 
     def _parse_logs(self, raw_list):
         """
         [신규] 참고 코드(api_service.py)의 _parse_logs 로직 이식
         다양한 필드에서 에러 메시지를 추출하여 정확도 향상
+        msg 에는 가변값을 치환한 템플릿을 넣고, 원문이 다를 때만 raw_msg 로 함께 전달
+        nodeName 이 있는 항목은 node 로 전달 (집계기의 노드 목록)
+        항목에서는 필요한 7개 필드만 한 번에 꺼내고, 템플릿은 페이지 단위로 일괄 적용한다.
         """
+        try:
+            values = list(map(_LOG_GETTER, raw_list))
+        except KeyError:
+            # 일부 필드가 없는 항목이 있으면 기본값으로 채움
+            values = [tuple(map(item.get, _LOG_FIELDS, _LOG_DEFAULTS)) for item in raw_list]
+
+        # 에러 코드 결합 (정상 코드가 아니면 "[코드] 메시지", 메시지가 없으면 "Error Code: [코드]")
+        messages = [
+            (f"[{msg_cd}] {error_message}" if error_message else f"Error Code: [{msg_cd}]")
+            if msg_cd and msg_cd not in _SUCCESS_CODES else error_message
+            for _time, _chnl, _app, _svc, _op, msg_cd, error_message in values
+        ]
+        templates = default_templater.template_many(messages)
+        # nodeName 은 없는 응답도 있으므로 필수 필드 조회(_LOG_GETTER)와 분리
+        nodes = [item.get("nodeName") for item in raw_list]
+
         parsed_data = []
-        for item in raw_list:
-            # 에러 메시지 추출 우선순위 적용
-            error_message = item.get("msgType", "Error")         # 기존 폴백
-            
-            # 에러 코드 결합
-            msg_cd = item.get("errCd", "FAIL")
-            if msg_cd and msg_cd not in ["0", "00", "0000", "S", "SUCCESS"]:
-                if error_message:
-                    error_message = f"[{msg_cd}] {error_message}"
-                else:
-                    error_message = f"Error Code: [{msg_cd}]"
-
-            parsed_data.append({
-                "time": item.get("logOccurDttm", "Unknown"),
-                "chnl": item.get("chlTypeCd", "Unknown"),
-                "app": item.get("application", "Unknown"),
-                "svc": item.get("service", "Unknown"),
-                "op": item.get("operation", "Unknown"),
-                "code": msg_cd,
-                "msg": error_message
-            })
+        for (log_time, chnl, app, svc, op, msg_cd, _msg), error_message, template, node in zip(
+                values, messages, templates, nodes):
+            parsed = {"time": log_time, "chnl": chnl, "app": app, "svc": svc, "op": op,
+                      "code": msg_cd, "msg": template}
+            if template != error_message:
+                parsed["raw_msg"] = error_message
+            if node:
+                parsed["node"] = node
+            parsed_data.append(parsed)
         return parsed_data
 
     def _generate_mock_logs(self, page_num):
         """테스트를 위한 가상 에러 로그 생성기"""
         time.sleep(0.5) 
+        return self._build_mock_logs(page_num)
+
+    def _build_mock_logs(self, page_num):
+        """가상 에러 로그 목록 (지연 없이 생성, 비동기 클라이언트와 공용)"""
         if page_num > 3: return []
 
         self._log(f"[Mock] 가상 에러 로그 생성 중... (Page {page_num})", "DEBUG")
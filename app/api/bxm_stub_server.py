@@ -0,0 +1,268 @@
+# app/api/bxm_stub_server.py
+"""
+로컬 테스트용 BXM 관리 API 스텁 서버 (표준 라이브러리 http.server 기반).
+bxmAdmin/json/login (AuthorityService.loginOperation) 과
+bxmAdmin/json (OnlineLogService.getErrorLogList) 두 엔드포인트를 모사한다.
+
+- 로그인 성공 시 JSESSIONID 쿠키 발급, 에러 로그 조회는 유효한 쿠키가 있어야 응답
+- logOccurDttmStart ~ logOccurDttmEnd (종료 시각 포함) 조건과 pageNum / pageCount 페이지 처리
+- HTTP/1.1 keep-alive 지원 (클라이언트 커넥션 풀 재사용 여부는 connection_count 로 확인)
+- 조회 대상은 행 리스트(rows) 또는 MockLogGenerator(source) - 생성기를 쓰면 수백만 건 규모도 메모리 부담 없이 제공
+  둘 다 지정하지 않으면 오늘 날짜의 고정 seed 생성기(SAMPLE_SEED, 하루 SAMPLE_ROWS 건)를 사용
+
+실행: python -m app.api.bxm_stub_server --port 8099 --rows 1000000 --days 1 --groups 500 --seed 7
+"""
+
+import argparse
+import json
+import secrets
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.api.mock_log_generator import MockLogGenerator
+
+SESSION_COOKIE = "JSESSIONID"
+# rows / source 를 지정하지 않았을 때의 기본 표본 데이터
+SAMPLE_ROWS = 5000
+SAMPLE_SEED = 1
+
+
+class RowListSource:
+    """행 리스트 조회 대상 (발생 시각 순 정렬 후 이진 탐색으로 구간 조회)"""
+
+    def __init__(self, rows):
+        self.rows = sorted(rows or [], key=lambda row: row.get("logOccurDttm", ""))
+        self._keys = [row.get("logOccurDttm", "") for row in self.rows]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _bounds(self, start_dt, end_dt):
+        # 종료 시각은 해당 자릿수까지 포함: key[:len(end_dt)] <= end_dt  <=>  key <= end_dt + (최대 문자)
+        return bisect_left(self._keys, start_dt), bisect_right(self._keys, end_dt + "\U0010ffff")
+
+    def count(self, start_dt, end_dt):
+        lo, hi = self._bounds(start_dt, end_dt)
+        return max(0, hi - lo)
+
+    def query(self, start_dt, end_dt, page_num, page_count):
+        lo, hi = self._bounds(start_dt, end_dt)
+        offset = lo + (max(page_num, 1) - 1) * page_count
+        return self.rows[offset:min(hi, offset + page_count)]
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # 여러 채널/페이지 동시 연결 시 기본 백로그(5)를 넘으면 연결 지연이 생김
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 응답 시간 초과로 먼저 연결을 끊은 경우는 정상 상황으로 보고 출력하지 않음
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.stub.on_connect()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, body, status=200, cookie=None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        if cookie:
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={cookie}; Path=/")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _session_token(self):
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE:
+                return value
+        return None
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json({"header": {"returnCode": "9", "returnMessage": "Invalid JSON"}}, 400)
+            return
+
+        status = stub.next_status()
+        if status is not None:
+            self._send_json({"header": {"returnCode": "9", "returnMessage": "Injected failure"}}, status)
+            return
+        if stub.latency > 0:
+            time.sleep(stub.latency)
+
+        path = self.path.rstrip("/")
+        if path == "/bxmAdmin/json/login":
+            self._handle_login(stub, payload)
+        elif path == "/bxmAdmin/json":
+            self._handle_service(stub, payload)
+        else:
+            self._send_json({"header": {"returnCode": "9", "returnMessage": "Not Found"}}, 404)
+
+    def _handle_login(self, stub, payload):
+        login = payload.get("LoginOMM", {})
+        token = stub.login(login.get("userId"), login.get("userPwd"))
+        if token is None:
+            self._send_json({"header": {"returnCode": "1", "returnMessage": "아이디 또는 비밀번호 오류"}})
+        else:
+            self._send_json({"header": {"returnCode": "0", "returnMessage": "OK"}}, cookie=token)
+
+    def _handle_service(self, stub, payload):
+        header = payload.get("header", {})
+        if (header.get("service"), header.get("operation")) != ("OnlineLogService", "getErrorLogList"):
+            self._send_json({"header": {"returnCode": "9", "returnMessage": "Unsupported operation"}})
+            return
+        if not stub.is_valid_session(self._session_token()):
+            self._send_json({"header": {"returnCode": "9", "returnMessage": "Session expired"}}, 401)
+            return
+        cond = payload.get("OnlineLogSearchConditionOMM", {})
+        rows = stub.query(cond.get("logOccurDttmStart", ""), cond.get("logOccurDttmEnd", ""),
+                          int(cond.get("pageNum") or 1), int(cond.get("pageCount") or 100))
+        self._send_json({"header": {"returnCode": "0"}, "ErrorLogListOMM": {"errorLogList": rows}})
+
+
+class BxmStubServer:
+    """
+    사용 예)
+        with BxmStubServer(source=MockLogGenerator("2025-01-01", rows_per_day=5000, seed=1)) as server:
+            client.login(server.url, "admin", "admin")
+    """
+
+    def __init__(self, rows=None, user_id=None, password=None, latency=0.0, host="127.0.0.1", port=0, source=None):
+        """
+        :param rows: 조회 대상 에러 로그 행 (BXM 원본 형식)
+        :param source: rows 대신 사용할 조회 대상 (query(start, end, page_num, page_count) 제공, 예: MockLogGenerator)
+                       rows 도 없으면 MockLogGenerator(rows_per_day=SAMPLE_ROWS, seed=SAMPLE_SEED)
+        :param user_id, password: 지정 시 해당 계정만 로그인 허용 (None 이면 모두 허용)
+        :param latency: 요청당 응답 지연 (초, 왕복 지연 모사)
+        :param port: 0 이면 빈 포트 자동 할당
+        """
+        if source is None:
+            source = RowListSource(rows) if rows is not None else MockLogGenerator(rows_per_day=SAMPLE_ROWS,
+                                                                                   seed=SAMPLE_SEED)
+        self.source = source
+        self.user_id = user_id
+        self.password = password
+        self.latency = latency
+        self.request_count = 0
+        self.login_count = 0
+        self.connection_count = 0
+        self._sessions = set()
+        self._failures = []
+        self._lock = threading.Lock()
+        self._httpd = _StubHTTPServer((host, port), _StubHandler)
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="bxm-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 실행 (명령행 실행용, Ctrl+C 로 종료)"""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def fail_next(self, *statuses):
+        """다음 요청들을 지정한 HTTP 상태 코드로 실패시킴 (재시도 동작 확인용)"""
+        with self._lock:
+            self._failures.extend(statuses)
+
+    def on_connect(self):
+        with self._lock:
+            self.connection_count += 1
+
+    def next_status(self):
+        with self._lock:
+            self.request_count += 1
+            return self._failures.pop(0) if self._failures else None
+
+    def login(self, user_id, password):
+        if self.user_id is not None and (user_id, password) != (self.user_id, self.password):
+            return None
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.login_count += 1
+            self._sessions.add(token)
+        return token
+
+    def expire_sessions(self):
+        """발급한 로그인 세션을 모두 만료시킴 (세션 만료 후 재로그인 동작 확인용)"""
+        with self._lock:
+            self._sessions.clear()
+
+    def is_valid_session(self, token):
+        with self._lock:
+            return token in self._sessions
+
+    def query(self, start_dt, end_dt, page_num, page_count):
+        """발생 시각 [start_dt, end_dt] 범위의 page_num 페이지 (종료 시각은 해당 자릿수까지 포함)"""
+        return self.source.query(start_dt, end_dt, page_num, page_count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BXM bxmAdmin/json 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--rows", type=int, default=SAMPLE_ROWS, help="하루 에러 로그 건수")
+    parser.add_argument("--start-date", default=None, help="첫째 날 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument("--days", type=int, default=1, help="생성 일수")
+    parser.add_argument("--groups", type=int, default=200, help="에러 그룹 수 (카디널리티)")
+    parser.add_argument("--zipf", type=float, default=1.1, help="그룹 빈도 Zipf 지수")
+    parser.add_argument("--incidents", type=int, default=3, help="장애(급증) 구간 수")
+    parser.add_argument("--nodes", type=int, default=4, help="노드 수")
+    parser.add_argument("--seed", type=int, default=SAMPLE_SEED)
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 응답 지연 (초)")
+    args = parser.parse_args()
+
+    generator = MockLogGenerator(args.start_date, days=args.days, rows_per_day=args.rows, groups=args.groups,
+                                 zipf_s=args.zipf, incidents=args.incidents, nodes=args.nodes, seed=args.seed)
+    server = BxmStubServer(source=generator, latency=args.latency, host=args.host, port=args.port)
+    print(f"BXM 스텁 서버 실행 중: {server.url} "
+          f"({generator.origin:%Y-%m-%d}부터 {generator.days}일, 에러 로그 {len(generator)}건, 종료: Ctrl+C)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+# app/api/json_codec.py
+"""
+BXM 응답 JSON 디코더.
+orjson 이 설치되어 있으면 사용하고 (표준 json 대비 큰 응답에서 2~3배 빠름), 없으면 표준 json 으로 동작한다.
+응답 본문(bytes)을 그대로 받아 문자열 변환 없이 디코딩한다.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+# 사용 중인 디코더 이름 (로그/벤치마크 표시용)
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(body):
+    """
+    :param body: 응답 본문 (bytes 또는 str)
+    :raises ValueError: JSON 형식이 아닌 경우 (orjson.JSONDecodeError 도 ValueError 하위 클래스)
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
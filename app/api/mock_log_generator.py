@@ -0,0 +1,285 @@
+# app/api/mock_log_generator.py
+"""
+부하 테스트용 BXM 에러 로그 생성기 (시드 고정, 결정적).
+같은 설정과 seed 면 언제 어디서 생성해도 같은 행이 나온다.
+
+- 하루 rows_per_day 건을 분 단위로 배분 (업무 시간대에 몰리는 일중 분포 + 분별 변동)
+- 그룹(application / service / operation / 에러 코드 / 채널 조합) groups 개, 빈도는 Zipf(zipf_s) 분포
+- 장애(incident): 특정 그룹이 incident_minutes 동안 incident_multiplier 배로 급증하는 구간
+- 노드 nodes 개 (nodeName), 메시지에는 계좌번호/금액/GUID/IP 등 가변 토큰 포함
+- 분 단위로 독립 생성하므로 전체를 메모리에 올리지 않고 임의 구간/페이지를 바로 만들 수 있다
+  (수백만 건 규모를 BxmStubServer 로 그대로 제공 가능)
+
+사용 예)
+    generator = MockLogGenerator("2025-01-01", rows_per_day=1_000_000, groups=500, seed=7)
+    rows = generator.query("2025-01-01 09:00:00", "2025-01-01 09:59:59", page_num=1, page_count=100)
+"""
+
+import math
+import random
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+
+from app.core.chnl_constants import CHNL_LABELS
+
+_APPS = ["Bxm-Core", "Bxm-FEP", "Smart-Banking", "Open-API", "Card-Gateway", "Loan-Engine"]
+_SERVICES = ["TransferSvc", "AccountSvc", "CustomerSvc", "AuthSvc", "CardSvc", "LoanSvc",
+             "DepositSvc", "FxSvc", "NoticeSvc", "BatchSvc"]
+_OPERATIONS = ["checkBalance", "transfer", "login", "validateUser", "inquiry", "register",
+               "cancel", "approve", "sendNotice", "settle"]
+# (에러 코드, 메시지 생성 함수(token, r)). token 은 가변 토큰 값(정수), r 은 [0, 1) 난수
+# 생성 함수가 None 인 에러는 그룹마다 고정 문구 (_FIELDS 중 하나)
+_ERRORS = [
+    ("DB-001", lambda t, r: f"DB Timeout after {1000 + int(r * 29000)}ms (sql_id={t:016x})"),
+    ("NET-503", lambda t, r: f"Gateway Timeout from 10.{t % 256}.{t // 256 % 256}.{t % 97}"),
+    ("AUTH-401", lambda t, r: f"Invalid token for user {t}"),
+    ("BIZ-1001", lambda t, r: f"잔액 부족 (계좌 110-{t % 1000:03d}-{t:06d}, 요청금액: {int(r * 10000) * 1000:,}원)"),
+    ("SYS-500", lambda t, r: f"NullPointerException at line {t % 2000}"),
+    ("EXT-408", lambda t, r: f"외부기관 응답 지연 {1000 + int(r * 29000)}ms "
+                             f"(거래번호 {t:08x}-{int(r * 65536):04x}-4000-8000-{t * 7919:012x})"),
+    ("VAL-400", None),
+    ("MQ-002", lambda t, r: f"메시지 큐 적재 실패 (queue depth {t})"),
+]
+_FIELDS = ["acctNo", "custId", "trxAmt", "bankCd", "pinNo", "birthDt"]
+
+
+def _minute_weight(minute_of_day):
+    """일중 분포 가중치 (새벽 낮고 오전/오후 업무 시간대에 높음)"""
+    hour = minute_of_day / 60.0
+    return 0.15 + math.exp(-((hour - 10.5) / 2.5) ** 2) + 0.8 * math.exp(-((hour - 15.0) / 2.0) ** 2)
+
+
+class MockLogGenerator:
+    """
+    BXM getErrorLogList 원본 형식(logOccurDttm, chlTypeCd, application, ...) 행 생성기.
+    query() 는 BxmStubServer 의 조회 조건(시작 시각 이상, 종료 시각은 해당 자릿수까지 포함)과 같은 의미로 동작한다.
+    반환하는 행(dict)은 내부 캐시와 공유되므로 수정하지 않는다.
+    """
+
+    def __init__(self, start_date=None, days=1, rows_per_day=100_000, groups=200, zipf_s=1.1,
+                 incidents=3, incident_minutes=15, incident_multiplier=20.0, nodes=4,
+                 variable_tokens=True, token_cardinality=10_000, seed=0):
+        """
+        :param start_date: 첫째 날 (date / datetime / "YYYY-MM-DD", None 이면 오늘)
+        :param days: 생성 일수
+        :param rows_per_day: 하루 행 수 (정확히 이 건수가 되도록 분 단위로 배분)
+        :param groups: 서로 다른 에러 그룹 수 (카디널리티)
+        :param zipf_s: 그룹 빈도 Zipf 지수 (클수록 상위 그룹에 집중, 0 이면 균등)
+        :param incidents: 전체 기간의 장애 구간 수
+        :param incident_minutes: 장애 구간 길이 (분)
+        :param incident_multiplier: 장애 구간의 발생량 배수 (증가분은 장애 그룹 하나에 집중)
+        :param nodes: 노드(nodeName) 수
+        :param variable_tokens: False 면 메시지에 가변 토큰 없이 고정 문구만 사용
+        :param token_cardinality: 사용자/계좌 등 가변 토큰 값의 종류 수
+        """
+        if start_date is None:
+            start_date = date.today()
+        elif isinstance(start_date, str):
+            start_date = datetime.strptime(start_date[:10], "%Y-%m-%d").date()
+        elif isinstance(start_date, datetime):
+            start_date = start_date.date()
+        self.origin = datetime.combine(start_date, datetime.min.time())
+        self.days = max(1, int(days))
+        self.rows_per_day = int(rows_per_day)
+        self._node_names = [f"bxm-ap{node + 1:02d}" for node in range(max(1, int(nodes)))]
+        self.variable_tokens = variable_tokens
+        self.token_cardinality = max(1, int(token_cardinality))
+        self.seed = seed
+        self.minutes = self.days * 1440
+
+        rng = random.Random(seed)
+        self.groups = self._build_groups(rng, max(1, int(groups)))
+        self._zipf_cum = list(accumulate(1.0 / (rank + 1) ** zipf_s for rank in range(len(self.groups))))
+        self.incidents = self._build_incidents(rng, incidents, incident_minutes, incident_multiplier)
+
+        # 분별 장애 정보 {분: (장애 그룹 인덱스, 장애 그룹 비율)}
+        self._incident_at = {}
+        weights = [_minute_weight(minute % 1440) * rng.lognormvariate(0.0, 0.2) for minute in range(self.minutes)]
+        for start, length, group, multiplier in self.incidents:
+            for minute in range(start, min(start + length, self.minutes)):
+                weights[minute] *= multiplier
+                self._incident_at[minute] = (group, 1.0 - 1.0 / multiplier)
+        self._counts = []
+        for day in range(self.days):
+            self._counts.extend(self._allocate(rng, weights[day * 1440:(day + 1) * 1440], self.rows_per_day))
+        self._offsets = [0] + list(accumulate(self._counts))   # 분 시작 위치 (누적 행 수)
+        self._minute_cache = OrderedDict()
+        self._cache_lock = threading.Lock()   # 스텁 서버의 여러 요청 스레드에서 공유
+
+    # ------------------------------------------------------------------ 구성
+
+    @staticmethod
+    def _build_groups(rng, count):
+        """
+        서로 다른 (채널, app, svc, op, 에러 코드) 조합 count 개 (앞쪽이 Zipf 상위)
+        :return: [(채널, app, svc, op, 에러 코드, 메시지 생성 함수 또는 None, 고정 메시지)]
+        """
+        channels = list(CHNL_LABELS.keys())
+        capacity = len(_APPS) * len(_SERVICES) * len(_OPERATIONS) * len(_ERRORS) * len(channels)
+        seen = set()
+        groups = []
+        while len(groups) < count:
+            app, svc, op = rng.choice(_APPS), rng.choice(_SERVICES), rng.choice(_OPERATIONS)
+            code, make_message = rng.choice(_ERRORS)
+            chnl = rng.choice(channels)
+            if len(seen) >= capacity:
+                # 기본 조합을 모두 쓰면 서비스 이름에 번호를 붙여 카디널리티 확보
+                svc = f"{svc}{len(groups) // capacity + 1}"
+            key = (app, svc, op, code, chnl)
+            if key in seen:
+                continue
+            seen.add(key)
+            # 가변 토큰을 쓰지 않을 때의 고정 메시지 (같은 그룹은 항상 같은 문구)
+            fixed = make_message(1, 0.5) if make_message else f"필수 입력값 누락: {rng.choice(_FIELDS)}"
+            groups.append((chnl, app, svc, op, code, make_message, fixed))
+        return groups
+
+    def _build_incidents(self, rng, count, length, multiplier):
+        """[(시작 분, 길이, 그룹 인덱스, 배수)] - 평소 빈도가 낮은 그룹이 갑자기 급증하는 형태"""
+        incidents = []
+        if multiplier <= 1 or length <= 0:
+            return incidents
+        for _ in range(max(0, int(count))):
+            start = rng.randrange(max(1, self.minutes - length))
+            group = rng.randrange(len(self.groups) // 2, len(self.groups)) if len(self.groups) > 1 else 0
+            incidents.append((start, int(length), group, float(multiplier)))
+        incidents.sort()
+        return incidents
+
+    @staticmethod
+    def _allocate(rng, weights, total):
+        """total 건을 가중치 비율로 분배 (합계가 정확히 total)"""
+        weight_sum = sum(weights) or 1.0
+        quotas = [weight * total / weight_sum for weight in weights]
+        counts = [int(quota) for quota in quotas]
+        remainder = total - sum(counts)
+        if remainder > 0:
+            fractions = [quota - count for quota, count in zip(quotas, counts)]
+            for minute in rng.choices(range(len(weights)), weights=fractions, k=remainder):
+                counts[minute] += 1
+        return counts
+
+    # ------------------------------------------------------------------ 생성
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def _minute_rows(self, minute):
+        """minute 번째 분의 행 (발생 시각 순). 최근 생성한 분은 캐시"""
+        with self._cache_lock:
+            rows = self._minute_cache.get(minute)
+            if rows is not None:
+                self._minute_cache.move_to_end(minute)
+                return rows
+        rows = self._generate_minute(minute)
+        with self._cache_lock:
+            self._minute_cache[minute] = rows
+            if len(self._minute_cache) > 64:
+                self._minute_cache.popitem(last=False)
+        return rows
+
+    def _generate_minute(self, minute):
+        count = self._counts[minute]
+        if count == 0:
+            return []
+        rng = random.Random(self.seed * 1_000_003 + minute)
+        prefix = (self.origin + timedelta(minutes=minute)).strftime("%Y-%m-%d %H:%M")
+        rand = rng.random
+        millis = sorted(int(rand() * 60000) for _ in range(count))
+        incident = self._incident_at.get(minute)
+        groups, cum, last = self.groups, self._zipf_cum, len(self.groups) - 1
+        total_weight = cum[-1]
+        cardinality = self.token_cardinality
+        variable_tokens = self.variable_tokens
+        node_names = self._node_names
+        nodes = len(node_names)
+
+        rows = []
+        for ms in millis:
+            if incident is not None and rand() < incident[1]:
+                group = groups[incident[0]]
+            else:
+                group = groups[min(bisect_left(cum, rand() * total_weight), last)]
+            chnl, app, svc, op, code, make_message, fixed = group
+            if variable_tokens and make_message is not None:
+                msg = make_message(int(rand() * cardinality), rand())
+            else:
+                msg = fixed
+            rows.append({
+                "logOccurDttm": f"{prefix}:{ms // 1000:02d}.{ms % 1000:03d}",
+                "chlTypeCd": chnl,
+                "application": app,
+                "service": svc,
+                "operation": op,
+                "errCd": code,
+                "msgType": msg,
+                "nodeName": node_names[int(rand() * nodes)],
+            })
+        return rows
+
+    # ------------------------------------------------------------------ 조회
+
+    def _minute_of(self, text):
+        """ "YYYY-MM-DD HH:MM[...]" 이 속한 분 인덱스 (기간 밖이면 범위 밖 값)"""
+        moment = datetime.strptime(text[:16], "%Y-%m-%d %H:%M")
+        return int((moment - self.origin).total_seconds() // 60)
+
+    def _range(self, start_dt, end_dt):
+        """
+        조회 조건에 해당하는 분 구간
+        :return: (첫 분, 마지막 분, 첫 분의 해당 행, 마지막 분의 해당 행) - 중간 분은 전체 포함
+        """
+        first = max(0, self._minute_of(start_dt))
+        last = min(self.minutes - 1, self._minute_of(end_dt))
+        if first > last:
+            return first, last, [], []
+        head = [row for row in self._minute_rows(first)
+                if start_dt <= row["logOccurDttm"] and row["logOccurDttm"][:len(end_dt)] <= end_dt]
+        if first == last:
+            return first, last, head, head
+        tail = [row for row in self._minute_rows(last) if row["logOccurDttm"][:len(end_dt)] <= end_dt]
+        return first, last, head, tail
+
+    def count(self, start_dt, end_dt):
+        """조회 조건에 해당하는 전체 행 수"""
+        first, last, head, tail = self._range(start_dt, end_dt)
+        if first > last:
+            return 0
+        if first == last:
+            return len(head)
+        return len(head) + (self._offsets[last] - self._offsets[first + 1]) + len(tail)
+
+    def query(self, start_dt, end_dt, page_num, page_count):
+        """발생 시각 [start_dt, end_dt] 범위의 page_num 페이지 (BxmStubServer.query 와 같은 의미)"""
+        first, last, head, tail = self._range(start_dt, end_dt)
+        if first > last:
+            return []
+        offset = (max(page_num, 1) - 1) * page_count
+        end = offset + page_count
+        if first == last:
+            return head[offset:end]
+
+        rows = head[offset:end]
+        # 중간 분: 누적 행 수로 시작 분을 바로 찾음 (head 이후 위치 기준)
+        position = max(0, offset - len(head))
+        base = self._offsets[first + 1]
+        minute = bisect_right(self._offsets, base + position) - 1
+        while len(rows) < page_count and minute < last:
+            skip = base + position - self._offsets[minute]
+            chunk = self._minute_rows(minute)[skip:skip + page_count - len(rows)]
+            rows.extend(chunk)
+            position += len(chunk)
+            minute += 1
+        if len(rows) < page_count:
+            skip = max(0, offset - len(head) - (self._offsets[last] - base))
+            rows.extend(tail[skip:skip + page_count - len(rows)])
+        return rows
+
+    def iter_rows(self, start_minute=0, end_minute=None):
+        """전체(또는 분 구간) 행을 시간 순으로 생성 (대량 데이터셋을 메모리에 올리지 않고 처리할 때)"""
+        end_minute = self.minutes if end_minute is None else min(end_minute, self.minutes)
+        for minute in range(start_minute, end_minute):
+            yield from self._generate_minute(minute)
@@ -0,0 +1,112 @@
+# app/api/response_cache.py
+"""
+BXM getErrorLogList 응답 디스크 캐시.
+같은 조회 조건(서버, 조회 기간, 페이지, 페이지 크기)의 응답 본문을 그대로 저장하여
+지난 기간을 다시 분석(재실행, 리포트 재생성, 프롬프트 수정 등)할 때 BXM 서버를 다시 호출하지 않는다.
+
+- 파일 이름: 조회 조건의 SHA-256 (조건이 같으면 같은 파일)
+- 파일 형식: 헤더(struct) + zlib 압축된 응답 본문
+    헤더 = MAGIC(4s) | 저장 시각(d, epoch 초) | 원래 응답 소요 시간(d, 초)
+    (소요 시간은 캐시 적중 시에도 페이지 크기 조정이 처음 조회와 같은 판단을 하도록 함께 보관)
+- 종료 시각이 현재보다 settle_sec 이상 지난 기간: 만료 없음 (이미 닫힌 기간의 로그는 바뀌지 않음)
+- 현재 시각을 포함하는(또는 막 끝난) 기간: ttl_sec 동안만 유효
+- 저장 위치 / 크기 한도 / 정리 방식은 DiskLruCache 참고
+"""
+
+import hashlib
+import struct
+import time
+import zlib
+from datetime import datetime, timedelta
+
+from app.utils.disk_cache import DiskLruCache, shared_instance
+
+MAGIC = b"BXR2"
+_HEADER = struct.Struct("<4sdd")
+
+
+def _parse_time(text):
+    """ "YYYY-MM-DD HH:MM[:SS...]" -> datetime (파싱 불가 시 None)"""
+    try:
+        return datetime.fromisoformat(text.strip()[:19])
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class ResponseCache(DiskLruCache):
+    """
+    사용 예)
+        cache = ResponseCache("data/response_cache", max_bytes=256 * 1024 * 1024)
+        entry = cache.get(base_url, start_dt, end_dt, page_num, page_size)
+        if entry is None:
+            body, elapsed = ... # 서버 호출
+            cache.put(base_url, start_dt, end_dt, page_num, page_size, body, elapsed)
+    여러 워커 스레드에서 동시에 사용할 수 있다.
+    """
+    SUFFIX = ".resp"
+
+    def __init__(self, cache_dir, max_bytes=256 * 1024 * 1024, ttl_sec=60, settle_sec=300):
+        """
+        :param max_bytes: 캐시 디렉터리 전체 크기 상한 (압축 후 기준)
+        :param ttl_sec: 현재 시각을 포함하는 기간의 응답 유효 시간 (초, 0 이하면 저장 안 함)
+        :param settle_sec: 종료 시각 후 이 시간이 지나야 닫힌 기간으로 보고 만료 없이 보관 (늦게 적재되는 로그 대비)
+        """
+        super().__init__(cache_dir, max_bytes)
+        self.ttl_sec = ttl_sec
+        self.settle_sec = settle_sec
+
+    @staticmethod
+    def make_key(base_url, start_dt, end_dt, page_num, page_size):
+        raw = "\x1f".join(str(part) for part in (base_url.rstrip('/'), start_dt, end_dt, page_num, page_size))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def max_age(self, end_dt, now=None):
+        """
+        조회 기간의 응답 유효 시간 (초). 닫힌 기간이면 None(만료 없음)
+        종료 시각을 해석할 수 없으면 현재를 포함하는 기간으로 취급
+        """
+        end = _parse_time(end_dt)
+        now = now or datetime.now()
+        if end is not None and end + timedelta(seconds=self.settle_sec) <= now:
+            return None
+        return self.ttl_sec
+
+    def get(self, base_url, start_dt, end_dt, page_num, page_size):
+        """:return: (응답 본문 bytes, 원래 응답 소요 시간). 없거나 만료/손상되었으면 None"""
+        path = self._path(self.make_key(base_url, start_dt, end_dt, page_num, page_size))
+        try:
+            data = self._read(path)
+            if data is None:
+                self._record_miss()
+                return None
+            magic, stored_at, elapsed = _HEADER.unpack_from(data)
+            if magic != MAGIC:
+                raise ValueError("bad magic")
+            max_age = self.max_age(end_dt)
+            if max_age is not None and time.time() - stored_at > max_age:
+                self._record_miss()
+                return None
+            body = zlib.decompress(data[_HEADER.size:])
+        except (OSError, ValueError, struct.error, zlib.error):
+            # 손상된 파일은 지우고 다시 조회
+            self._record_miss(path)
+            return None
+        self._record_hit(path)
+        return body, elapsed
+
+    def put(self, base_url, start_dt, end_dt, page_num, page_size, body, elapsed=0.0):
+        """
+        응답 본문 저장 (현재를 포함하는 기간인데 ttl_sec 이 0 이하면 저장하지 않음)
+        :param elapsed: 서버 응답 소요 시간 (초)
+        :return: 저장 여부
+        """
+        max_age = self.max_age(end_dt)
+        if max_age is not None and max_age <= 0:
+            return False
+        path = self._path(self.make_key(base_url, start_dt, end_dt, page_num, page_size))
+        return self._write(path, _HEADER.pack(MAGIC, time.time(), elapsed) + zlib.compress(body, 1))
+
+
+def shared_cache(cache_dir, **options):
+    """디렉터리별 공유 ResponseCache (옵션은 처음 생성할 때만 적용)"""
+    return shared_instance(ResponseCache, cache_dir, **options)
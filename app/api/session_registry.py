@@ -0,0 +1,189 @@
+# app/api/session_registry.py
+"""
+BXM 로그인 세션 / 커넥션 풀 레지스트리.
+스캔(MonitorWorker)마다 클라이언트를 새로 만들어도 서버별 커넥션 풀과 (서버, 사용자)별 로그인 쿠키는
+프로세스 전체에서 공유하여, 다음 스캔이나 같은 서버의 다른 채널이 로그인/연결 수립 없이 바로 조회하도록 한다.
+
+- 커넥션 풀: 서버(base_url)별 requests.Session 하나 (쿠키는 세션에 저장하지 않고 요청마다 전달)
+- 로그인 쿠키: (base_url, user_id) 별 LoginSession
+    마지막 사용 후 idle_timeout_sec 이 지났거나 쿠키 자체의 만료 시각이 지나면 만료로 보고 다시 로그인
+    조회 중 인증 실패(세션 만료) 응답을 받으면 같은 쿠키 객체를 새 로그인 쿠키로 갱신 (호출 측이 들고 있는 쿠키도 그대로 유효)
+- 요청 제어: 서버별 TokenBucket(초당 요청 수 한도) / CircuitBreaker (여러 채널이 같은 서버를 조회해도 한도를 함께 적용)
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.api.throttle import CircuitBreaker, TokenBucket
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+class LoginSession:
+    """(base_url, user_id) 로그인 상태"""
+
+    def __init__(self, base_url, user_id, password, cookies):
+        self.base_url = base_url
+        self.user_id = user_id
+        self.password = password
+        self.cookies = cookies          # 재로그인 시 내용만 교체 (객체는 유지)
+        self.generation = 0             # 재로그인 횟수 (동시에 인증 실패한 요청들이 한 번만 재로그인하도록 비교)
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()    # 재로그인 직렬화
+
+    def is_expired(self, idle_timeout_sec):
+        if idle_timeout_sec and time.monotonic() - self.last_used > idle_timeout_sec:
+            return True
+        now = time.time()
+        return any(cookie.is_expired(now) for cookie in self.cookies)
+
+    def touch(self):
+        self.last_used = time.monotonic()
+
+
+class BxmSessionRegistry:
+    """
+    사용 예)
+        registry = shared_registry()
+        client = BxmApiClient(session_registry=registry)   # 로그인 쿠키가 유효하면 login() 은 서버 호출 없이 반환
+    """
+
+    def __init__(self, idle_timeout_sec=1500, pool_connections=10, pool_maxsize=20, retries=2, backoff_factor=0.3,
+                 rate_limit_rps=0, rate_limit_burst=1, breaker_threshold=5, breaker_reset_sec=30):
+        """
+        :param idle_timeout_sec: 마지막 사용 후 로그인 쿠키를 재사용할 최대 시간 (초, 서버 세션 타임아웃보다 짧게. 0 이면 제한 없음)
+        :param pool_connections, pool_maxsize: HTTPAdapter 커넥션 풀 설정
+        :param retries, backoff_factor: 연결 오류 / 5xx / 429 응답 재시도 설정
+        :param rate_limit_rps, rate_limit_burst: 서버별 초당 요청 수 한도와 연속 전송 허용 수 (rps 0 이면 제한 없음)
+        :param breaker_threshold, breaker_reset_sec: 서버별 서킷 브레이커 연속 실패 기준 / 차단 시간 (초)
+        """
+        self.idle_timeout_sec = idle_timeout_sec
+        self.rate_limit_rps = rate_limit_rps
+        self.rate_limit_burst = rate_limit_burst
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_sec = breaker_reset_sec
+        # 재시도 전략 설정 (api_service.py 참조)
+        retry_strategy = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"]
+        )
+        self.adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self._sessions = {}   # {base_url: Session}
+        self._logins = {}     # {(base_url, user_id): LoginSession}
+        self._limiters = {}   # {base_url: TokenBucket}
+        self._breakers = {}   # {base_url: CircuitBreaker}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _url_key(base_url):
+        return base_url.rstrip('/')
+
+    def session(self, base_url):
+        """서버별 공유 세션 (커넥션 재사용용, 없으면 생성)"""
+        key = self._url_key(base_url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                session.mount("http://", self.adapter)
+                session.mount("https://", self.adapter)
+                self._sessions[key] = session
+            return session
+
+    def limiter(self, base_url):
+        """서버별 요청 수 한도"""
+        key = self._url_key(base_url)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = TokenBucket(self.rate_limit_rps, self.rate_limit_burst)
+            return limiter
+
+    def breaker(self, base_url):
+        """서버별 서킷 브레이커"""
+        key = self._url_key(base_url)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(key, self.breaker_threshold, self.breaker_reset_sec)
+            return breaker
+
+    def get_login(self, base_url, user_id, password):
+        """
+        재사용 가능한 로그인 세션 (없거나 만료되었거나 비밀번호가 바뀌었으면 None)
+        """
+        key = (self._url_key(base_url), user_id)
+        with self._lock:
+            entry = self._logins.get(key)
+            if entry is None or entry.password != password or entry.is_expired(self.idle_timeout_sec):
+                # 만료된 항목은 남겨 두고 다시 로그인하면 store_login 이 같은 쿠키 객체를 갱신
+                return None
+            return entry
+
+    def store_login(self, base_url, user_id, password, cookies):
+        """
+        로그인 성공 쿠키 저장. 같은 (서버, 사용자)의 세션이 있으면 기존 쿠키 객체의 내용을 교체
+        :return: LoginSession
+        """
+        key = (self._url_key(base_url), user_id)
+        with self._lock:
+            entry = self._logins.get(key)
+            if entry is None:
+                entry = self._logins[key] = LoginSession(key[0], user_id, password, cookies)
+                return entry
+            if cookies is not entry.cookies:
+                # 다른 스레드가 요청에 쓰는 중일 수 있으므로 비우지 않고 같은 이름의 쿠키 값만 교체
+                for cookie in cookies:
+                    entry.cookies.set_cookie(cookie)
+            entry.password = password
+            entry.generation += 1
+            entry.touch()
+            return entry
+
+    def find(self, base_url, cookies):
+        """login() 이 돌려준 쿠키 객체로 로그인 세션 찾기 (레지스트리 밖에서 만든 쿠키면 None)"""
+        if cookies is None:
+            return None
+        url_key = self._url_key(base_url)
+        with self._lock:
+            for (entry_url, _user_id), entry in self._logins.items():
+                if entry_url == url_key and entry.cookies is cookies:
+                    return entry
+        return None
+
+    def invalidate(self, base_url, user_id):
+        with self._lock:
+            self._logins.pop((self._url_key(base_url), user_id), None)
+
+    def close(self):
+        """모든 세션 종료 및 로그인 정보 삭제"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._logins.clear()
+            self._limiters.clear()
+            self._breakers.clear()
+
+
+def shared_registry(**options):
+    """
+    프로세스 전체 공유 레지스트리 (모든 채널 워커가 같은 커넥션 풀 / 로그인 쿠키 사용)
+    옵션은 처음 생성할 때만 적용된다.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = BxmSessionRegistry(**options)
+        return _shared
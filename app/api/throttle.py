@@ -0,0 +1,130 @@
+# app/api/throttle.py
+"""
+BXM 관리 서버 보호용 요청 제어 (서버별로 BxmSessionRegistry 가 하나씩 보관).
+
+- TokenBucket: 초당 요청 수 한도. 토큰을 미리 예약하는 방식이라 여러 스레드가 동시에 요청해도
+  한도 안에서 빈틈없이 간격을 두고 보낸다 (burst 만큼은 대기 없이 바로 전송)
+- CircuitBreaker: 연속 실패가 failure_threshold 회에 이르면 reset_timeout_sec 동안 요청을 보내지 않고
+  CircuitOpenError 로 상태를 알린다. 시간이 지나면 요청 하나만 시험으로 보내 성공하면 다시 닫는다.
+"""
+
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 요청을 보내지 않음"""
+
+    def __init__(self, name, failures, retry_after):
+        super().__init__(f"[{name}] BXM 서버 연속 실패 {failures}회로 요청 차단 중 "
+                         f"({retry_after:.0f}초 후 재시도 가능)")
+        self.name = name
+        self.failures = failures
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    사용 예)
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.acquire()   # 한도를 넘으면 필요한 만큼 대기
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        :param rate: 초당 요청 수 (0 이하면 제한 없음)
+        :param burst: 대기 없이 연속으로 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """토큰 하나를 예약하고 전송까지 기다려야 할 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰이 모자라면 음수로 두어 다음 요청들이 순서대로 뒤에 예약되도록 함
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """연속 실패 기준 서킷 브레이커 (여러 스레드에서 공유)"""
+
+    def __init__(self, name, failure_threshold=5, reset_timeout_sec=30):
+        """
+        :param failure_threshold: 서킷을 여는 연속 실패 횟수 (0 이하면 사용 안 함)
+        :param reset_timeout_sec: 열린 뒤 시험 요청을 허용하기까지의 시간 (초)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_sec = reset_timeout_sec
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now):
+        if self._opened_at is None:
+            return CLOSED
+        if now - self._opened_at < self.reset_timeout_sec:
+            return OPEN
+        return HALF_OPEN
+
+    def before_request(self):
+        """
+        요청 가능 여부 확인 (열려 있거나 시험 요청이 진행 중이면 CircuitOpenError)
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            retry_after = max(0.0, self._opened_at + self.reset_timeout_sec - now)
+            raise CircuitOpenError(self.name, self.failures, retry_after)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        """:return: 이번 실패로 서킷이 열렸는지 여부"""
+        with self._lock:
+            self.failures += 1
+            was_open = self._opened_at is not None
+            if was_open or (0 < self.failure_threshold <= self.failures):
+                # 시험 요청 실패 시에도 다시 reset_timeout_sec 동안 차단
+                self._opened_at = time.monotonic()
+            self._probing = False
+            return not was_open and self._opened_at is not None
+
+    def release(self):
+        """성공/실패로 판단하지 않는 결과 (시험 요청이었다면 다음 요청이 다시 시험하도록 함)"""
+        with self._lock:
+            self._probing = False
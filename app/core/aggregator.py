@@ -1,20 +1,262 @@
-from collections import defaultdict
+import heapq
+import sys
+from collections import Counter
 from datetime import datetime
+from itertools import repeat
+from operator import getitem, itemgetter
+
+from app.core.message_template import default_templater
+from app.core.snapshot_sampler import SnapshotSampler
+from app.core.time_series import TimeSeriesStore
+
+# 그룹당 보관할 최대 스냅샷 개수 (peak 분의 로그에서 무작위 표본 추출)
+MAX_PEAK_SNAPSHOTS = 5
+
+# 그룹 1개당 평균 메모리 (ErrorGroup + 키 튜플 + 스냅샷 표본, 실측 기준 근사치) - 메모리 한도 판단용
+GROUP_BYTES_ESTIMATE = 2048
+
+# 그룹핑 키를 구성하는 로그 필드 (순서 = 그룹 키 튜플 순서)
+KEY_FIELDS = ("chnl", "app", "svc", "op", "code", "msg")
+_KEY_GETTER = itemgetter(*KEY_FIELDS)
+_TIME_GETTER = itemgetter("time")
+# 시계열 키 (code, msg) 추출용 / "YYYY-MM-DD HH:MM" 분 단위 버킷 슬라이스
+_SERIES_KEY_GETTER = itemgetter(4, 5)
+_MSG_GETTER = itemgetter(5)
+_MINUTE_SLICE = slice(0, 16)
+_SECOND_SLICE = slice(0, 19)
+
+
+def _intern(value):
+    """문자열 키 구성요소를 intern 하여 그룹 간 동일 문자열을 공유 (문자열이 아니면 그대로 반환)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class ErrorGroup:
+    """
+    (chnl, app, svc, op, code, msg) 키 하나에 대한 집계 레코드.
+    그룹 수가 수십만 개까지 늘어날 수 있으므로 dict 대신 __slots__ 로 메모리를 줄인다.
+    nodes 는 노드 정보가 들어올 때까지 None 으로 두어 빈 set 할당을 피한다.
+    스냅샷은 (시각, 원문 메시지) 표본만 보관하고 문자열 포맷팅은 리포트 생성 시 수행한다.
+    """
+    __slots__ = ("total_count", "count_error", "nodes", "first_seen", "last_seen", "snapshots",
+                 "message_pattern", "seq")
+
+    def __init__(self, first_seen=None, message_pattern=""):
+        self.total_count = 0
+        # bounded 모드에서 퇴출된 그룹의 건수를 물려받은 경우의 최대 과대 추정치 (실제 건수 >= total_count - count_error)
+        self.count_error = 0
+        self.nodes = None
+        self.first_seen = first_seen
+        self.last_seen = first_seen
+        self.snapshots = SnapshotSampler()
+        self.message_pattern = message_pattern
+        # 집계기에 추가된 순번 (건수가 같을 때 정렬 순서 = 먼저 생긴 그룹 우선)
+        self.seq = 0
+
+    def add_node(self, node):
+        nodes = self.nodes
+        if nodes is None:
+            self.nodes = {_intern(node)}
+        elif node not in nodes:
+            nodes.add(_intern(node))
+
+    def node_list(self):
+        # set 순회 순서는 실행마다 달라지므로 정렬 (분석 캐시 키 / 요청 본문이 같은 입력에서 같도록)
+        return sorted(self.nodes) if self.nodes else []
+
+    def merge(self, other):
+        """
+        뒤 구간(other)의 집계를 현재 그룹에 병합.
+        순차 처리와 동일한 결과가 나오도록 first_seen/패턴은 앞 구간을 우선한다.
+        """
+        self.total_count += other.total_count
+        self.count_error += other.count_error
+        if other.nodes:
+            if self.nodes is None:
+                self.nodes = set(other.nodes)
+            else:
+                self.nodes.update(other.nodes)
+        if not self.first_seen:
+            self.first_seen = other.first_seen
+        self.last_seen = other.last_seen
+        self.snapshots.merge(other.snapshots, MAX_PEAK_SNAPSHOTS)
+        if not self.message_pattern:
+            self.message_pattern = other.message_pattern
+
+    def copy(self):
+        clone = ErrorGroup(self.first_seen, self.message_pattern)
+        clone.total_count = self.total_count
+        clone.count_error = self.count_error
+        clone.nodes = set(self.nodes) if self.nodes else None
+        clone.last_seen = self.last_seen
+        clone.snapshots = self.snapshots.copy()
+        return clone
+
+    def to_state(self):
+        return [self.total_count, sorted(self.nodes) if self.nodes else [], self.first_seen,
+                self.last_seen, self.snapshots.to_state(), self.message_pattern, self.count_error]
+
+    @classmethod
+    def from_state(cls, state):
+        total_count, nodes, first_seen, last_seen, snapshots, message_pattern, count_error = state
+        group = cls(first_seen, message_pattern)
+        group.total_count = total_count
+        group.count_error = count_error
+        group.nodes = {_intern(n) for n in nodes} if nodes else None
+        group.last_seen = last_seen
+        group.snapshots = SnapshotSampler.from_state(snapshots)
+        return group
+
 
 class LogAggregator:
-    def __init__(self):
-        # 그룹핑 키: (channel, application, service, operation, error_code, error_msg)
-        self.groups = defaultdict(lambda: {
-            "total_count": 0,
-            "nodes": set(),
-            "first_seen": None,
-            "last_seen": None,
-            "peak_snapshot": [], # 최대 5개 스냅샷 저장
-            "message_pattern": ""
-        })
-        # 시간대별 통계 (Key: "YYYY-MM-DD HH:MM", Value: {(code, msg): count})
+    # to_state() 직렬화 포맷 버전
+    STATE_VERSION = 5
+
+    def __init__(self, window_start=None, window_end=None, max_groups=None, mask_messages=True):
+        """
+        :param window_start, window_end: 조회 기간 ("YYYY-MM-DD HH:MM[:SS]"). 지정 시 시계열 배열을 미리 할당
+        :param max_groups: 지정 시 bounded 모드 - 최대 max_groups 개 그룹만 유지 (Space-Saving 알고리즘)
+        :param mask_messages: True 면 메시지의 가변값(계좌번호, GUID, 금액 등)을 치환한 템플릿으로 그룹핑
+        """
+        # 그룹핑 키: (channel, application, service, operation, error_code, error_msg 템플릿) -> ErrorGroup
+        self.groups = {}
+        # 메시지 템플릿 추출기 (None 이면 원문 메시지로 그룹핑)
+        self.templater = default_templater if mask_messages else None
+        # 분 단위 시계열 (시리즈 키: (code, msg), 값: 분 오프셋 인덱스의 카운트 배열)
         # 차트 생성을 위해 내부적으로 (code, msg) 튜플을 키로 사용하고 나중에 ErrorID로 변환
-        self.time_series = defaultdict(lambda: defaultdict(int))
+        self.time_series = TimeSeriesStore(window_start, window_end)
+        # 처리한 전체 로그 건수 (bounded 모드에서도 정확한 값 유지)
+        self.total_logs = 0
+        # 증분 조회용 high-water mark: 반영한 로그 중 가장 늦은 시각("YYYY-MM-DD HH:MM:SS")과 그 시각의 건수
+        self.high_water = None
+        self.high_water_count = 0
+
+        # bounded 모드 상태
+        self.max_groups = None
+        self.evicted_groups = 0
+        self._heap = []          # (total_count 하한, 순번, key) - 최소 건수 그룹 탐색용 lazy heap
+        self._heap_seq = 0
+        self._series_refs = {}   # (code, msg) -> 해당 시리즈를 쓰는 추적 중인 그룹 수
+
+        # 증분 내보내기 상태
+        self._next_seq = 0
+        self._changed = set()    # 마지막 export 이후 갱신/추가된 그룹 키
+        self._removed = set()    # 마지막 export 이후 퇴출된 그룹 키
+        self._order = []         # 마지막 export 시점의 건수 내림차순 그룹 키 (정렬 인덱스)
+        self._issue_cache = {}   # 그룹 키 -> error_id 를 제외한 issue dict
+        self._error_ids = {}     # 그룹 키 -> 마지막 export 에서 부여한 Error ID
+        if max_groups is not None:
+            self.set_max_groups(max_groups)
+
+    @property
+    def is_bounded(self):
+        return self.max_groups is not None
+
+    @property
+    def approximated_logs(self):
+        """
+        그룹 귀속이 보장되지 않는 로그 건수 (bounded 모드에서 퇴출된 그룹의 건수가 다른 그룹에 합산된 분량)
+        전체 건수 - 각 그룹의 확정 건수(total_count - count_error) 합계. bounded 모드가 아니면 0
+        """
+        if self.max_groups is None:
+            return 0
+        exact = sum(group.total_count - group.count_error for group in self.groups.values())
+        return self.total_logs - exact
+
+    def estimated_bytes(self):
+        """집계 상태의 대략적인 메모리 사용량 (바이트)"""
+        return len(self.groups) * GROUP_BYTES_ESTIMATE + self.time_series.nbytes()
+
+    def set_max_groups(self, max_groups):
+        """
+        bounded 모드로 전환 (또는 한도 변경). 현재 그룹 수가 한도를 넘으면 건수가 적은 그룹부터 퇴출한다.
+        Space-Saving: 신규 그룹은 퇴출된 최소 그룹의 건수를 물려받으므로 상위 그룹은 반드시 유지되고,
+        각 그룹의 건수 과대 추정치는 count_error 이하 (최대 전체 건수 / max_groups)로 보장된다.
+        """
+        if max_groups < 1:
+            raise ValueError("max_groups 는 1 이상이어야 합니다.")
+        if self.max_groups is None:
+            self._series_refs = {}
+            for key in self.groups:
+                series_key = (key[4], key[5])
+                self._series_refs[series_key] = self._series_refs.get(series_key, 0) + 1
+            self._rebuild_heap()
+            # bounded 모드 issue 에는 count_error 가 추가되므로 캐시된 issue 를 모두 갱신 대상으로 표시
+            self._changed.update(self.groups)
+        self.max_groups = max_groups
+        while len(self.groups) > max_groups:
+            self._evict_min()
+
+    def _rebuild_heap(self):
+        self._heap = [(group.total_count, seq, key) for seq, (key, group) in enumerate(self.groups.items())]
+        heapq.heapify(self._heap)
+        self._heap_seq = len(self._heap)
+
+    def _push_heap(self, key, count):
+        if len(self._heap) > 4 * self.max_groups:
+            # 오래된(stale) 항목이 쌓이면 현재 그룹 기준으로 재구성
+            self._rebuild_heap()
+        heapq.heappush(self._heap, (count, self._heap_seq, key))
+        self._heap_seq += 1
+
+    def _evict_min(self):
+        """건수가 가장 적은 그룹을 퇴출하고 반환"""
+        heap = self._heap
+        groups = self.groups
+        while heap:
+            count, seq, key = heap[0]
+            group = groups.get(key)
+            if group is None:
+                heapq.heappop(heap)
+            elif group.total_count != count:
+                # 건수가 늘어난 항목은 현재 값으로 갱신 후 재정렬
+                heapq.heapreplace(heap, (group.total_count, seq, key))
+            else:
+                heapq.heappop(heap)
+                del groups[key]
+                self.evicted_groups += 1
+                self._changed.discard(key)
+                self._removed.add(key)
+                series_key = (key[4], key[5])
+                refs = self._series_refs.get(series_key, 0) - 1
+                if refs > 0:
+                    self._series_refs[series_key] = refs
+                else:
+                    self._series_refs.pop(series_key, None)
+                    self.time_series.discard(series_key)
+                return group
+        return None
+
+    def _add_group(self, key, first_seen):
+        """신규 그룹 생성. bounded 모드에서 한도에 도달했으면 최소 그룹을 퇴출하고 그 건수를 물려받는다."""
+        group = ErrorGroup(first_seen, key[5])
+        group.seq = self._take_seq()
+        if self.max_groups is not None:
+            if len(self.groups) >= self.max_groups:
+                evicted = self._evict_min()
+                if evicted is not None:
+                    group.total_count = evicted.total_count
+                    group.count_error = evicted.total_count
+            series_key = (key[4], key[5])
+            self._series_refs[series_key] = self._series_refs.get(series_key, 0) + 1
+            self._push_heap(key, group.total_count)
+        self.groups[key] = group
+        return group
+
+    def _advance_high_water(self, latest, count):
+        """더 늦은 시각이면 교체, 같은 시각이면 건수 누적"""
+        if latest is None:
+            return
+        if self.high_water is None or latest > self.high_water:
+            self.high_water = latest
+            self.high_water_count = count
+        elif latest == self.high_water:
+            self.high_water_count += count
+
+    def _take_seq(self):
+        seq = self._next_seq
+        self._next_seq += 1
+        return seq
 
     def process_log(self, log_entry: dict):
         """
@@ -23,100 +265,415 @@ class LogAggregator:
         chnl: MA0(모바일앱), MW0(모바일웹), HOM(홈페이지)
         """
         # 1. Grouping Key 생성 (안전한 접근을 위해 .get 사용)
-        chnl = log_entry.get('chnl', 'Unknown')
-        app = log_entry.get('app', 'Unknown')
-        svc = log_entry.get('svc', 'Unknown')
-        op = log_entry.get('op', 'Unknown')
-        code = log_entry.get('code', 'Unknown')
-        msg = log_entry.get('msg', 'Unknown')
-        
-        key = (chnl, app, svc, op, code, msg)
-        group = self.groups[key]
+        get = log_entry.get
+        raw_msg = get('msg', 'Unknown')
+        key = (get('chnl', 'Unknown'), get('app', 'Unknown'), get('svc', 'Unknown'),
+               get('op', 'Unknown'), get('code', 'Unknown'),
+               self.templater.template(raw_msg) if self.templater is not None else raw_msg)
+        # 기본값 문자열은 'time' 필드가 없을 때만 생성 (항목마다 strftime 호출 방지)
+        timestamp = log_entry['time'] if 'time' in log_entry else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        group = self.groups.get(key)
+        if group is None:
+            # 신규 그룹일 때만 키 구성요소를 intern (기존 그룹은 조회만 수행)
+            key = tuple(_intern(part) for part in key)
+            group = self._add_group(key, timestamp)
+        _chnl, app, svc, op, code, msg = key
 
         # 2. 통계 업데이트
-        group['total_count'] += 1
-        
+        group.total_count += 1
+        self.total_logs += 1
+        self._changed.add(key)
+
         # [수정] 데모용 하드코딩("Node-01") 제거
         # 실제 로그에 'node' 필드가 있는 경우에만 수집
-        if 'node' in log_entry and log_entry['node']:
-            group['nodes'].add(log_entry['node'])
+        node = get('node')
+        if node:
+            group.add_node(node)
 
         # 3. 시간 컨텍스트
-        timestamp = log_entry.get('time', datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        if not group['first_seen']:
-            group['first_seen'] = timestamp
-        group['last_seen'] = timestamp
+        if not group.first_seen:
+            group.first_seen = timestamp
+        group.last_seen = timestamp
 
         # 시간대별 집계 (메시지 구분을 위해 복합 키 사용)
+        time_bucket = None
         try:
             # 타임스탬프 길이 체크로 안전성 확보
             clean_time = timestamp.strip("[]")
             if len(clean_time) >= 16:
                 time_bucket = clean_time[:16] # YYYY-MM-DD HH:MM
-                self.time_series[time_bucket][(code, msg)] += 1
+                if self.max_groups is None or (code, msg) in self._series_refs:
+                    self.time_series.add(time_bucket, (code, msg))
+            # high-water mark 갱신 (항목마다 호출되므로 _latest_second 대신 문자열 비교만 수행)
+            second = clean_time[:19]
+            if len(second) == 19 and second[0].isdigit():
+                if self.high_water is None or second > self.high_water:
+                    self.high_water = second
+                    self.high_water_count = 1
+                elif second == self.high_water:
+                    self.high_water_count += 1
         except Exception:
             pass
 
-        # 4. 스냅샷 (Peak Snapshot) — key: (chnl, app, svc, op, code, msg)
-        if len(group['peak_snapshot']) < 5:
-            # 가독성을 위해 key 인덱스 대신 변수명 사용
-            raw_msg = f"[{timestamp}] [{app}] {svc}.{op} - {code} (Msg: {msg})"
-            group['peak_snapshot'].append(raw_msg)
-            
+        # 4. 스냅샷 (Peak Snapshot) 표본 — 포맷팅은 export 시점에 수행
+        # 스냅샷에는 템플릿이 아닌 원문 메시지를 남겨 실제 값 예시를 보존
+        group.snapshots.add(MAX_PEAK_SNAPSHOTS, time_bucket, timestamp, get('raw_msg') or raw_msg)
+
         # 5. 대표 메시지 패턴 저장
-        if not group['message_pattern']:
-            group['message_pattern'] = msg
+        if not group.message_pattern:
+            group.message_pattern = msg
 
-    def export_to_dify_format(self):
-        """기획서 3. 인터페이스 명세에 맞춘 JSON 생성"""
-        issue_groups = []
-        
-        # 발생 횟수 내림차순 정렬하여 Error ID 부여 (Error01, Error02...)
-        sorted_groups = sorted(self.groups.items(), key=lambda x: x[1]['total_count'], reverse=True)
-        
-        # (code, msg) -> ErrorID 매핑 테이블
-        id_mapping = {}
+    def process_batch(self, entries):
+        """
+        한 페이지 분량의 로그를 일괄 처리 (process_log 를 반복 호출한 것과 동일한 결과)
+        :param entries: 로그 dict 리스트, 또는 컬럼 배열 dict
+                        예) {"time": [...], "chnl": [...], "app": [...], ..., "node": [...]}
+                        컬럼이 없으면 'Unknown'(time 은 현재 시각)으로 채운다.
+        :return: 처리한 로그 건수
+
+        키 생성/건수 집계/시간 버킷 집계를 Counter, zip 등 C 구현으로 한 번에 처리하고,
+        그룹별 갱신은 항목 단위가 아닌 '배치 내 고유 그룹' 단위로 한 번만 수행한다.
+        """
+        if isinstance(entries, dict):
+            keys, times, nodes = self._batch_from_columns(entries)
+        else:
+            keys, times, nodes = self._batch_from_entries(entries)
+        size = len(keys)
+        if not size:
+            return 0
+        self.total_logs += size
+
+        # 메시지 템플릿 적용 (캐시 적중 시 항목당 dict 조회 1회). 원문은 스냅샷용으로 보관
+        raw_msgs = list(map(_MSG_GETTER, keys))
+        if self.templater is not None:
+            templates = self.templater.template_many(raw_msgs)
+            if templates != raw_msgs:
+                keys = [key[:5] + (msg,) for key, msg in zip(keys, templates)]
+        if isinstance(entries, dict):
+            raw_column = entries.get('raw_msg')
+            raw_msg_at = (lambda i: raw_column[i] or raw_msgs[i]) if raw_column else raw_msgs.__getitem__
+        else:
+            raw_msg_at = lambda i: entries[i].get('raw_msg') or raw_msgs[i]
+
+        # 1. 그룹별 건수 / 마지막 시각을 일괄 계산
+        batch_counts = Counter(keys)
+        last_times = dict(zip(keys, times))
 
-        for idx, (key, data) in enumerate(sorted_groups, 1):
-            # key: (chnl, app, svc, op, code, msg)
-            chnl, app, svc, op, code, msg = key
+        groups = self.groups
+        batch_groups = {}
+        for key, count in batch_counts.items():
+            group = groups.get(key)
+            if group is None:
+                group = self._add_group(tuple(_intern(part) for part in key), None)
+            batch_groups[key] = group
 
+            group.total_count += count
+            if not group.first_seen:
+                # 최초 시각은 신규 그룹에만 필요하므로 해당 그룹만 앞에서부터 탐색
+                group.first_seen = self._first_valid_time(keys, times, key) or last_times[key]
+            group.last_seen = last_times[key]
+            if not group.message_pattern:
+                group.message_pattern = key[5]
+        self._changed.update(batch_groups)
+
+        # 2. 노드 수집 (중복 (key, node) 쌍은 set 으로 먼저 제거)
+        if nodes is not None and any(nodes):
+            for key, node in set(zip(keys, nodes)):
+                if node:
+                    batch_groups[key].add_node(node)
+
+        # 3. 시간대별 집계 (YYYY-MM-DD HH:MM 버킷 단위로 한 번에 카운트)
+        time_series = self.time_series
+        tracked = self._series_refs if self.max_groups is not None else None
+        minutes = self._time_buckets(times)
+        bucket_counts = Counter(zip(minutes, map(_SERIES_KEY_GETTER, keys)))
+        for (time_bucket, series_key), count in bucket_counts.items():
+            if time_bucket is not None and (tracked is None or series_key in tracked):
+                time_series.add(time_bucket, series_key, count)
+
+        # 4. 스냅샷 표본: 그룹별 항목 위치를 모은 뒤 그룹 단위로 샘플링 (원문은 채택된 항목만 조회)
+        positions = {key: [] for key in batch_groups}
+        for i, key in enumerate(keys):
+            positions[key].append(i)
+        for key, indices in positions.items():
+            batch_groups[key].snapshots.add_many(MAX_PEAK_SNAPSHOTS, indices, minutes, times, raw_msg_at)
+
+        self._advance_high_water(*self._latest_second(times))
+        return size
+
+    @staticmethod
+    def _first_valid_time(keys, times, key):
+        """배치 내에서 key 의 첫 번째 유효(truthy) 시각"""
+        idx = keys.index(key)
+        if times[idx]:
+            return times[idx]
+        return next((ts for k, ts in zip(keys[idx:], times[idx:]) if k == key and ts), None)
+
+    @staticmethod
+    def _time_buckets(times):
+        """시각 리스트 -> "YYYY-MM-DD HH:MM" 분 버킷 리스트 (집계 불가한 시각은 None)"""
+        try:
+            cleaned = list(map(str.strip, times, repeat("[]")))
+        except TypeError:
+            cleaned = None
+        if cleaned and min(map(len, cleaned)) >= 16:
+            # 모든 시각이 정상 문자열이면 map 으로 일괄 슬라이스
+            return list(map(getitem, cleaned, repeat(_MINUTE_SLICE)))
+        return [
+            ts.strip("[]")[:16] if isinstance(ts, str) and len(ts.strip("[]")) >= 16 else None
+            for ts in times
+        ]
+
+    @staticmethod
+    def _latest_second(times):
+        """시각 리스트 중 가장 늦은 시각(초 단위)과 그 건수. 유효한 시각이 없으면 (None, 0)"""
+        try:
+            seconds = list(map(getitem, map(str.strip, times, repeat("[]")), repeat(_SECOND_SLICE)))
+            latest = max(seconds)
+        except (TypeError, ValueError):
+            seconds = latest = None
+        if latest is None or len(latest) != 19 or not latest[0].isdigit():
+            # 시각이 없거나 'Unknown' 등이 섞인 경우 유효한 시각만 추림
+            seconds = [sec for sec in (ts.strip("[]")[:19] for ts in times if isinstance(ts, str))
+                       if len(sec) == 19 and sec[0].isdigit()]
+            if not seconds:
+                return None, 0
+            latest = max(seconds)
+        return latest, seconds.count(latest)
+
+    @staticmethod
+    def _batch_from_entries(entries):
+        """로그 dict 리스트 -> (그룹 키 리스트, 시각 리스트, 노드 리스트 or None)"""
+        if not entries:
+            return [], [], None
+        try:
+            # 모든 필드가 채워진 페이지(BXM 파싱 결과)는 itemgetter 로 한 번에 추출
+            keys = list(map(_KEY_GETTER, entries))
+            times = list(map(_TIME_GETTER, entries))
+        except KeyError:
+            keys = [tuple(e.get(field, 'Unknown') for field in KEY_FIELDS) for e in entries]
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            times = [e.get('time', now_str) for e in entries]
+        nodes = [e.get('node') for e in entries]
+        return keys, times, nodes
+
+    @staticmethod
+    def _batch_from_columns(columns):
+        """컬럼 배열 dict -> (그룹 키 리스트, 시각 리스트, 노드 리스트 or None)"""
+        size = max((len(col) for col in columns.values()), default=0)
+        keys = list(zip(*(columns.get(field) or repeat('Unknown', size) for field in KEY_FIELDS)))
+        times = columns.get('time')
+        if times is None:
+            times = [datetime.now().strftime("%Y-%m-%d %H:%M:%S")] * size
+        return keys, times, columns.get('node')
+
+    def merge(self, other):
+        """
+        다른 부분 집계기(페이지/파일/시간 구간 단위)를 현재 집계기에 병합.
+        other 는 현재 집계기보다 뒤에 처리된 구간이어야 하며, 이 순서만 지키면
+        분할 방식과 무관하게 순차 처리한 결과와 동일하다 (결합법칙 성립).
+        :return: self (연쇄 호출용)
+        """
+        groups = self.groups
+        bounded = self.max_groups is not None
+        for key, other_group in other.groups.items():
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = other_group.copy()
+                group.seq = self._take_seq()
+                if bounded:
+                    series_key = (key[4], key[5])
+                    self._series_refs[series_key] = self._series_refs.get(series_key, 0) + 1
+                    self._push_heap(key, group.total_count)
+            else:
+                group.merge(other_group)
+        self._changed.update(other.groups)
+
+        self.total_logs += other.total_logs
+        self.evicted_groups += other.evicted_groups
+        self.time_series.merge(other.time_series)
+        self._advance_high_water(other.high_water, other.high_water_count)
+
+        # bounded 모드: 병합 후 한도를 넘는 만큼 최소 그룹부터 퇴출 (이 경우 결과는 근사치)
+        if bounded:
+            while len(groups) > self.max_groups:
+                self._evict_min()
+        return self
+
+    def to_state(self):
+        """
+        부분 집계 상태를 JSON/pickle 직렬화 가능한 기본 타입으로 변환
+        (다른 프로세스에서 집계한 결과를 전달한 뒤 from_state + merge 로 합치는 용도)
+        """
+        return {
+            "version": self.STATE_VERSION,
+            "total_logs": self.total_logs,
+            "max_groups": self.max_groups,
+            "evicted_groups": self.evicted_groups,
+            "high_water": [self.high_water, self.high_water_count],
+            "groups": [[list(key), group.to_state()] for key, group in self.groups.items()],
+            "time_series": self.time_series.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """to_state() 결과로부터 집계기 복원"""
+        if state.get("version") != cls.STATE_VERSION:
+            raise ValueError(f"지원하지 않는 집계 상태 버전: {state.get('version')}")
+
+        aggregator = cls()
+        groups = aggregator.groups
+        for key, group_state in state["groups"]:
+            group = groups[tuple(_intern(part) for part in key)] = ErrorGroup.from_state(group_state)
+            group.seq = aggregator._take_seq()
+        aggregator._changed.update(groups)
+
+        aggregator.time_series = TimeSeriesStore.from_state(
+            state["time_series"], key_factory=lambda key: tuple(_intern(part) for part in key)
+        )
+        aggregator.total_logs = state["total_logs"]
+        aggregator.evicted_groups = state["evicted_groups"]
+        aggregator.high_water, aggregator.high_water_count = state["high_water"]
+        if state["max_groups"] is not None:
+            aggregator.set_max_groups(state["max_groups"])
+        return aggregator
+
+    def _issue_payload(self, key, data):
+        """그룹 하나의 issue dict (error_id 제외) - 그룹이 바뀐 경우에만 다시 생성"""
+        # key: (chnl, app, svc, op, code, msg)
+        chnl, app, svc, op, code, _msg = key
+        peak_minute, _peak_count, _samples = data.snapshots.best()
+        payload = {
+            "channel": chnl,
+            "signature": f"{app} | {svc}.{op} | {code}",
+            "target_service": svc,
+            "target_operation": op,
+            "application": app,
+            "error_code": code,
+            "message_pattern": data.message_pattern,
+            "total_count": data.total_count,
+            "nodes": data.node_list(), # 노드 정보가 없으면 빈 리스트 반환
+            "time_context": {
+                "first_seen": data.first_seen,
+                "last_seen": data.last_seen,
+                "peak_minute": peak_minute,
+                "peak_snapshot": [
+                    f"[{ts}] [{app}] {svc}.{op} - {code} (Msg: {raw_msg})"
+                    for ts, raw_msg in data.snapshots.samples(MAX_PEAK_SNAPSHOTS)
+                ]
+            }
+        }
+        if self.max_groups is not None:
+            # 실제 건수는 total_count - count_error 이상 total_count 이하
+            payload["count_error"] = data.count_error
+        return payload
+
+    def _refresh_export_index(self):
+        """
+        정렬 인덱스와 issue 캐시를 마지막 export 이후 변경분만큼 갱신.
+        직전 정렬 결과는 거의 정렬된 상태이므로 재정렬 비용이 변경 건수에 비례한다 (Timsort).
+        :return: 변경된(갱신/추가) 그룹 키 리스트
+        """
+        groups = self.groups
+        cache = self._issue_cache
+        removed = self._removed
+        if removed:
+            for key in removed:
+                cache.pop(key, None)
+            self._order = [key for key in self._order if key not in removed]
+        changed = [key for key in self._changed if key in groups]
+        order = self._order
+        order.extend(key for key in changed if key not in cache)
+        order.sort(key=lambda key: (-groups[key].total_count, groups[key].seq))
+        for key in changed:
+            cache[key] = self._issue_payload(key, groups[key])
+        self._changed = set()
+        self._removed = set()
+        return changed
+
+    def _report_meta(self):
+        report_meta = {
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "total_logs_processed": self.total_logs,
+            "monitoring_window": "Period" # [수정] "Realtime" -> "Period" (중립적 표현)
+        }
+        if self.max_groups is not None:
+            report_meta["bounded_mode"] = {
+                "max_groups": self.max_groups,
+                "evicted_groups": self.evicted_groups,
+                "approximated_logs": self.approximated_logs,
+            }
+        return report_meta
+
+    def _assign_error_ids(self):
+        """
+        발생 횟수 내림차순으로 Error ID 부여 (Error01, Error02...)
+        :return: (그룹 키 -> ErrorID, (code, msg) -> ErrorID 차트 매핑 테이블)
+        """
+        error_ids = {}
+        id_mapping = {}
+        for idx, key in enumerate(self._order, 1):
             error_id = f"Error{idx:02d}"
-            id_mapping[(code, msg)] = error_id
-
-            issue_groups.append({
-                "error_id": error_id,
-                "channel": chnl,
-                "signature": f"{app} | {svc}.{op} | {code}",
-                "target_service": svc,
-                "target_operation": op,
-                "application": app,
-                "error_code": code,
-                "message_pattern": data['message_pattern'],
-                "total_count": data['total_count'],
-                "nodes": list(data['nodes']), # 노드 정보가 없으면 빈 리스트 반환
-                "time_context": {
-                    "first_seen": data['first_seen'],
-                    "last_seen": data['last_seen'],
-                    "peak_snapshot": data['peak_snapshot']
-                }
-            })
-            
+            error_ids[key] = error_id
+            id_mapping[(key[4], key[5])] = error_id
+        return error_ids, id_mapping
+
+    def export_to_dify_format(self):
+        """
+        기획서 3. 인터페이스 명세에 맞춘 JSON 생성
+        정렬 인덱스/issue dict/시계열 배열은 직전 호출 이후 바뀐 그룹만 다시 계산하므로 반복 호출해도 가볍다.
+        (반환값은 json.dumps 로 바로 직렬화할 수 있으며, 하위 리스트는 다음 호출과 공유되므로 읽기 전용으로 사용)
+        """
+        self._refresh_export_index()
+        error_ids, id_mapping = self._assign_error_ids()
+        self._error_ids = error_ids
+
+        cache = self._issue_cache
+        issue_groups = [{"error_id": error_id, **cache[key]} for key, error_id in error_ids.items()]
+
         # 차트용 시계열 데이터 키 변환 ((code, msg) -> ErrorID)
-        final_time_series = defaultdict(lambda: defaultdict(int))
-        for time_str, counts in self.time_series.items():
-            for (code, msg), count in counts.items():
-                if (code, msg) in id_mapping:
-                    # 차트 범례에 표시될 키를 'Error01' 형태로 변환
-                    mapped_key = id_mapping[(code, msg)]
-                    final_time_series[time_str][mapped_key] += count
+        # 배열은 그대로 두고 시리즈 인덱스만 'Error01' 형태의 범례 키로 매핑
+        final_time_series = self.time_series.export(id_mapping)
 
         return {
-            "report_meta": {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "total_logs_processed": sum(g['total_count'] for g in self.groups.values()),
-                "monitoring_window": "Period" # [수정] "Realtime" -> "Period" (중립적 표현)
-            },
+            "report_meta": self._report_meta(),
             "issue_groups": issue_groups,
             "time_series_data": final_time_series
-        }
\ No newline at end of file
+        }
+
+    def export_delta(self):
+        """
+        마지막 export (전체/증분) 이후 바뀐 부분만 내보내기 (실시간 모니터링 중 주기적 호출용)
+        :return: {
+            "report_meta": {...},
+            "issue_groups": [갱신/추가된 그룹의 issue dict (+ "group_key")],
+            "removed_groups": [퇴출된 그룹 키],
+            "renumbered": [[그룹 키, 새 ErrorID], ...] - 순위 변동으로 ID 만 바뀐 기존 그룹,
+            "time_series_data": 바뀐 시리즈만 포함 (start/step 이 바뀌었으면 전체 시리즈)
+        }
+        """
+        changed = self._refresh_export_index()
+        previous_ids = self._error_ids
+        error_ids, id_mapping = self._assign_error_ids()
+        self._error_ids = error_ids
+
+        cache = self._issue_cache
+        changed_set = set(changed)
+        issue_groups = [
+            {"error_id": error_ids[key], "group_key": list(key), **cache[key]}
+            for key in self._order if key in changed_set
+        ]
+        renumbered = [
+            [list(key), error_id] for key, error_id in error_ids.items()
+            if key not in changed_set and previous_ids.get(key) != error_id
+        ]
+        removed_groups = [list(key) for key in previous_ids if key not in error_ids]
+
+        return {
+            "report_meta": self._report_meta(),
+            "issue_groups": issue_groups,
+            "removed_groups": removed_groups,
+            "renumbered": renumbered,
+            "time_series_data": self.time_series.export(id_mapping, changed_only=True)
+        }
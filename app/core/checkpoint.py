@@ -0,0 +1,121 @@
+# app/core/checkpoint.py
+"""
+LogAggregator 집계 상태 체크포인트 (디스크 저장/복원).
+스캔 도중 앱이 종료되어도 마지막 체크포인트에서 집계 상태와 다음 조회 페이지를 복원하여
+BXM API 전체 재조회 없이 이어서 진행한다.
+수집이 끝난 체크포인트는 다음 스캔의 기준(baseline)으로 남겨 high-water mark 이후 로그만 증분 조회하는 데 쓴다.
+
+파일 형식: 헤더(struct) + zlib 압축된 marshal 바이너리
+    헤더 = MAGIC(7s) | 형식 버전(B) | 본문 CRC32(I)
+    본문 = {"meta": {...}, "state": LogAggregator.to_state()}
+to_state() 결과는 dict/list/str/int/None 으로만 구성되므로 표준 라이브러리 marshal 로 바로 직렬화된다.
+(JSON 대비 인코딩/디코딩이 빠르고, 0 이 대부분인 시계열 배열은 zlib 로 크게 줄어든다)
+"""
+
+import marshal
+import os
+import struct
+import time
+import zlib
+
+from app.core.aggregator import LogAggregator
+
+MAGIC = b"BXMCKPT"
+FORMAT_VERSION = 1
+# marshal 포맷 버전 (파이썬 버전이 바뀌면 복원 실패 -> 체크포인트 무시 후 재조회)
+MARSHAL_VERSION = 4
+_HEADER = struct.Struct("<7sBI")
+
+
+def save_checkpoint(path, aggregator, meta=None):
+    """
+    집계 상태를 path 에 저장 (임시 파일에 쓴 뒤 교체하여 저장 도중 종료되어도 이전 파일 유지)
+    :param meta: 재개에 필요한 부가 정보 (조회 기간, 다음 페이지 번호 등)
+    :return: 저장한 바이트 수
+    """
+    body = marshal.dumps({"meta": meta or {}, "state": aggregator.to_state()}, MARSHAL_VERSION)
+    payload = zlib.compress(body, 1)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, zlib.crc32(payload)))
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return _HEADER.size + len(payload)
+
+
+def load_checkpoint(path):
+    """
+    체크포인트 복원
+    :return: (LogAggregator, meta)
+    :raises ValueError: 형식/버전이 다르거나 파일이 손상된 경우
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError("체크포인트 파일이 손상되었습니다.")
+    magic, version, crc = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 체크포인트 형식: {magic!r} v{version}")
+    payload = data[_HEADER.size:]
+    if zlib.crc32(payload) != crc:
+        raise ValueError("체크포인트 파일이 손상되었습니다. (CRC 불일치)")
+    try:
+        body = marshal.loads(zlib.decompress(payload))
+    except (zlib.error, EOFError, TypeError) as e:
+        # 다른 파이썬 버전에서 저장된 marshal 데이터 등
+        raise ValueError(f"체크포인트 해석 실패: {e}")
+    return LogAggregator.from_state(body["state"]), body["meta"]
+
+
+class CheckpointManager:
+    """
+    주기적 체크포인트 관리 (마지막 저장 후 interval_sec 초 또는 every_pages 페이지가 지나면 저장)
+    """
+
+    def __init__(self, path, interval_sec=30, every_pages=0):
+        """
+        :param interval_sec: 시간 기준 저장 주기 (0 이하면 사용 안 함)
+        :param every_pages: 페이지 기준 저장 주기 (0 이하면 사용 안 함)
+        """
+        self.path = path
+        self.interval_sec = interval_sec
+        self.every_pages = every_pages
+        self._last_saved = time.monotonic()
+        self._pages_since_save = 0
+
+    def maybe_save(self, aggregator, meta=None):
+        """페이지 하나를 처리할 때마다 호출. 저장 주기가 되었으면 저장하고 True 반환"""
+        self._pages_since_save += 1
+        due = (self.interval_sec > 0 and time.monotonic() - self._last_saved >= self.interval_sec) \
+            or (self.every_pages > 0 and self._pages_since_save >= self.every_pages)
+        if not due:
+            return False
+        self.save(aggregator, meta)
+        return True
+
+    def save(self, aggregator, meta=None):
+        size = save_checkpoint(self.path, aggregator, meta)
+        self._last_saved = time.monotonic()
+        self._pages_since_save = 0
+        return size
+
+    def load(self):
+        """
+        :return: (LogAggregator, meta). 체크포인트가 없거나 읽을 수 없으면 (None, None)
+        """
+        if not os.path.exists(self.path):
+            return None, None
+        try:
+            return load_checkpoint(self.path)
+        except (OSError, ValueError, KeyError):
+            return None, None
+
+    def clear(self):
+        for path in (self.path, self.path + ".tmp"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,87 @@
+# app/core/message_template.py
+"""
+에러 메시지 템플릿 추출기.
+계좌번호, GUID, 시각, 금액처럼 로그마다 달라지는 값을 플레이스홀더로 치환하여
+값만 다른 메시지가 같은 그룹으로 묶이도록 한다.
+예) "[E100] 계좌 110-234-567890 잔액 부족 (요청금액: 1,500,000원)"
+    -> "[E100] 계좌 <NUM> 잔액 부족 (요청금액: <NUM>원)"
+    "DB Timeout after 10525ms" -> "DB Timeout after <NUM>ms"
+"""
+
+import re
+
+# 치환 대상 패턴 (앞에 있을수록 우선). 영숫자 경계는 ASCII 기준으로만 검사하여
+# "15000원" 처럼 한글이 바로 붙은 숫자도 치환되도록 한다.
+_NB = r"(?<![0-9A-Za-z_])"   # 앞이 영숫자가 아님
+_NA = r"(?![0-9A-Za-z_])"    # 뒤가 영숫자가 아님
+_VARIABLE_PATTERN = re.compile("|".join([
+    rf"(?P<UUID>{_NB}[0-9a-fA-F]{{8}}-[0-9a-fA-F]{{4}}-[0-9a-fA-F]{{4}}-[0-9a-fA-F]{{4}}-[0-9a-fA-F]{{12}}{_NA})",
+    rf"(?P<TS>{_NB}\d{{4}}[-/.]\d{{2}}[-/.]\d{{2}}(?:[ T]\d{{2}}:\d{{2}}(?::\d{{2}}(?:[.,]\d+)?)?)?{_NA})",
+    rf"(?P<TIME>{_NB}\d{{2}}:\d{{2}}:\d{{2}}(?:[.,]\d+)?{_NA})",
+    rf"(?P<IP>{_NB}\d{{1,3}}(?:\.\d{{1,3}}){{3}}(?::\d+)?{_NA})",
+    r"(?P<EMAIL>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)",
+    rf"(?P<HEX>{_NB}(?:0x[0-9a-fA-F]+|(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{{16,}}){_NA})",
+    # "DB-001" 같은 코드 형태(영문-숫자)는 제외. "27101ms", "10KB" 처럼 영문 단위(4자 이하)가 붙은 숫자는
+    # 숫자만 치환하고 단위는 유지 ("404NotFound" 처럼 긴 영문이 붙으면 치환하지 않음)
+    rf"(?P<NUM>(?<![0-9A-Za-z_\-])[-+]?\d+(?:[,.\-]\d+)*(?=[A-Za-z]{{0,4}}{_NA}))",
+]))
+
+# 메시지 앞의 "[코드]" 접두어 (BxmApiClient._parse_logs 형식)는 치환하지 않고 유지
+_CODE_PREFIX = re.compile(r"^\[[^\]]{1,40}\]\s*")
+
+
+def _placeholder(match):
+    return f"<{match.lastgroup}>"
+
+
+class MessageTemplater:
+    """
+    정규식 마스킹 기반 메시지 템플릿 추출기 (결과 캐시 포함).
+    같은 원문 메시지는 두 번째부터 dict 조회 한 번으로 처리된다.
+    이미 템플릿화된 메시지를 다시 넣어도 결과가 같다 (멱등).
+    """
+
+    def __init__(self, max_cache=50000):
+        self.max_cache = max_cache
+        self._cache = {}
+
+    def template(self, msg):
+        """원문 메시지 -> 템플릿 (문자열이 아니면 그대로 반환)"""
+        if not isinstance(msg, str):
+            # 리스트 등 해시할 수 없는 값도 있으므로 캐시 조회 전에 확인
+            return msg
+        cached = self._cache.get(msg)
+        if cached is not None:
+            return cached
+
+        prefix = _CODE_PREFIX.match(msg)
+        if prefix:
+            result = prefix.group(0) + _VARIABLE_PATTERN.sub(_placeholder, msg[prefix.end():])
+        else:
+            result = _VARIABLE_PATTERN.sub(_placeholder, msg)
+
+        if len(self._cache) >= self.max_cache:
+            # 고유 메시지가 폭증하는 경우 캐시를 비우고 다시 채운다 (메모리 상한 유지)
+            self._cache.clear()
+        self._cache[msg] = result
+        return result
+
+    __call__ = template
+
+    def template_many(self, messages):
+        """메시지 리스트를 일괄 변환 (캐시 적중분은 C 레벨 map 으로 처리)"""
+        try:
+            results = list(map(self._cache.get, messages))
+        except TypeError:
+            # 해시할 수 없는 값이 섞인 경우 항목별로 처리
+            return list(map(self.template, messages))
+        if None in results:
+            template = self.template
+            for idx, result in enumerate(results):
+                if result is None:
+                    results[idx] = template(messages[idx])
+        return results
+
+
+# 프로세스 공용 인스턴스 (BxmApiClient 와 LogAggregator 가 캐시를 공유)
+default_templater = MessageTemplater()
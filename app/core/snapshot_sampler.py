@@ -0,0 +1,212 @@
+# app/core/snapshot_sampler.py
+"""
+그룹별 Peak Snapshot 표본 추출기.
+앞에서부터 N건을 채우는 대신, 가장 많이 발생한 분(peak minute)의 로그를 무작위 표본으로 보관한다.
+표본은 (우선순위 난수, 시각, 원문 메시지) 만 저장하고, 문자열 포맷팅은 리포트 생성 시점에만 수행한다.
+
+- 분 구간(run) 표본: bottom-k 샘플링 (난수가 가장 작은 k건 유지 = 균등 비복원 추출)
+- 전체 기간 표본(spread): 같은 방식으로 기간 전체에서 k건 유지. peak 분의 건수가 k 미만일 때 보충용
+- bottom-k 표본은 두 집합의 표본을 합쳐 다시 k건만 남기면 합집합의 표본이 되므로 병합이 가능하다.
+
+peak 분은 유입 순서상 같은 분이 연속된 구간(run) 중 최대 건수 구간이다 (BXM 조회 결과처럼 시간순 유입 기준).
+구간은 [분, 건수, 표본 힙] 리스트로 표현하며, 첫 구간/중간 최대 구간/마지막(진행 중) 구간을 따로 보관하여
+구간 경계에서 잘린 분도 병합 시 다시 이어 붙인다 (분할 방식과 무관하게 순차 처리와 같은 peak 분).
+"""
+
+import heapq
+from itertools import groupby
+from random import random, sample
+
+
+def _offer(heap, k, item):
+    """bottom-k 최대 힙(우선순위 부호 반전)에 표본 후보 추가"""
+    if len(heap) < k:
+        heapq.heappush(heap, item)
+    elif item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+
+def _union(left, right, k):
+    """두 bottom-k 표본의 합집합 표본"""
+    if not right:
+        return list(left)
+    if not left:
+        return list(right)
+    merged = heapq.nlargest(k, left + right)
+    heapq.heapify(merged)
+    return merged
+
+
+def _smallest_uniforms(n, m):
+    """n 개 균등 난수 중 가장 작은 m 개를 오름차순으로 직접 생성 (순서통계량, n 개를 만들지 않음)"""
+    result = []
+    value = 0.0
+    for j in range(m):
+        value += (1.0 - value) * (1.0 - random() ** (1.0 / (n - j)))
+        result.append(value)
+    return result
+
+
+def _copy_run(run):
+    return None if run is None else [run[0], run[1], list(run[2])]
+
+
+class SnapshotSampler:
+    """
+    ErrorGroup 하나의 스냅샷 표본.
+    first: 첫 구간 (두 번째 구간이 시작될 때 확정), peak: 첫/마지막을 제외한 최대 구간, run: 진행 중 구간
+    힙 항목: (-우선순위, 시각, 원문 메시지) - 우선순위가 작은(= 항목 값이 큰) k건을 유지
+    """
+    __slots__ = ("first", "peak", "run", "spread")
+
+    def __init__(self):
+        self.first = None
+        self.peak = None
+        self.run = None
+        self.spread = []
+
+    def _close(self, run):
+        """구간 마감: 첫 구간으로 확정하거나 중간 최대 구간과 비교"""
+        if self.first is None:
+            self.first = run
+        elif self.peak is None or run[1] > self.peak[1]:
+            self.peak = run
+
+    def add(self, k, minute, timestamp, message):
+        """
+        로그 1건 추가
+        :param k: 유지할 표본 수
+        :param minute: "YYYY-MM-DD HH:MM" 분 버킷 (시각을 해석할 수 없으면 None)
+        """
+        run = self.run
+        if run is None or run[0] != minute:
+            if run is not None:
+                self._close(run)
+            run = self.run = [minute, 0, []]
+        run[1] += 1
+        item = (-random(), timestamp, message)
+        _offer(run[2], k, item)
+        _offer(self.spread, k, item)
+
+    def add_many(self, k, indices, minutes, times, message_at):
+        """
+        배치 내 한 그룹의 로그를 일괄 추가 (원문 메시지는 표본으로 채택된 항목만 조회)
+        :param indices: 배치 내 해당 그룹 항목의 위치 (유입 순서)
+        :param minutes, times: 배치 전체의 분 버킷 / 시각 리스트
+        :param message_at: 위치 -> 원문 메시지
+        """
+        spread = self.spread
+        run = self.run
+        # 같은 분이 연속된 구간 단위로 처리: 구간 n 건 중 후보가 될 수 있는 최소 우선순위 k 개만 생성하여
+        # 무작위 위치에 배정 (항목마다 난수를 만드는 것과 같은 분포)
+        for minute, segment in groupby(indices, minutes.__getitem__):
+            segment = list(segment)
+            if run is None or run[0] != minute:
+                if run is not None:
+                    self._close(run)
+                run = self.run = [minute, 0, []]
+            size = len(segment)
+            run[1] += size
+            samples = run[2]
+            if size <= k and not samples:
+                # 새 구간의 건수가 k 이하면 전부 표본 (분 단위 카디널리티가 높은 경우의 주 경로)
+                samples.extend([(-random(), times[i], message_at(i)) for i in segment])
+                heapq.heapify(samples)
+                for item in samples:
+                    if len(spread) < k or item > spread[0]:
+                        _offer(spread, k, item)
+                continue
+            # 후보는 우선순위가 높은(난수가 작은) 순서로 정렬
+            if size <= k:
+                candidates = sorted(((-random(), i) for i in segment), reverse=True)
+            else:
+                candidates = zip([-value for value in _smallest_uniforms(size, k)], sample(segment, k))
+            for priority, i in candidates:
+                # 두 표본 모두 가득 찼고 기존 표본보다 우선순위가 낮으면 이후 후보도 모두 탈락
+                if (len(samples) >= k and len(spread) >= k
+                        and priority <= samples[0][0] and priority <= spread[0][0]):
+                    break
+                item = (priority, times[i], message_at(i))
+                _offer(samples, k, item)
+                _offer(spread, k, item)
+
+    def merge(self, other, k):
+        """
+        뒤 구간(other)의 표본을 병합 (self 의 마지막 구간과 other 의 첫 구간이 같은 분이면 이어 붙임).
+        """
+        self.spread = _union(self.spread, other.spread, k)
+        if other.run is None:
+            return
+        if self.run is None:
+            self.first, self.peak, self.run = _copy_run(other.first), _copy_run(other.peak), _copy_run(other.run)
+            return
+
+        head = other.first if other.first is not None else other.run
+        boundary = [self.run]
+        if head[0] == self.run[0]:
+            boundary = [[head[0], self.run[1] + head[1], _union(self.run[2], head[2], k)]]
+        else:
+            boundary.append(_copy_run(head))
+
+        if other.first is None:
+            # other 가 단일 구간: 이어 붙였으면 진행 중 구간 연장, 아니면 self 구간 마감
+            self.run = boundary[-1]
+            if len(boundary) == 2:
+                self._close(boundary[0])
+            return
+
+        # 시간 순서대로 마감하여 첫 구간/중간 최대 구간을 결정 (동률이면 앞 구간 우선)
+        for run in boundary:
+            self._close(run)
+        if other.peak is not None:
+            self._close(_copy_run(other.peak))
+        self.run = _copy_run(other.run)
+
+    def copy(self):
+        clone = SnapshotSampler()
+        clone.first, clone.peak, clone.run = _copy_run(self.first), _copy_run(self.peak), _copy_run(self.run)
+        clone.spread = list(self.spread)
+        return clone
+
+    def best(self):
+        """(peak 분, 건수, 표본 힙) - 전체 구간 중 최대 건수 구간 (동률이면 앞 구간)"""
+        best = None
+        for run in (self.first, self.peak, self.run):
+            if run is not None and (best is None or run[1] > best[1]):
+                best = run
+        return tuple(best) if best is not None else (None, 0, [])
+
+    def samples(self, k):
+        """
+        리포트용 표본 [(시각, 원문 메시지), ...] - peak 분 표본을 우선하고 부족하면 전체 기간 표본으로 보충.
+        시각 순으로 정렬하여 반환한다.
+        """
+        _minute, _count, peak = self.best()
+        chosen = sorted(peak, reverse=True)[:k]
+        if len(chosen) < k:
+            seen = set(chosen)
+            chosen.extend(item for item in sorted(self.spread, reverse=True) if item not in seen)
+            chosen = chosen[:k]
+        return sorted(((ts, msg) for _priority, ts, msg in chosen), key=lambda sample: str(sample[0]))
+
+    def to_state(self):
+        def run_state(run):
+            return None if run is None else [run[0], run[1], [list(item) for item in run[2]]]
+        return [run_state(self.first), run_state(self.peak), run_state(self.run),
+                [list(item) for item in self.spread]]
+
+    @classmethod
+    def from_state(cls, state):
+        def restore(items):
+            heap = [tuple(item) for item in items]
+            heapq.heapify(heap)
+            return heap
+
+        def restore_run(run):
+            return None if run is None else [run[0], run[1], restore(run[2])]
+
+        sampler = cls()
+        first, peak, run, spread = state
+        sampler.first, sampler.peak, sampler.run = restore_run(first), restore_run(peak), restore_run(run)
+        sampler.spread = restore(spread)
+        return sampler
@@ -0,0 +1,355 @@
+# app/core/time_series.py
+"""
+에러 발생 추이를 저장하는 배열 기반 시계열 저장소.
+시리즈(= (code, msg) 키)마다 정수 배열 하나를 두고, 버킷 오프셋(기준 시각 대비)을 인덱스로 사용한다.
+분 단위 외에 5분/1시간/1일 롤업을 로그 유입 시점에 함께 갱신하여, 조회 기간에 맞는 해상도를
+원본 데이터 재집계 없이 바로 꺼낼 수 있다.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from operator import add
+
+# 카운트 배열 타입코드 (플랫폼과 무관하게 8바이트 정수)
+COUNT_TYPECODE = "q"
+MINUTES_PER_DAY = 1440
+MINUTE_FORMAT = "%Y-%m-%d %H:%M"
+
+# 유지하는 롤업 해상도 (분 단위): 1분, 5분, 1시간, 1일
+ROLLUP_STEPS = (1, 5, 60, MINUTES_PER_DAY)
+# add() 로 쌓인 (버킷, 시리즈) 미반영 카운트가 이 개수를 넘으면 배열에 반영
+PENDING_FLUSH_SIZE = 4096
+# 차트 한 장에 그릴 최대 포인트 수 (이를 넘지 않는 가장 세밀한 해상도를 선택)
+MAX_CHART_POINTS = 120
+
+
+def parse_minute(text):
+    """
+    "YYYY-MM-DD HH:MM[...]" 문자열 -> 절대 분 인덱스 (파싱 불가 시 None)
+    """
+    try:
+        dt = datetime.fromisoformat(text[:16])
+    except (TypeError, ValueError):
+        return None
+    return dt.toordinal() * MINUTES_PER_DAY + dt.hour * 60 + dt.minute
+
+
+def minute_to_datetime(minute):
+    """절대 분 인덱스 -> datetime"""
+    day, rest = divmod(minute, MINUTES_PER_DAY)
+    return datetime.fromordinal(day) + timedelta(minutes=rest)
+
+
+def format_minute(minute):
+    """절대 분 인덱스 -> "YYYY-MM-DD HH:MM" """
+    return minute_to_datetime(minute).strftime(MINUTE_FORMAT)
+
+
+def _zeros(length):
+    return array(COUNT_TYPECODE, [0]) * length
+
+
+class _CountGrid:
+    """
+    step 분 단위 버킷의 시리즈별 카운트 배열.
+    시리즈마다 실제로 값이 들어온 버킷 구간만 배열로 보관한다 (starts[idx] = 배열 0번의 버킷 번호).
+    메시지별로 한두 번만 발생하는 시리즈가 수만 개여도 조회 기간 전체 길이의 배열을 만들지 않는다.
+    - lo / hi: 전체 시리즈 기준 데이터가 존재하는 버킷 범위 (내보내기 시 이 범위로 정렬)
+    """
+
+    def __init__(self, step):
+        self.step = step
+        self.lo = None
+        self.hi = None
+        self.series = []
+        self.starts = []
+        # 조회 기간 (버킷 번호). 배열 확장 시 여유분이 이 범위를 넘지 않도록 제한
+        self.win_lo = None
+        self.win_hi = None
+
+    def set_window(self, start_minute, end_minute):
+        self.win_lo = start_minute // self.step
+        self.win_hi = end_minute // self.step
+
+    def add_series(self):
+        self.series.append(_zeros(0))
+        self.starts.append(None)
+
+    def _ensure(self, idx, lo, hi):
+        """시리즈 배열이 [lo, hi] 버킷을 포함하도록 (여유분을 두고) 확장한 뒤 (배열, 시작 버킷) 반환"""
+        counts = self.series[idx]
+        start = self.starts[idx]
+        if start is None:
+            counts = self.series[idx] = _zeros(hi - lo + 1)
+            self.starts[idx] = lo
+            return counts, lo
+        end = start + len(counts) - 1
+        if lo < start:
+            new_start = lo - len(counts) // 2
+            if self.win_lo is not None:
+                new_start = max(new_start, min(self.win_lo, lo))
+            counts = self.series[idx] = _zeros(start - new_start) + counts
+            start = self.starts[idx] = new_start
+        if hi > end:
+            new_end = hi + len(counts) // 2
+            if self.win_hi is not None:
+                new_end = min(new_end, max(self.win_hi, hi))
+            counts.extend(_zeros(new_end - end))
+        return counts, start
+
+    def _touch(self, lo, hi):
+        if self.lo is None:
+            self.lo, self.hi = lo, hi
+        else:
+            if lo < self.lo:
+                self.lo = lo
+            if hi > self.hi:
+                self.hi = hi
+
+    def add(self, bucket, idx, count):
+        counts = self.series[idx]
+        start = self.starts[idx]
+        if start is None or not (0 <= bucket - start < len(counts)):
+            counts, start = self._ensure(idx, bucket, bucket)
+        counts[bucket - start] += count
+        self._touch(bucket, bucket)
+
+    def add_counts(self, start_bucket, idx, counts):
+        """start_bucket 부터 연속된 카운트 배열을 합산 (병합용)"""
+        if not counts:
+            return
+        width = len(counts)
+        end_bucket = start_bucket + width - 1
+        dst, dst_start = self._ensure(idx, start_bucket, end_bucket)
+        offset = start_bucket - dst_start
+        dst[offset:offset + width] = array(COUNT_TYPECODE, map(add, dst[offset:offset + width], counts))
+        self._touch(start_bucket, end_bucket)
+
+    def window(self, idx):
+        """시리즈의 [lo, hi] 구간 카운트 배열 (전체 시리즈 공통 구간으로 정렬한 복사본)"""
+        out = _zeros(self.hi - self.lo + 1)
+        counts = self.series[idx]
+        start = self.starts[idx]
+        if start is not None:
+            first = max(start, self.lo)
+            last = min(start + len(counts) - 1, self.hi)
+            if first <= last:
+                out[first - self.lo:last - self.lo + 1] = counts[first - start:last - start + 1]
+        return out
+
+    def discard(self, idx):
+        """idx 시리즈 제거 (마지막 시리즈를 빈 자리로 이동)"""
+        last_counts = self.series.pop()
+        last_start = self.starts.pop()
+        if idx < len(self.series):
+            self.series[idx] = last_counts
+            self.starts[idx] = last_start
+
+    @property
+    def span(self):
+        return 0 if self.lo is None else self.hi - self.lo + 1
+
+
+class TimeSeriesStore:
+    """
+    시리즈별 카운트 배열 저장소 (해상도별 _CountGrid 를 함께 유지).
+    - series_index: 시리즈 키 -> 각 grid.series 리스트 인덱스
+    """
+
+    def __init__(self, window_start=None, window_end=None):
+        self.series_index = {}
+        self.series_keys = []
+        self.grids = {step: _CountGrid(step) for step in ROLLUP_STEPS}
+        self.minutes = self.grids[1]
+        # 버킷 문자열 -> 절대 분 인덱스 캐시 (같은 분의 로그는 파싱 1회)
+        self._minute_cache = {}
+        # {(버킷 문자열, 시리즈 키): count} - 로그 단위 add() 를 모아 두었다가 한 번에 롤업 갱신
+        self._pending = {}
+        # 증분 내보내기: 마지막 export 이후 값이 바뀐 시리즈 키 / (해상도, lo, hi, {시리즈 키: 배열}) 캐시
+        self._changed = set()
+        self._export_cache = None
+
+        # 조회 기간을 알고 있으면 배열 확장 시 기간 밖으로 여유분을 잡지 않는다
+        start = parse_minute(window_start) if window_start else None
+        end = parse_minute(window_end) if window_end else None
+        if start is not None and end is not None and end >= start:
+            for grid in self.grids.values():
+                grid.set_window(start, end)
+
+    def __bool__(self):
+        self.flush()
+        return self.minutes.lo is not None
+
+    @property
+    def lo(self):
+        self.flush()
+        return self.minutes.lo
+
+    @property
+    def hi(self):
+        self.flush()
+        return self.minutes.hi
+
+    def minute_of(self, bucket):
+        minute = self._minute_cache.get(bucket)
+        if minute is None and bucket not in self._minute_cache:
+            minute = self._minute_cache[bucket] = parse_minute(bucket)
+        return minute
+
+    def _series_idx(self, series_key):
+        idx = self.series_index.get(series_key)
+        if idx is None:
+            idx = self.series_index[series_key] = len(self.series_keys)
+            self.series_keys.append(series_key)
+            for grid in self.grids.values():
+                grid.add_series()
+        return idx
+
+    def add_minute(self, minute, series_key, count=1):
+        """절대 분 인덱스에 count 추가 (모든 롤업 해상도를 함께 갱신)"""
+        idx = self._series_idx(series_key)
+        for step, grid in self.grids.items():
+            grid.add(minute // step, idx, count)
+        self._changed.add(series_key)
+
+    def add(self, bucket, series_key, count=1):
+        """
+        "YYYY-MM-DD HH:MM" 버킷에 count 추가.
+        같은 (버킷, 시리즈) 는 미반영 버퍼에서 합산한 뒤 flush() 시 모든 해상도에 한 번에 반영한다.
+        """
+        pending = self._pending
+        pending_key = (bucket, series_key)
+        pending[pending_key] = pending.get(pending_key, 0) + count
+        if len(pending) >= PENDING_FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """미반영 버퍼를 배열에 반영. 차트에서 그릴 수 없는(파싱 불가) 버킷은 무시한다."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for (bucket, series_key), count in pending.items():
+            minute = self.minute_of(bucket)
+            if minute is not None:
+                self.add_minute(minute, series_key, count)
+
+    def discard(self, series_key):
+        """시리즈 제거 (bounded 모드에서 추적 대상이 아닌 그룹의 시계열 메모리 회수용)"""
+        self.flush()
+        idx = self.series_index.pop(series_key, None)
+        if idx is None:
+            return
+        self._changed.discard(series_key)
+        if self._export_cache is not None:
+            self._export_cache[3].pop(series_key, None)
+        # 마지막 시리즈를 빈 자리로 옮겨 인덱스를 촘촘하게 유지
+        last = len(self.series_keys) - 1
+        last_key = self.series_keys.pop()
+        for grid in self.grids.values():
+            grid.discard(idx)
+        if idx != last:
+            self.series_keys[idx] = last_key
+            self.series_index[last_key] = idx
+
+    def nbytes(self):
+        """카운트 배열이 차지하는 메모리 (바이트, 모든 해상도 합계)"""
+        self.flush()
+        itemsize = array(COUNT_TYPECODE).itemsize
+        return sum(sum(map(len, grid.series)) for grid in self.grids.values()) * itemsize
+
+    def counts(self, series_key, step=1):
+        """시리즈의 데이터 구간 카운트 배열 복사본 (없으면 None)"""
+        self.flush()
+        idx = self.series_index.get(series_key)
+        grid = self.grids[step]
+        if idx is None or grid.lo is None:
+            return None
+        return grid.window(idx)
+
+    def merge(self, other):
+        """다른 저장소의 카운트를 해상도별로 합산"""
+        self.flush()
+        if not other:
+            return self
+        for other_idx, series_key in enumerate(other.series_keys):
+            idx = self._series_idx(series_key)
+            for step, grid in self.grids.items():
+                other_grid = other.grids[step]
+                grid.add_counts(other_grid.lo, idx, other_grid.window(other_idx))
+            self._changed.add(series_key)
+        return self
+
+    def pick_step(self, max_points=MAX_CHART_POINTS):
+        """데이터 구간이 max_points 버킷 이내가 되는 가장 세밀한 해상도 (분)"""
+        self.flush()
+        for step in ROLLUP_STEPS:
+            if self.grids[step].span <= max_points:
+                return step
+        return ROLLUP_STEPS[-1]
+
+    def export(self, id_mapping, step=None, max_points=MAX_CHART_POINTS, changed_only=False):
+        """
+        차트용 밀집 시계열로 변환. 시리즈 키 -> ErrorID 변환은 배열 재구성 없이 인덱스 매핑만 수행.
+        직전 export 와 해상도/구간이 같으면 그 이후 바뀐 시리즈만 리스트를 다시 만든다
+        (JSON 직렬화 가능한 list 로 반환. 다음 export 와 공유되므로 읽기 전용으로 사용).
+        :param id_mapping: {series_key: "ErrorNN"}
+        :param step: 해상도 (분). None 이면 데이터 구간에 맞춰 자동 선택
+        :param changed_only: True 면 직전 export 이후 바뀐 시리즈만 포함
+                             (해상도/구간이 바뀌었으면 모든 시리즈가 바뀐 것으로 간주)
+        :return: {"start": "YYYY-MM-DD HH:MM", "step_minutes": 5, "series": {"Error01": [5, 0, 1, ...], ...}}
+                 데이터가 없으면 빈 dict
+        """
+        if not self:
+            return {}
+        if step is None:
+            step = self.pick_step(max_points)
+        grid = self.grids[step]
+
+        cache = self._export_cache
+        if cache is not None and cache[:3] == (step, grid.lo, grid.hi):
+            arrays, changed = cache[3], self._changed
+        else:
+            arrays, changed = {}, self.series_index
+            self._export_cache = (step, grid.lo, grid.hi, arrays)
+        for series_key in changed:
+            arrays[series_key] = grid.window(self.series_index[series_key]).tolist()
+        self._changed = set()
+
+        series = {}
+        for series_key in (changed if changed_only else arrays):
+            error_id = id_mapping.get(series_key)
+            if error_id is not None:
+                series[error_id] = arrays[series_key]
+        return {
+            "start": format_minute(grid.lo * step),
+            "step_minutes": step,
+            "series": series,
+        }
+
+    def to_state(self):
+        """분 단위 배열만 저장 (롤업은 복원 시 분 배열로부터 재계산)"""
+        self.flush()
+        minutes = self.minutes
+        if minutes.lo is None:
+            return {"start": None, "series": []}
+        return {
+            "start": minutes.lo,
+            "series": [[list(key), minutes.window(idx).tolist()]
+                       for idx, key in enumerate(self.series_keys)],
+        }
+
+    @classmethod
+    def from_state(cls, state, key_factory=tuple):
+        store = cls()
+        start = state.get("start")
+        if start is None:
+            return store
+        for key, counts in state["series"]:
+            idx = store._series_idx(key_factory(key))
+            store.minutes.add_counts(start, idx, array(COUNT_TYPECODE, counts))
+            for minute, count in enumerate(counts, start):
+                if count:
+                    for step, grid in store.grids.items():
+                        if step != 1:
+                            grid.add(minute // step, idx, count)
+        return store
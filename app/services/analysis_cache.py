@@ -0,0 +1,106 @@
+# app/services/analysis_cache.py
+"""
+Dify 분석 결과 디스크 캐시.
+같은 워크플로(URL + API 키)에 같은 이슈 그룹 입력을 보낸 적이 있으면 저장된 result 를 그대로 재사용하여
+같은 기간 재실행이나 변화 없는 이슈 재분석 시 워크플로를 다시 호출하지 않는다.
+
+- 키: 워크플로 식별값과 이슈 그룹의 정규화 JSON(키 정렬, 공백 없음)의 SHA-256
+    peak_snapshot 은 무작위 표본이라 실행마다 달라지므로 키에서 제외
+- 요청 단위(chunk_key): 요청 하나에 담긴 이슈 목록 전체 (error_id 포함)
+- 그룹 단위(group_key): 이슈 그룹 하나 (순위에 따라 바뀌는 error_id 제외) - 새로 생기거나 바뀐 그룹만 분석할 때 사용
+- 파일 형식: {"stored_at": epoch 초, "result": 결과} JSON. ttl_sec 이 지나면 만료 (0 이면 만료 없음)
+- 저장 위치 / 크기 한도 / 정리 방식은 DiskLruCache 참고
+"""
+
+import hashlib
+import json
+import time
+
+from app.utils.disk_cache import DiskLruCache, shared_instance
+
+
+def _canonical_issue(issue, keep_error_id):
+    """키 계산용 issue dict (무작위 표본인 peak_snapshot 제외)"""
+    canonical = {name: value for name, value in issue.items() if keep_error_id or name != "error_id"}
+    time_context = issue.get("time_context")
+    if isinstance(time_context, dict):
+        canonical["time_context"] = {name: value for name, value in time_context.items() if name != "peak_snapshot"}
+    return canonical
+
+
+class AnalysisCache(DiskLruCache):
+    """
+    사용 예)
+        cache = AnalysisCache("data/analysis_cache")
+        key = cache.chunk_key(workflow, issues)
+        result = cache.get(key)
+        if result is AnalysisCache.MISS:
+            result = ... # 워크플로 호출
+            cache.put(key, result)
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+    SUFFIX = ".json"
+    # 저장된 결과가 None / 빈 리스트일 수 있으므로 미적중은 별도 값으로 구분
+    MISS = object()
+
+    def __init__(self, cache_dir, max_bytes=64 * 1024 * 1024, ttl_sec=0):
+        """
+        :param max_bytes: 캐시 디렉터리 전체 크기 상한
+        :param ttl_sec: 결과 유효 시간 (초, 0 이면 만료 없음)
+        """
+        super().__init__(cache_dir, max_bytes)
+        self.ttl_sec = ttl_sec
+
+    @staticmethod
+    def workflow_id(url, authorization=None):
+        """워크플로 식별값 (Dify 클라우드는 URL 이 같고 API 키로 앱을 구분하므로 함께 사용)"""
+        return f"{(url or '').rstrip('/')}\x1f{authorization or ''}"
+
+    @staticmethod
+    def _digest(kind, workflow, value):
+        text = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{kind}\x1f{workflow}\x1f{text}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def chunk_key(cls, workflow, issues):
+        """요청 하나(이슈 목록 전체)의 키"""
+        return cls._digest("chunk", workflow, [_canonical_issue(issue, True) for issue in issues])
+
+    @classmethod
+    def group_key(cls, workflow, issue):
+        """이슈 그룹 하나의 키 (error_id 제외)"""
+        return cls._digest("group", workflow, _canonical_issue(issue, False))
+
+    def get(self, key):
+        """:return: 저장된 결과. 없거나 만료/손상되었으면 AnalysisCache.MISS"""
+        path = self._path(key)
+        try:
+            data = self._read(path)
+            if data is None:
+                self._record_miss()
+                return self.MISS
+            entry = json.loads(data)
+            stored_at = entry["stored_at"]
+            result = entry["result"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # 손상된 파일은 지우고 다시 분석
+            self._record_miss(path)
+            return self.MISS
+        if self.ttl_sec > 0 and time.time() - stored_at > self.ttl_sec:
+            self._record_miss()
+            return self.MISS
+        self._record_hit(path)
+        return result
+
+    def put(self, key, result):
+        """:return: 저장 여부 (JSON 으로 저장할 수 없는 결과는 저장하지 않음)"""
+        try:
+            data = json.dumps({"stored_at": time.time(), "result": result}, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError):
+            return False
+        return self._write(self._path(key), data)
+
+
+def shared_analysis_cache(cache_dir, **options):
+    """디렉터리별 공유 AnalysisCache (옵션은 처음 생성할 때만 적용)"""
+    return shared_instance(AnalysisCache, cache_dir, **options)
@@ -1,6 +1,6 @@
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 
 class ChartGenerator:
@@ -25,35 +25,29 @@ class ChartGenerator:
 
     def generate_time_series_chart(self, time_series_data, top_n=5):
         """
-        :param time_series_data: { "YYYY-MM-DD HH:MM": {"ERR01": 5, "ERR02": 1}, ... }
+        :param time_series_data: LogAggregator.export_to_dify_format()의 time_series_data
+            { "start": "YYYY-MM-DD HH:MM", "step_minutes": 1, "series": {"Error01": [5, 0, 1, ...], ...} }
+            step_minutes 는 조회 기간에 맞춰 집계기가 선택한 해상도 (1분/5분/1시간/1일)
         :return: 생성된 이미지 파일 경로
         """
-        if not time_series_data:
+        if not time_series_data or not time_series_data.get("series"):
             return None
 
         # 1. 데이터 전처리
-        # 시간순 정렬
-        sorted_times = sorted(time_series_data.keys())
-        
-        # 상위 N개 에러 코드 추출 (전체 기간 합산 기준)
-        error_totals = {}
-        for t_data in time_series_data.values():
-            for code, count in t_data.items():
-                error_totals[code] = error_totals.get(code, 0) + count
-        
-        top_errors = sorted(error_totals.items(), key=lambda x: x[1], reverse=True)[:top_n]
-        target_codes = [code for code, count in top_errors]
+        series = time_series_data["series"]
+
+        # 상위 N개 에러 코드 추출 (전체 기간 합산 기준) - 배열 합계를 그대로 사용
+        top_errors = sorted(series.items(), key=lambda x: sum(x[1]), reverse=True)[:top_n]
 
         # 플롯 데이터 구성
-        # x_values: datetime 객체 리스트
-        x_values = [datetime.strptime(t, "%Y-%m-%d %H:%M") for t in sorted_times]
-        
-        y_values_map = {code: [] for code in target_codes}
-        
-        for t in sorted_times:
-            counts = time_series_data[t]
-            for code in target_codes:
-                y_values_map[code].append(counts.get(code, 0))
+        # x_values: 시작 시각 + 인덱스 * 간격 (배열 인덱스가 곧 시간 오프셋)
+        start = datetime.strptime(time_series_data["start"], "%Y-%m-%d %H:%M")
+        step_minutes = time_series_data.get("step_minutes", 1)
+        step = timedelta(minutes=step_minutes)
+        length = max(len(counts) for _code, counts in top_errors)
+        x_values = [start + step * i for i in range(length)]
+
+        y_values_map = {code: counts for code, counts in top_errors}
 
         # 2. 차트 그리기
         plt.figure(figsize=(10, 5)) # 가로로 긴 형태
@@ -65,8 +59,14 @@ class ChartGenerator:
         plt.xlabel("시간 (Time)", fontsize=10)
         plt.ylabel("발생 횟수 (Count)", fontsize=10)
         
-        # X축 포맷팅 (시간)
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        # X축 포맷팅 (해상도/기간에 따라 날짜 표시)
+        if step_minutes >= 1440:
+            x_format = '%m-%d'
+        elif x_values[-1].date() != x_values[0].date():
+            x_format = '%m-%d %H:%M'
+        else:
+            x_format = '%H:%M'
+        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter(x_format))
         plt.gcf().autofmt_xdate() # 라벨 겹침 방지 (회전)
         
         plt.grid(True, linestyle='--', alpha=0.7)
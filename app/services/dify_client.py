@@ -2,16 +2,37 @@
 
 import requests
 import json
+import queue
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.analysis_cache import AnalysisCache
+from app.services.dify_payload import IssuePayloadBuilder
 
 class DifyClient:
-    def __init__(self, api_config, logger=None):
+    def __init__(self, api_config, logger=None, payload_builder=None, max_parallel=4, metrics=None,
+                 analysis_cache=None, per_group_cache=False):
+        """
+        :param payload_builder: IssuePayloadBuilder (None 이면 기본 예산)
+        :param max_parallel: 이슈 그룹이 여러 묶음으로 나뉠 때 동시에 보낼 요청 수
+        :param metrics: ScanMetrics (지정 시 묶음 수 / 전송 크기 / 캐시 적중 기록)
+        :param analysis_cache: AnalysisCache (지정 시 같은 입력의 분석 결과 재사용)
+        :param per_group_cache: True 면 요청 단위가 아닌 이슈 그룹 단위로 캐시 (결과 항목에 error_id 가 있어야 함)
+        """
         self.url = api_config.get("url")
         self.headers = {
             "Authorization": api_config.get("authorization"),
             "Content-Type": api_config.get("content_type", "application/json")
         }
         self.logger = logger
+        self.payload_builder = payload_builder or IssuePayloadBuilder()
+        self.max_parallel = max(1, max_parallel)
+        self.metrics = metrics
+        self.cache = analysis_cache
+        # 마지막 분석에서 max_chunks 제한으로 제외한 이슈 그룹 수
+        self.omitted_groups = 0
+        self.per_group_cache = per_group_cache
 
     def _log(self, message: str, level: str = "INFO"):
         if self.logger:
@@ -26,9 +47,233 @@ class DifyClient:
           - 'process': 진행 상황 메시지
           - 'result': 최종 분석 결과 (JSON 객체)
           - 'error': 에러 메시지
+
+        issue_groups 는 IssuePayloadBuilder 로 예산 안에 맞추며, 여러 묶음으로 나뉘면
+        최대 max_parallel 개씩 동시에 요청하고 결과 리스트를 묶음 순서대로 합쳐 한 번만 'result' 로 전달한다.
+        analysis_cache 가 있으면 같은 입력의 요청은 저장된 결과로 대신한다
+        (per_group_cache 면 이슈 그룹 단위로 캐시하여 새로 생기거나 바뀐 그룹만 분석).
+        payload_builder 에 max_chunks 가 지정되어 제외된 이슈 그룹 수는 omitted_groups 로 확인한다.
+        """
+        issue_groups = aggregator_data.get("issue_groups", [])
+        self.omitted_groups = 0
+        if self.cache is not None and self.per_group_cache:
+            yield from self._analyze_per_group(issue_groups, user_id)
+            return
+
+        chunks = self._build_chunks(issue_groups)
+        results = {}
+        keys = None
+        if self.cache is not None:
+            workflow = self._workflow_id()
+            keys = [AnalysisCache.chunk_key(workflow, json.loads(chunk)) for chunk in chunks]
+            for index, key in enumerate(keys):
+                cached = self.cache.get(key)
+                if cached is not AnalysisCache.MISS:
+                    results[index] = cached
+            self._count_cache(len(results), len(chunks) - len(results))
+            if results:
+                yield ('process', f"캐시된 분석 결과 사용 ({len(results)}/{len(chunks)}개 요청)")
+
+        pending = [index for index in range(len(chunks)) if index not in results]
+        fresh = yield from self._run_requests([chunks[index] for index in pending], user_id)
+        for position, result in fresh.items():
+            index = pending[position]
+            results[index] = result
+            if keys is not None:
+                self.cache.put(keys[index], result)
+
+        if not results:
+            return
+        if len(results) < len(chunks):
+            self._log(f"[Dify] {len(chunks)}개 요청 중 {len(chunks) - len(results)}개 분석 결과 없음", "WARN")
+        if len(chunks) == 1:
+            yield ('result', results[0])
+        else:
+            yield ('result', self._merge_results([results[index] for index in sorted(results)]))
+
+    def _analyze_per_group(self, issue_groups, user_id):
+        """
+        이슈 그룹 단위 캐시: 캐시에 없는 그룹만 분석 요청하고, 결과 항목은 error_id 로 그룹에 나누어 저장.
+        결과는 현재 이슈 순서대로 (저장된 항목의 error_id 는 이번 순위의 ID 로 바꿔) 합친다.
+        - 결과 항목이 하나도 연결되지 않은 그룹은 저장하지 않음 (다음 실행에서 다시 분석)
+        - error_id 로 나눌 수 없는 결과(error_id 없는 항목, 리스트가 아닌 결과)는 요청 단위(chunk_key)로 저장
+        """
+        workflow = self._workflow_id()
+        keys = [AnalysisCache.group_key(workflow, issue) for issue in issue_groups]
+        cached = {}
+        for key in keys:
+            result = self.cache.get(key)
+            if result is not AnalysisCache.MISS:
+                cached[key] = result
+        pending = [issue for issue, key in zip(issue_groups, keys) if key not in cached]
+
+        grouped = {}   # {error_id: 이번 실행에서 받은 결과 항목}
+        extra = []
+        if pending:
+            chunks = self._build_chunks(pending)
+            chunk_issues = [json.loads(chunk) for chunk in chunks]
+            chunk_keys = [AnalysisCache.chunk_key(workflow, issues) for issues in chunk_issues]
+            results = {}
+            for index, key in enumerate(chunk_keys):
+                result = self.cache.get(key)
+                if result is not AnalysisCache.MISS:
+                    results[index] = result
+            hits = len(issue_groups) - len(pending) + sum(len(chunk_issues[index]) for index in results)
+            self._count_cache(hits, len(issue_groups) - hits)
+            if hits:
+                yield ('process', f"캐시된 분석 결과 사용 (이슈 그룹 {hits}/{len(issue_groups)}개, "
+                                  f"신규/변경 {len(issue_groups) - hits}개만 분석)")
+
+            sent = [index for index in range(len(chunks)) if index not in results]
+            fresh = yield from self._run_requests([chunks[index] for index in sent], user_id)
+            for position, result in fresh.items():
+                results[sent[position]] = result
+            if not results and not cached:
+                return
+            if len(fresh) < len(sent):
+                self._log(f"[Dify] {len(sent)}개 요청 중 {len(sent) - len(fresh)}개 분석 결과 없음", "WARN")
+
+            key_by_error_id = {issue.get("error_id"): key for issue, key in zip(issue_groups, keys) if key not in cached}
+            received = {sent[position] for position in fresh}
+            for index in sorted(results):
+                items_by_id, unmatched = self._split_by_error_id(
+                    results[index], [issue.get("error_id") for issue in chunk_issues[index]])
+                grouped.update(items_by_id)
+                extra.extend(unmatched)
+                if index not in received:
+                    continue
+                if unmatched:
+                    # 그룹별로 나눌 수 없으면 요청 전체를 저장 (같은 그룹 구성으로 다시 요청할 때 재사용)
+                    self.cache.put(chunk_keys[index], results[index])
+                else:
+                    for error_id, items in items_by_id.items():
+                        self.cache.put(key_by_error_id[error_id], items)
+        else:
+            self._count_cache(len(issue_groups), 0)
+            if issue_groups:
+                yield ('process', f"캐시된 분석 결과 사용 (이슈 그룹 {len(issue_groups)}/{len(issue_groups)}개)")
+
+        merged = []
+        for issue, key in zip(issue_groups, keys):
+            error_id = issue.get("error_id")
+            items = cached[key] if key in cached else grouped.get(error_id, [])
+            for item in items:
+                merged.append(dict(item, error_id=error_id) if isinstance(item, dict) and "error_id" in item else item)
+        merged.extend(extra)
+        yield ('result', merged)
+
+    @staticmethod
+    def _split_by_error_id(result, error_ids):
+        """
+        요청 하나의 결과를 error_id 별 항목으로 나눔
+        :return: ({error_id: 항목 리스트} (항목이 있는 그룹만), 어느 그룹에도 연결되지 않은 항목 리스트)
+        """
+        known = set(error_ids)
+        items_by_id = {}
+        unmatched = []
+        for item in DifyClient._merge_results([result]):
+            error_id = item.get("error_id") if isinstance(item, dict) else None
+            if error_id in known:
+                items_by_id.setdefault(error_id, []).append(item)
+            else:
+                unmatched.append(item)
+        return items_by_id, unmatched
+
+    def _workflow_id(self):
+        return AnalysisCache.workflow_id(self.url, self.headers.get("Authorization"))
+
+    def _count_cache(self, hits, misses):
+        if self.metrics is not None:
+            self.metrics.add("dify_cache_hits", hits)
+            self.metrics.add("dify_cache_misses", misses)
+
+    def _build_chunks(self, issue_groups):
+        """issue_groups 를 요청 크기 예산에 맞춘 묶음(JSON 문자열) 리스트로 변환"""
+        chunks, omitted = self.payload_builder.build(issue_groups)
+        self.omitted_groups = omitted
+        if self.metrics is not None:
+            self.metrics.set("dify_chunks", len(chunks))
+            self.metrics.set("dify_payload_bytes", sum(len(chunk.encode("utf-8")) for chunk in chunks))
+            self.metrics.set("dify_omitted_groups", omitted)
+        if omitted:
+            self._log(f"[Dify] 분석 요청 최대 {len(chunks)}건 제한으로 발생 건수 하위 이슈 그룹 {omitted}개 제외", "WARN")
+        return chunks
+
+    def _run_requests(self, chunks, user_id):
+        """
+        묶음별 요청 실행. 진행/오류 이벤트는 그대로 전달하고 결과는 모아서 반환
+        하나면 바로 스트리밍하고, 여럿이면 병렬로 실행하여 이벤트를 도착 순서대로 전달
+        (호출 측이 중간에 반복을 멈추면 남은 요청은 취소)
+        :return: {묶음 순번: 결과} (결과를 받지 못한 묶음은 제외)
+        """
+        results = {}
+        if not chunks:
+            return results
+        sizes = [len(chunk.encode("utf-8")) for chunk in chunks]
+        if len(chunks) == 1:
+            self._log(f"[Dify] 스트리밍 요청 시작: {self.url} ({sizes[0] / 1024:.1f}KB)", "INFO")
+            for status, data in self._stream_request(chunks[0], user_id):
+                if status == 'result':
+                    results[0] = data
+                else:
+                    yield (status, data)
+            return results
+
+        total = len(chunks)
+        self._log(f"[Dify] 이슈 그룹을 {total}개 요청으로 나누어 분석 "
+                  f"(요청당 최대 {max(sizes) / 1024:.1f}KB, 동시 {min(self.max_parallel, total)}건)", "INFO")
+        events = queue.Queue()
+        stop = threading.Event()
+
+        def run(index, chunk):
+            label = f"[{index + 1}/{total}]"
+            try:
+                for status, data in self._stream_request(chunk, user_id, stop):
+                    if status == 'process':
+                        events.put(('process', f"{label} {data}", index))
+                    elif status == 'result':
+                        events.put(('result', data, index))
+                    else:
+                        events.put(('error', f"{label} {data}", index))
+            except Exception as e:
+                events.put(('error', f"{label} {e}", index))
+            finally:
+                events.put(('done', None, index))
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_parallel, total), thread_name_prefix="dify")
+        try:
+            for index, chunk in enumerate(chunks):
+                executor.submit(run, index, chunk)
+            remaining = total
+            while remaining:
+                status, data, index = events.get()
+                if status == 'done':
+                    remaining -= 1
+                elif status == 'result':
+                    results[index] = data
+                else:
+                    yield (status, data)
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    @staticmethod
+    def _merge_results(results):
+        """묶음별 분석 결과를 하나의 리스트로 합침 (리스트가 아닌 결과는 항목 하나로 추가)"""
+        merged = []
+        for result in results:
+            if isinstance(result, list):
+                merged.extend(result)
+            elif result not in (None, "", {}):
+                merged.append(result)
+        return merged
+
+    def _stream_request(self, issue_groups_str, user_id, stop=None):
+        """
+        issue_groups 입력 하나에 대한 워크플로 스트리밍 요청
+        :param stop: threading.Event (설정되면 스트림 읽기를 중단)
         """
-        issue_groups_str = json.dumps(aggregator_data.get("issue_groups", []), ensure_ascii=False, indent=2)
-        
         payload = {
             "inputs": {
                 "issue_groups": issue_groups_str
@@ -39,8 +284,6 @@ class DifyClient:
             "user": user_id
         }
 
-        self._log(f"[Dify] 스트리밍 요청 시작: {self.url}", "INFO")
-
         try:
             # stream=True 옵션 사용
             # timeout=(connect_timeout, read_timeout) 
@@ -49,6 +292,8 @@ class DifyClient:
                 response.raise_for_status()
 
                 for line in response.iter_lines():
+                    if stop is not None and stop.is_set():
+                        return
                     if line:
                         decoded_line = line.decode('utf-8')
                         
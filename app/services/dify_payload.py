@@ -0,0 +1,115 @@
+# app/services/dify_payload.py
+"""
+Dify 워크플로 입력(issue_groups) 크기 제한.
+이슈 그룹을 들여쓰기 없는 JSON 으로 직렬화하고 스냅샷/메시지를 줄인 뒤, 바이트(또는 추정 토큰) 예산을 넘으면
+여러 묶음(chunk)으로 나눈다. 묶음은 건수 내림차순 순서를 유지하며, 각 묶음을 따로 분석 요청한다.
+
+- 이슈 하나가 예산을 넘으면 스냅샷을 빼고 메시지를 더 줄여 다시 맞춘다 (그래도 넘으면 단독 묶음)
+- 묶음 수는 기본적으로 제한하지 않는다. max_chunks 를 지정하면 넘는 분량은 발생 건수가 가장 적은 그룹부터
+  제외하고 제외 건수를 반환한다 (DifyClient.omitted_groups / 리포트 report_meta 로 전달)
+"""
+
+import json
+
+# 이슈 하나가 예산을 넘을 때 적용하는 축소 단계 (스냅샷 수, 스냅샷 길이, 메시지 길이, 노드 수)
+_FALLBACK_LIMITS = (0, 0, 200, 3)
+
+
+def estimate_tokens(text):
+    """
+    LLM 토큰 수 근사치 (영문/숫자/기호는 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰)
+    """
+    non_ascii = len(text) - len(text.encode("ascii", "ignore"))
+    return (len(text) - non_ascii + 3) // 4 + non_ascii
+
+
+def dumps_compact(value):
+    """들여쓰기/공백 없는 JSON 문자열"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _truncate(text, limit):
+    if not isinstance(text, str) or limit <= 0 or len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+class IssuePayloadBuilder:
+    """
+    사용 예)
+        builder = IssuePayloadBuilder(max_bytes=64 * 1024)
+        chunks, omitted = builder.build(aggregator_data["issue_groups"])
+        for chunk in chunks:   # chunk: issue_groups 입력으로 보낼 JSON 문자열
+            ...
+    """
+
+    def __init__(self, max_bytes=64 * 1024, max_tokens=0, snapshots=2, snapshot_chars=300, message_chars=500,
+                 max_nodes=10, max_chunks=0):
+        """
+        :param max_bytes: 묶음 하나의 최대 크기 (UTF-8 바이트, 0 이면 제한 없음)
+        :param max_tokens: 묶음 하나의 최대 추정 토큰 수 (0 이면 제한 없음)
+        :param snapshots: 이슈당 남길 peak 스냅샷 수
+        :param snapshot_chars, message_chars: 스냅샷 한 줄 / message_pattern 최대 길이 (문자)
+        :param max_nodes: 이슈당 남길 노드 수
+        :param max_chunks: 최대 묶음 수 (0 이면 제한 없음)
+        """
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.limits = (snapshots, snapshot_chars, message_chars, max_nodes)
+        self.max_chunks = max_chunks
+
+    @staticmethod
+    def trim_issue(issue, snapshots, snapshot_chars, message_chars, max_nodes):
+        """
+        전송용 issue dict (원본은 집계기 export 캐시와 공유하므로 수정하지 않고 필요한 부분만 복사)
+        """
+        trimmed = dict(issue)
+        trimmed["message_pattern"] = _truncate(issue.get("message_pattern"), message_chars)
+        nodes = issue.get("nodes")
+        if isinstance(nodes, list) and len(nodes) > max_nodes:
+            trimmed["nodes"] = nodes[:max_nodes] + [f"... 외 {len(nodes) - max_nodes}개"]
+        time_context = issue.get("time_context")
+        if isinstance(time_context, dict):
+            time_context = dict(time_context)
+            samples = time_context.get("peak_snapshot") or []
+            time_context["peak_snapshot"] = [_truncate(line, snapshot_chars) for line in samples[:snapshots]]
+            trimmed["time_context"] = time_context
+        return trimmed
+
+    def _cost(self, text):
+        """(바이트, 추정 토큰) - 토큰 예산이 없으면 토큰은 계산하지 않음"""
+        return len(text.encode("utf-8")), estimate_tokens(text) if self.max_tokens else 0
+
+    def _fits(self, size, tokens):
+        return (not self.max_bytes or size <= self.max_bytes) and (not self.max_tokens or tokens <= self.max_tokens)
+
+    def _serialize(self, issue):
+        text = dumps_compact(self.trim_issue(issue, *self.limits))
+        size, tokens = self._cost(text)
+        # 대괄호 2바이트 포함해 단독으로도 예산을 넘으면 더 줄임
+        if not self._fits(size + 2, tokens + 1):
+            text = dumps_compact(self.trim_issue(issue, *_FALLBACK_LIMITS))
+            size, tokens = self._cost(text)
+        return text, size, tokens
+
+    def build(self, issue_groups):
+        """
+        :param issue_groups: export_to_dify_format() 의 issue_groups (건수 내림차순)
+        :return: (묶음 JSON 문자열 리스트, max_chunks 초과로 제외한 이슈 수)
+        """
+        chunks = []
+        current, current_size, current_tokens = [], 2, 1   # "[" "]"
+        for index, issue in enumerate(issue_groups):
+            text, size, tokens = self._serialize(issue)
+            separator = 1 if current else 0
+            if current and not self._fits(current_size + separator + size, current_tokens + separator + tokens):
+                chunks.append("[" + ",".join(current) + "]")
+                current, current_size, current_tokens, separator = [], 2, 1, 0
+                if self.max_chunks and len(chunks) >= self.max_chunks:
+                    return chunks, len(issue_groups) - index
+            current.append(text)
+            current_size += separator + size
+            current_tokens += separator + tokens
+        if current or not chunks:
+            chunks.append("[" + ",".join(current) + "]")
+        return chunks, 0
@@ -8,6 +8,7 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as ReportLabImage
 
+from app.core.chnl_constants import get_chnl_label
 from app.services.chart_generator import ChartGenerator
 
 class PDFGenerator:
@@ -91,6 +92,8 @@ class PDFGenerator:
         <b>총 처리 로그 수:</b> {total_logs}건<br/>
         <b>대상 시스템:</b> {channel_name}
         """
+        if meta.get('ai_omitted_issue_groups'):
+            meta_text += f"<br/><b>AI 분석 제외 이슈 그룹:</b> {meta['ai_omitted_issue_groups']}개 (분석 요청 수 제한)"
         elements.append(Paragraph(meta_text, body_style))
         elements.append(Spacer(1, 20))
 
@@ -0,0 +1,157 @@
+# app/utils/disk_cache.py
+"""
+크기 제한 디스크 캐시 공통 구현 (ResponseCache / AnalysisCache 가 상속).
+키(SHA-256 hex)별 파일 하나를 {cache_dir}/{키 앞 2자}/{키}{SUFFIX} 에 저장하고,
+전체 크기가 max_bytes 를 넘으면 최근에 사용하지 않은 파일(mtime 기준)부터 삭제한다.
+하위 클래스는 키 계산과 파일 내용 형식(직렬화, 만료 판단)만 구현한다.
+"""
+
+import os
+import threading
+
+# 한도 초과 시 이 비율까지 줄여 매 저장마다 정리하지 않도록 함
+EVICT_TARGET_RATIO = 0.9
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+class DiskLruCache:
+    """
+    하위 클래스 구현 예)
+        path = self._path(key)
+        try:
+            data = self._read(path)
+            if data is None:
+                self._record_miss()
+                return None
+            value = decode(data)
+        except (OSError, ValueError):
+            self._record_miss(path)   # 손상된 파일 삭제
+            return None
+        self._record_hit(path)
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+    SUFFIX = ".bin"
+
+    def __init__(self, cache_dir, max_bytes):
+        """
+        :param max_bytes: 캐시 디렉터리 전체 크기 상한
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None   # 처음 저장할 때 디렉터리를 훑어 계산
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + self.SUFFIX)
+
+    @staticmethod
+    def _read(path):
+        """파일 내용 (없으면 None, 그 밖의 읽기 오류는 OSError)"""
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, path, data):
+        """
+        임시 파일에 쓴 뒤 교체하고 전체 크기가 한도를 넘으면 정리
+        :return: 저장 여부 (저장 실패는 호출 측 결과에 영향을 주지 않도록 False 로만 알림)
+        """
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return False
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(data) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return True
+
+    def _record_hit(self, path):
+        try:
+            # 최근 사용 시각 갱신 (크기 한도 초과 시 오래 쓰지 않은 파일부터 삭제)
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+
+    def _record_miss(self, corrupt_path=None):
+        """:param corrupt_path: 손상된 파일 경로 (지우고 다음에 다시 저장)"""
+        if corrupt_path is not None:
+            self._remove(corrupt_path)
+        with self._lock:
+            self.misses += 1
+
+    def clear(self):
+        with self._lock:
+            for path, _size, _mtime in self._entries():
+                self._remove(path)
+            self._total_bytes = 0
+
+    def _entries(self):
+        """[(경로, 크기, 최근 사용 시각)]"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(self.SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _scan_size(self):
+        return sum(size for _path, size, _mtime in self._entries())
+
+    def _evict(self):
+        """최근 사용 시각이 오래된 파일부터 max_bytes * EVICT_TARGET_RATIO 이하가 될 때까지 삭제 (lock 보유 상태)"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _path, size, _mtime in entries)
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        for path, size, _mtime in entries:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+def shared_instance(cache_class, cache_dir, **options):
+    """
+    (캐시 종류, 디렉터리)별 공유 인스턴스 (여러 채널 워커가 같은 디렉터리를 쓸 때 크기 계산을 한 곳에서 관리)
+    옵션은 처음 생성할 때만 적용된다.
+    """
+    key = (cache_class, os.path.abspath(cache_dir))
+    with _shared_lock:
+        cache = _shared.get(key)
+        if cache is None:
+            cache = _shared[key] = cache_class(cache_dir, **options)
+        return cache
@@ -1,13 +1,25 @@
 import os
 import json
+import time
 from PyQt6.QtCore import QThread, pyqtSignal
 from app.core.aggregator import LogAggregator
+from app.core.checkpoint import CheckpointManager
+from app.workers.page_fetcher import AdaptivePageSize, PipelinedPageFetcher
+from app.workers.range_splitter import SplitRangeScanner, TIME_FORMAT, drop_seen_rows
+from app.workers.scan_metrics import ScanMetrics
+from app.services.analysis_cache import shared_analysis_cache
 from app.services.dify_client import DifyClient
-from app.api.bxm_client import BxmApiClient
+from app.services.dify_payload import IssuePayloadBuilder
+from app.api.bxm_client import BxmApiClient, PageTimeoutError
+from app.api.response_cache import shared_cache
+from app.api.session_registry import shared_registry
+from config.settings import AppConfig
 
 class MonitorWorker(QThread):
     log_signal = pyqtSignal(str, str)
     finished_signal = pyqtSignal(str, int) 
+    # 스캔 종료 시 단계별 소요 시간 / 카운터 (channel_key, ScanMetrics.summary())
+    metrics_signal = pyqtSignal(str, dict)
 
     def __init__(self, channel_data, dify_config, date_range):
         super().__init__()
@@ -15,6 +27,7 @@ class MonitorWorker(QThread):
         self.dify_config = dify_config
         self.date_range = date_range
         self.is_running = True
+        self.metrics = None
 
     def run(self):
         channel_key = self.channel_data.get('key', 'Unknown')
@@ -27,15 +40,30 @@ class MonitorWorker(QThread):
         def logger_callback(msg, level="INFO"):
             self.log_signal.emit(msg, level)
 
-        bxm_client = BxmApiClient(logger=logger_callback)
+        metrics = self.metrics = ScanMetrics(channel_key, self.date_range.get('start'), self.date_range.get('end'))
+
+        response_cache = self._create_response_cache()
+        page_size = self.channel_data.get('page_size', AppConfig.PAGE_SIZE)
+        # 커넥션 풀 / 로그인 쿠키 / 서버별 요청 한도는 프로세스 전체에서 공유 (이전 스캔의 로그인이 유효하면 재로그인 생략)
+        session_registry = shared_registry(
+            idle_timeout_sec=AppConfig.LOGIN_SESSION_IDLE_SEC,
+            rate_limit_rps=AppConfig.BXM_RATE_LIMIT_RPS,
+            rate_limit_burst=AppConfig.BXM_RATE_LIMIT_BURST,
+            breaker_threshold=AppConfig.BXM_BREAKER_THRESHOLD,
+            breaker_reset_sec=AppConfig.BXM_BREAKER_RESET_SEC,
+        )
+        bxm_client = BxmApiClient(logger=logger_callback, response_cache=response_cache, page_size=page_size,
+                                  session_registry=session_registry, mock_fallback=AppConfig.BXM_MOCK_FALLBACK,
+                                  metrics=metrics)
 
         # 1. BXM 로그인
         self.log_signal.emit(f"[{channel_name}] BXM 서버에 로그인 시도 중...", "INFO")
-        success, cookies, msg = bxm_client.login(base_url, user_id, password)
+        with metrics.span("login"):
+            success, cookies, msg = bxm_client.login(base_url, user_id, password)
         
         if not success:
             self.log_signal.emit(f"로그인 실패: {msg}", "ERROR")
-            self.finished_signal.emit(channel_key, -1)
+            self._finish(channel_key, -1, "failed")
             return
 
         # 2. 에러 로그 조회
@@ -43,56 +71,208 @@ class MonitorWorker(QThread):
         end_dt = self.date_range.get('end')
         self.log_signal.emit(f"로그 데이터 조회 중... ({start_dt} ~ {end_dt})", "SCAN")
         
-        aggregator = LogAggregator()
-        total_logs = 0
-        page = 1
-        
+        # 중단된 이전 스캔의 체크포인트가 같은 조회 기간이면 이어서 진행하고,
+        # 완료된 이전 스캔이 같은 시작 시각이면 그 결과에 이어 마지막 반영 시각 이후 로그만 조회 (증분 조회)
+        checkpoint = self._create_checkpoint_manager(channel_key)
+        # (Mock 모드의 가상 로그는 기준 데이터로 남기지 않음)
+        delta_scan = self.channel_data.get('delta_scan', AppConfig.DELTA_SCAN) and not bxm_client.is_mock_mode
+        with metrics.span("restore"):
+            aggregator, meta = self._restore_checkpoint(checkpoint, start_dt, end_dt, delta_scan)
+        if aggregator is None:
+            aggregator = LogAggregator(start_dt, end_dt)
+            meta = {}
+        total_logs = meta.get("total_logs", 0)
+        # 단일 구간 조회: 다음 조회 행 위치 (페이지 크기가 바뀌어도 이어갈 수 있도록 행 단위로 저장)
+        offset = meta.get("next_offset")
+        if offset is None:
+            # 이전 형식 체크포인트 (고정 페이지 크기의 next_page)
+            offset = (meta.get("next_page", 1) - 1) * BxmApiClient.PAGE_SIZE
+        page = 0                                    # 이번 실행에서 받은 페이지 수
+        resume_from = meta.get("resume_from")       # 구간 분할 조회: 완료된 구간 다음 시각
+        fetch_done = meta.get("fetch_done", False)
+        fetch_start = meta.get("fetch_start") or start_dt   # 실제 조회 시작 시각 (증분 조회 시 high-water mark)
+        skip = meta.get("skip", 0)                  # fetch_start 시각의 이미 반영한 행 수
+        baseline_logs = meta.get("baseline_logs", 0)
+        if meta:
+            if fetch_done:
+                progress = "(수집 완료 상태)"
+            elif resume_from:
+                progress = f"({resume_from}부터 재개)"
+            elif fetch_start != start_dt and offset == 0:
+                progress = f"(증분 조회: {fetch_start} 이후 로그만 조회)"
+            else:
+                progress = f"({offset + 1}번째 행부터 재개)"
+            self.log_signal.emit(f"이전 체크포인트에서 집계 상태 복원: {total_logs}건 {progress}", "INFO")
+
+        def checkpoint_meta(done=False):
+            return {"channel": channel_key, "start": start_dt, "end": end_dt, "next_offset": offset,
+                    "resume_from": resume_from, "total_logs": total_logs, "fetch_done": done,
+                    "fetch_start": fetch_start, "skip": skip, "baseline_logs": baseline_logs}
+
+        # 최대 max_in_flight 개 페이지를 동시에 요청하고, 도착한 페이지는 순서대로 집계
+        # 서버가 짧은 페이지(요청 건수 미만)를 돌려줄 때까지 계속 조회
+        # 요청은 집계가 끝난 페이지 수만큼만 새로 보내므로 (백프레셔) 미처리 페이지는 최대 max_in_flight 개
+        max_in_flight = self.channel_data.get('max_in_flight', AppConfig.FETCH_MAX_IN_FLIGHT)
+        memory_limit = self.channel_data.get('memory_limit_mb', AppConfig.AGGREGATOR_MEMORY_LIMIT_MB) * 1024 * 1024
+
+        # 조회 기간을 split_minutes 단위 구간으로 나누어 구간별 병렬 조회 (Mock 모드 / 페이지 단위 재개 시 제외)
+        # 분할 조회로 저장된 체크포인트는 설정과 무관하게 분할 조회로 이어서 진행
+        # 증분 조회는 대부분 신규 로그가 적고 미래 시각 구간이 비어 있으므로 페이지 조회로 진행
+        split_minutes = self.channel_data.get('split_minutes', AppConfig.SPLIT_MINUTES)
+        use_split = resume_from is not None or (split_minutes > 0 and not bxm_client.is_mock_mode and offset == 0
+                                                and fetch_start == start_dt)
+        scanner = None
+        if use_split:
+            try:
+                scanner = SplitRangeScanner(
+                    metrics.timed_fetch(lambda s, e, page_num: bxm_client.get_today_error_logs(
+                        base_url, cookies, s, e, page_num=page_num)),
+                    resume_from or start_dt, end_dt, LogAggregator,
+                    page_size=page_size,
+                    max_workers=max_in_flight,
+                    split_minutes=split_minutes or AppConfig.SPLIT_MINUTES,
+                    should_continue=lambda: self.is_running,
+                )
+            except ValueError:
+                # 조회 기간 형식을 해석할 수 없으면 단일 구간 조회
+                use_split = False
+        if use_split:
+            source = iter(scanner)
+        else:
+            # 페이지 크기 조정: 응답 시간을 보고 크기를 늘리거나 줄임 (Mock 모드는 고정 크기)
+            page_sizer = None
+            if self.channel_data.get('adaptive_page_size', AppConfig.ADAPTIVE_PAGE_SIZE) and not bxm_client.is_mock_mode:
+                page_sizer = AdaptivePageSize(
+                    initial=page_size,
+                    min_size=self.channel_data.get('page_size_min', AppConfig.PAGE_SIZE_MIN),
+                    max_size=self.channel_data.get('page_size_max', AppConfig.PAGE_SIZE_MAX),
+                    max_payload_bytes=self.channel_data.get('page_max_payload_mb', AppConfig.PAGE_MAX_PAYLOAD_MB) * 1024 * 1024,
+                )
+            source = PipelinedPageFetcher(
+                metrics.timed_fetch(lambda page_num, size: bxm_client.get_today_error_logs(
+                    base_url, cookies, fetch_start, end_dt, page_num=page_num, page_size=size)),
+                max_in_flight=max_in_flight,
+                page_size=page_size,
+                start_offset=offset,
+                should_continue=lambda: self.is_running,
+                page_sizer=page_sizer,
+                shrink_errors=(PageTimeoutError,),
+            )
+
+        cache_hits = response_cache.hits if response_cache is not None else 0
+        fetch_started = time.perf_counter()
         try:
-            while self.is_running and page <= 5:
-                logs = bxm_client.get_today_error_logs(base_url, cookies, start_dt, end_dt, page_num=page)
-                
-                if not logs:
-                    break
-                    
-                for log_entry in logs:
-                    aggregator.process_log(log_entry)
-                
-                fetched_count = len(logs)
-                total_logs += fetched_count
-                self.log_signal.emit(f"데이터 수신 중 (Page {page}): {fetched_count}건", "INFO")
-                
-                if fetched_count < 100:
-                    break
-                page += 1
+            if fetch_done:
+                pass
+            elif use_split:
+                # 구간별 부분 집계를 시간 순서대로 병합 (단일 구간 조회 결과와 동일)
+                for range_start, range_end, partial, fetched_count in source:
+                    if not self.is_running:
+                        break
+                    with metrics.span("aggregate"):
+                        aggregator.merge(partial)
+                    metrics.add("rows_aggregated", fetched_count)
+                    total_logs += fetched_count
+                    self.log_signal.emit(
+                        f"데이터 수신 중 ({range_start.strftime('%m-%d %H:%M')} 구간): {fetched_count}건", "INFO")
+
+                    resume_from = range_end.strftime(TIME_FORMAT) if range_end is not None else None
+                    self._apply_memory_limit(aggregator, memory_limit)
+                    self._save_checkpoint(checkpoint, aggregator, checkpoint_meta(), periodic=True)
+            else:
+                for fetched_offset, logs in source:
+                    if not self.is_running:
+                        break
+
+                    # 다음 조회 위치는 서버가 돌려준 행 수 기준 (증분 조회에서 제외하는 행 포함)
+                    offset = fetched_offset + len(logs)
+                    page += 1
+                    if skip:
+                        # 증분 조회: 이전 스캔에서 반영한 시작 시각의 행 제외
+                        logs, skip = drop_seen_rows(logs, fetch_start, skip)
+
+                    # 페이지 단위 일괄 집계 (항목별 process_log 호출 대신)
+                    with metrics.span("aggregate"):
+                        fetched_count = aggregator.process_batch(logs)
+                    metrics.add("rows_aggregated", fetched_count)
+                    total_logs += fetched_count
+                    self.log_signal.emit(f"데이터 수신 중 (Page {page}): {fetched_count}건", "INFO")
+
+                    if page % AppConfig.MEMORY_CHECK_EVERY_PAGES == 0:
+                        self._apply_memory_limit(aggregator, memory_limit)
+                    self._save_checkpoint(checkpoint, aggregator, checkpoint_meta(), periodic=True)
 
         except Exception as e:
+            source.close()
+            metrics.record("fetch", time.perf_counter() - fetch_started)
             self.log_signal.emit(f"로그 조회 중 오류: {str(e)}", "ERROR")
-            self.finished_signal.emit(channel_key, -1)
+            # 여기까지 집계한 상태를 남겨 재시도 시 실패한 페이지(구간)부터 다시 조회
+            if total_logs:
+                self._save_checkpoint(checkpoint, aggregator, checkpoint_meta())
+            self._finish(channel_key, -1, "failed")
+            return
+        source.close()
+        # 조회 + 집계 전체 경과 시간 (페이지 조회는 병렬이므로 page_fetch 누적 시간보다 짧을 수 있음)
+        metrics.record("fetch", time.perf_counter() - fetch_started)
+        if response_cache is not None and response_cache.hits > cache_hits:
+            self.log_signal.emit(f"응답 캐시 사용: {response_cache.hits - cache_hits}페이지 (서버 재조회 생략)", "INFO")
+
+        if not self.is_running:
+            # 사용자 중단: 다음 실행에서 이어서 조회할 수 있도록 저장
+            if total_logs:
+                self._save_checkpoint(checkpoint, aggregator, checkpoint_meta(done=fetch_done))
+            self._finish(channel_key, -1, "stopped")
             return
 
         if total_logs == 0:
+            checkpoint.clear()
             self.log_signal.emit("조회된 에러 로그가 없습니다.", "SUCCESS")
-            self.finished_signal.emit(channel_key, 0)
+            self._finish(channel_key, 0, "empty")
             return
 
-        self.log_signal.emit(f"총 {total_logs}건의 로그 데이터 수집 완료", "SUCCESS")
+        if baseline_logs:
+            self.log_signal.emit(
+                f"총 {total_logs}건의 로그 데이터 수집 완료 (이전 스캔 {baseline_logs}건 + 신규 {total_logs - baseline_logs}건)",
+                "SUCCESS")
+        else:
+            self.log_signal.emit(f"총 {total_logs}건의 로그 데이터 수집 완료", "SUCCESS")
+        if aggregator.is_bounded:
+            approximated = aggregator.approximated_logs
+            self.log_signal.emit(
+                f"근사 집계 결과: 정확 집계 {total_logs - approximated}건 / 근사 집계 {approximated}건 "
+                f"(상위 {aggregator.max_groups}개 그룹 유지, 퇴출 {aggregator.evicted_groups}개)", "WARN")
+        if not fetch_done:
+            # 수집 완료 상태를 저장하여 이후 단계에서 중단되어도 재조회하지 않도록 함
+            self._save_checkpoint(checkpoint, aggregator, checkpoint_meta(done=True))
 
         # 4. 데이터 집계
-        json_data = aggregator.export_to_dify_format()
-        error_count = sum(g['total_count'] for g in aggregator.groups.values())
+        with metrics.span("export"):
+            json_data = aggregator.export_to_dify_format()
+        error_count = aggregator.total_logs
+        metrics.set("groups", len(aggregator.groups))
 
         # 5. Dify Streaming 통신
         self.log_signal.emit(f"Dify AI 분석 요청 중... ({error_count}건)", "INFO")
-        dify = DifyClient(self.dify_config, logger=logger_callback)
+        dify = DifyClient(self.dify_config, logger=logger_callback, payload_builder=self._create_payload_builder(),
+                          max_parallel=self.dify_config.get('max_parallel', AppConfig.DIFY_MAX_PARALLEL),
+                          metrics=metrics, analysis_cache=self._create_analysis_cache(),
+                          per_group_cache=self.dify_config.get('cache_per_group', AppConfig.DIFY_CACHE_PER_GROUP))
         
         ai_response_data = [] 
         step_count = 0
         
+        dify_started = time.perf_counter()
+        first_event = True
         try:
             # [변경] 스트리밍 데이터를 받아 터미널 진행률처럼 표시
             for status, data in dify.analyze_issues_streaming(json_data, user_id):
                 if not self.is_running:
                     break
+                if first_event:
+                    # 요청 후 첫 이벤트까지의 대기 시간 (워크플로 시작 지연)
+                    metrics.set("dify_first_event_sec", time.perf_counter() - dify_started)
+                    first_event = False
+                metrics.add("dify_events")
 
                 if status == 'process':
                     step_count += 1
@@ -109,13 +289,140 @@ class MonitorWorker(QThread):
                     self.log_signal.emit(f"AI 분석 완료 (Total Steps: {step_count})", "SUCCESS")
                     
                 elif status == 'error':
+                    metrics.add("dify_errors")
                     self.log_signal.emit(f"Dify 오류: {data}", "ERROR")
 
         except Exception as e:
+            metrics.add("dify_errors")
             self.log_signal.emit(f"AI 분석 중 예외 발생: {e}", "ERROR")
+        metrics.record("dify", time.perf_counter() - dify_started)
+        if dify.omitted_groups:
+            # dify_config 의 max_chunks 제한으로 분석하지 않은 그룹 수를 리포트 메타에 기록
+            json_data["report_meta"]["ai_omitted_issue_groups"] = dify.omitted_groups
+            self.log_signal.emit(f"요청 수 제한(max_chunks)으로 이슈 그룹 {dify.omitted_groups}개는 AI 분석에서 제외되었습니다.",
+                                 "WARN")
         
         # 6. 리포트 저장 (생략된 경우 기존 로직 유지, 여기선 핵심 흐름만 구현)
         # 만약 ai_response_data가 있으면 PDF 생성 등 후속 작업 진행
         # ... (기존 파일에 있던 PDF 생성 로직 등은 생략됨, 필요시 추가)
-        
-        self.finished_signal.emit(channel_key, error_count)
\ No newline at end of file
+
+        if self.is_running and not delta_scan:
+            # 증분 조회를 쓰면 수집 완료 체크포인트를 다음 스캔의 기준(baseline)으로 남겨 둠
+            checkpoint.clear()
+        self._finish(channel_key, error_count, "success" if self.is_running else "stopped")
+
+    def _finish(self, channel_key, result, status):
+        """측정 결과를 기록/전달한 뒤 finished_signal 발생"""
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.finish(status, result)
+            self._publish_metrics(channel_key, metrics)
+        self.finished_signal.emit(channel_key, result)
+
+    def _publish_metrics(self, channel_key, metrics):
+        """단계별 측정 결과를 metrics_signal 로 보내고 스캔별 JSON 파일로 저장 (채널 설정 scan_metrics 로 끌 수 있음)"""
+        self.log_signal.emit(metrics.brief(), "INFO")
+        self.metrics_signal.emit(channel_key, metrics.summary())
+        if not self.channel_data.get('scan_metrics', AppConfig.SCAN_METRICS_ENABLED):
+            return
+        try:
+            metrics.write(AppConfig.SCAN_METRICS_DIR, keep=AppConfig.SCAN_METRICS_KEEP)
+        except OSError as e:
+            # 측정 결과 저장 실패는 스캔 결과에 영향을 주지 않음
+            self.log_signal.emit(f"스캔 측정 결과 저장 실패: {e}", "WARN")
+
+    def _create_response_cache(self):
+        """에러 로그 조회 응답 디스크 캐시 (채널 설정 response_cache 가 False 면 사용 안 함)"""
+        if not self.channel_data.get('response_cache', AppConfig.RESPONSE_CACHE_ENABLED):
+            return None
+        return shared_cache(
+            AppConfig.RESPONSE_CACHE_DIR,
+            max_bytes=AppConfig.RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+            ttl_sec=AppConfig.RESPONSE_CACHE_TTL_SEC,
+            settle_sec=AppConfig.RESPONSE_CACHE_SETTLE_SEC,
+        )
+
+    def _create_payload_builder(self):
+        """Dify 분석 요청 크기 예산 (dify_config 설정 > AppConfig 기본값 순)"""
+        config = self.dify_config
+        return IssuePayloadBuilder(
+            max_bytes=config.get('payload_max_bytes', AppConfig.DIFY_PAYLOAD_MAX_BYTES),
+            max_tokens=config.get('payload_max_tokens', AppConfig.DIFY_PAYLOAD_MAX_TOKENS),
+            snapshots=config.get('snapshots_per_issue', AppConfig.DIFY_SNAPSHOTS_PER_ISSUE),
+            snapshot_chars=config.get('snapshot_max_chars', AppConfig.DIFY_SNAPSHOT_MAX_CHARS),
+            max_chunks=config.get('max_chunks', AppConfig.DIFY_MAX_CHUNKS),
+        )
+
+    def _create_analysis_cache(self):
+        """Dify 분석 결과 디스크 캐시 (dify_config 의 analysis_cache 가 False 면 사용 안 함)"""
+        if not self.dify_config.get('analysis_cache', AppConfig.DIFY_CACHE_ENABLED):
+            return None
+        return shared_analysis_cache(
+            AppConfig.DIFY_CACHE_DIR,
+            max_bytes=AppConfig.DIFY_CACHE_MAX_MB * 1024 * 1024,
+            ttl_sec=AppConfig.DIFY_CACHE_TTL_SEC,
+        )
+
+    def _create_checkpoint_manager(self, channel_key):
+        """채널별 체크포인트 파일 관리자 (저장 주기는 채널 설정 > AppConfig 기본값 순)"""
+        safe_key = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in str(channel_key))
+        return CheckpointManager(
+            os.path.join(AppConfig.CHECKPOINT_DIR, f"{safe_key}.ckpt"),
+            interval_sec=self.channel_data.get('checkpoint_interval_sec', AppConfig.CHECKPOINT_INTERVAL_SEC),
+            every_pages=self.channel_data.get('checkpoint_every_pages', AppConfig.CHECKPOINT_EVERY_PAGES),
+        )
+
+    def _restore_checkpoint(self, checkpoint, start_dt, end_dt, delta_scan=False):
+        """
+        - 같은 조회 기간의 체크포인트: 중단된 지점부터 재개 (수집 완료 상태면 그대로 사용)
+        - delta_scan 이고 수집 완료된 체크포인트의 시작 시각이 같고 종료 시각이 같거나 이후면:
+          high-water mark(마지막 반영 시각)부터 증분 조회하도록 meta 구성
+        :return: (aggregator, meta). 사용할 체크포인트가 없으면 (None, None)
+        """
+        aggregator, meta = checkpoint.load()
+        if aggregator is None or meta.get("start") != start_dt:
+            return None, None
+        meta.setdefault("total_logs", aggregator.total_logs)
+
+        if delta_scan and meta.get("fetch_done") and aggregator.high_water is not None \
+                and end_dt >= meta.get("end", ""):
+            # high-water mark 시각 이전 로그는 모두 반영된 상태. 그 시각의 행은 반영한 건수만큼 건너뜀
+            meta.update({"end": end_dt, "next_offset": 0, "resume_from": None, "fetch_done": False,
+                         "fetch_start": aggregator.high_water, "skip": aggregator.high_water_count,
+                         "baseline_logs": aggregator.total_logs})
+            return aggregator, meta
+        if meta.get("end") != end_dt:
+            # 조회 기간이 다른 체크포인트는 재사용하지 않음
+            return None, None
+        return aggregator, meta
+
+    def _apply_memory_limit(self, aggregator, memory_limit):
+        """
+        집계 메모리가 한도를 넘으면 데이터를 버리지 않고 bounded 모드(상위 그룹만 유지)로 전환.
+        한도의 80% 에 해당하는 그룹 수로 줄여 이후 유입분의 여유를 둔다.
+        """
+        if aggregator.is_bounded or not aggregator.groups:
+            return
+        used = aggregator.estimated_bytes()
+        if used <= memory_limit:
+            return
+        max_groups = max(1, int(len(aggregator.groups) * memory_limit * 0.8 / used))
+        aggregator.set_max_groups(max_groups)
+        self.log_signal.emit(
+            f"집계 메모리 한도 초과 (약 {used // (1024 * 1024)}MB > {memory_limit // (1024 * 1024)}MB): "
+            f"상위 {max_groups}개 그룹만 유지하는 근사 집계로 전환합니다.", "WARN")
+
+    def _save_checkpoint(self, checkpoint, aggregator, meta, periodic=False):
+        """:param periodic: True 면 저장 주기가 된 경우에만 저장"""
+        started = time.perf_counter()
+        try:
+            if periodic:
+                saved = checkpoint.maybe_save(aggregator, meta)
+            else:
+                checkpoint.save(aggregator, meta)
+                saved = True
+            if saved and self.metrics is not None:
+                self.metrics.record("checkpoint", time.perf_counter() - started)
+        except OSError as e:
+            # 체크포인트 저장 실패는 스캔 자체를 중단시키지 않음
+            self.log_signal.emit(f"체크포인트 저장 실패: {e}", "WARN")
\ No newline at end of file
@@ -0,0 +1,233 @@
+# app/workers/page_fetcher.py
+"""
+페이지 단위 조회 API 를 파이프라인으로 호출하는 페처.
+항상 최대 max_in_flight 개의 페이지 요청을 동시에 보내 두고, 결과는 조회 순서(행 위치 순)대로 넘겨준다.
+(집계기는 순차 처리와 같은 결과를 내기 위해 페이지 순서대로 입력받아야 함)
+짧은 페이지(요청 건수 미만)를 받으면 그 이후 페이지는 요청하지 않으며, 이미 보낸 요청의 결과는 버린다.
+
+페이지 크기 조정(AdaptivePageSize):
+- 페이지 크기는 min_size x 2^k 단계 중에서만 고르고, 현재까지 받은 행 수(offset)의 약수인 크기만 사용한다.
+  -> 크기를 바꿔도 pageNum = offset / 크기 + 1 로 빈틈/중복 없이 이어서 조회된다.
+- 행당 응답 시간이 개선되는 동안 한 단계씩 키우고, 개선이 없으면 이전 크기로 돌아간다.
+- 응답 시간 초과 / 응답 크기 한도 초과 시 한 단계 줄이고 그 크기 이상은 다시 시도하지 않는다.
+  (시간 초과된 페이지는 절반 크기 두 페이지로 나누어 다시 조회)
+- 판단은 페이지 순서대로 내려지므로 같은 응답(캐시 적중 포함)이면 같은 크기 순서로 조회한다.
+"""
+
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AdaptivePageSize:
+    """
+    행당 응답 시간 기준 페이지 크기 조정기 (여러 스레드에서 호출 가능)
+    observe() 에 넘기는 페이지는 elapsed(서버 응답 초) / nbytes(응답 크기) 속성이 있어야 판단에 쓰인다.
+    """
+
+    def __init__(self, initial=100, min_size=50, max_size=1600, max_payload_bytes=8 * 1024 * 1024,
+                 improve_ratio=0.9, smoothing=0.5):
+        """
+        :param initial: 시작 크기 (단계에 없으면 그 이하의 가장 큰 단계)
+        :param min_size: 최소 크기 (단계의 기준)
+        :param max_size: 최대 크기
+        :param max_payload_bytes: 응답 크기 상한 (넘으면 크기를 줄임)
+        :param improve_ratio: 행당 응답 시간이 이 비율 이하로 줄어야 개선으로 판단
+        :param smoothing: 행당 응답 시간 지수 이동 평균의 새 측정값 가중치
+        """
+        self.ladder = [min_size]
+        while self.ladder[-1] * 2 <= max_size:
+            self.ladder.append(self.ladder[-1] * 2)
+        self.max_payload_bytes = max_payload_bytes
+        self.improve_ratio = improve_ratio
+        self.smoothing = smoothing
+        self._level = max((idx for idx, size in enumerate(self.ladder) if size <= initial), default=0)
+        self._max_level = len(self.ladder) - 1
+        self._per_row = {}     # 단계 -> 행당 응답 시간(초) 이동 평균
+        self._lock = threading.Lock()
+
+    @property
+    def min_size(self):
+        return self.ladder[0]
+
+    @property
+    def current(self):
+        return self.ladder[self._level]
+
+    def size_for(self, offset):
+        """offset 위치에서 요청할 페이지 크기 (현재 크기 이하이면서 offset 의 약수인 가장 큰 단계)"""
+        with self._lock:
+            level = self._level
+        while level > 0 and offset % self.ladder[level]:
+            level -= 1
+        return self.ladder[level]
+
+    def observe(self, size, rows):
+        """페이지 하나의 응답 결과 반영 (페이지 순서대로 호출)"""
+        elapsed = getattr(rows, "elapsed", None)
+        if elapsed is None or size not in self.ladder or len(rows) < size:
+            # 측정값이 없거나 마지막(짧은) 페이지는 판단에서 제외
+            return
+        level = self.ladder.index(size)
+        nbytes = getattr(rows, "nbytes", 0) or 0
+        per_row = elapsed / size
+        with self._lock:
+            previous = self._per_row.get(level)
+            self._per_row[level] = per_row if previous is None else \
+                previous + self.smoothing * (per_row - previous)
+
+            if nbytes > self.max_payload_bytes:
+                self._cap(level - 1)
+                return
+            if level != self._level:
+                return
+            up, down = level + 1, level - 1
+            if down >= 0 and down in self._per_row \
+                    and self._per_row[level] > self._per_row[down] * self.improve_ratio:
+                # 한 단계 작은 크기보다 뚜렷하게 낫지 않으면 되돌아감
+                self._level = down
+            elif up <= self._max_level and nbytes * 2 <= self.max_payload_bytes \
+                    and (up not in self._per_row or self._per_row[up] < self._per_row[level] * self.improve_ratio):
+                # 다음 단계를 아직 시도하지 않았거나 더 나았던 경우 키움
+                self._level = up
+
+    def record_failure(self, size):
+        """size 크기 요청의 응답 시간 초과: 그보다 작은 단계로 상한 조정"""
+        if size in self.ladder:
+            with self._lock:
+                self._cap(self.ladder.index(size) - 1)
+
+    def limit_to(self, size):
+        """서버가 허용하는 최대 건수가 size 임을 확인한 경우 상한 조정"""
+        with self._lock:
+            self._cap(max((idx for idx, step in enumerate(self.ladder) if step <= size), default=0))
+
+    def _cap(self, level):
+        self._max_level = max(0, min(self._max_level, level))
+        self._level = min(self._level, self._max_level)
+
+
+class PipelinedPageFetcher:
+    """
+    사용 예)
+        fetcher = PipelinedPageFetcher(lambda page, size: client.get_today_error_logs(..., page_num=page, page_size=size),
+                                       max_in_flight=4)
+        for offset, rows in fetcher:
+            aggregator.process_batch(rows)
+    왕복 지연이 지배적인 경우 전체 소요 시간은 대략 (페이지 수 x 지연 / max_in_flight) 가 된다.
+    """
+
+    def __init__(self, fetch_page, max_in_flight=4, page_size=100, start_offset=0, should_continue=None,
+                 page_sizer=None, shrink_errors=()):
+        """
+        :param fetch_page: (page_num, page_size) -> 행 리스트 (워커 스레드에서 호출되므로 스레드 안전해야 함)
+        :param max_in_flight: 동시에 진행할 최대 요청 수 (1 이면 기존 순차 조회와 동일)
+        :param page_size: 고정 페이지 크기 (page_sizer 가 없을 때)
+        :param start_offset: 첫 조회 행 위치 (체크포인트 재개 시 0 이 아닐 수 있음)
+        :param should_continue: 새 요청을 보내기 전에 확인하는 콜백 (False 면 추가 요청 중단)
+        :param page_sizer: AdaptivePageSize (지정 시 페이지 크기를 응답 시간에 따라 조정)
+        :param shrink_errors: 이 예외가 나면 절반 크기 두 페이지로 나누어 다시 조회 (최소 크기면 그대로 전파)
+        """
+        self.fetch_page = fetch_page
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.page_size = page_size
+        self.start_offset = start_offset
+        self.should_continue = should_continue or (lambda: True)
+        self.page_sizer = page_sizer
+        self.shrink_errors = tuple(shrink_errors)
+        self._executor = None
+        self._futures = {}
+
+    def _size_at(self, offset):
+        if self.page_sizer is not None:
+            return self.page_sizer.size_for(offset)
+        # 다른 크기로 조회하던 위치에서 재개한 경우 offset 의 약수 크기로 맞춘 뒤 원래 크기로 조회
+        return math.gcd(offset, self.page_size) if offset % self.page_size else self.page_size
+
+    def _fetch(self, offset, size):
+        """offset 부터 size 건 조회 (워커 스레드). 시간 초과 시 절반 크기로 나누어 재조회"""
+        try:
+            return self.fetch_page(offset // size + 1, size)
+        except self.shrink_errors:
+            half = size // 2
+            if self.page_sizer is None or half < self.page_sizer.min_size:
+                raise
+            self.page_sizer.record_failure(size)
+            rows = list(self._fetch(offset, half))
+            if len(rows) >= half:
+                rows.extend(self._fetch(offset + half, half))
+            return rows
+
+    def _submit(self, offset):
+        """offset 위치 페이지 요청 후 다음 요청 위치 반환"""
+        size = self._size_at(offset)
+        self._futures[offset] = (size, self._executor.submit(self._fetch, offset, size))
+        return offset + size
+
+    def _check_server_limit(self, offset, size, rows):
+        """
+        키운 크기의 요청에 짧은 페이지가 왔을 때, 마지막 페이지인지 서버의 최대 건수 제한인지 확인 (최소 크기 요청으로 대조).
+        서버가 건수를 줄이면서 시작 위치도 줄인 건수로 계산했다면 받은 행은 버리고 offset 부터 최소 크기 페이지로 대체한다.
+        :return: (offset 부터의 행, 서버 제한 여부 - True 면 뒤에 행이 더 있음)
+        """
+        sizer = self.page_sizer
+        if sizer is None or size <= sizer.min_size or not rows:
+            return rows, False
+        min_size = sizer.min_size
+        head = self.fetch_page(offset // min_size + 1, min_size)
+        if list(head) != rows[:min_size]:
+            sizer.limit_to(len(rows))
+            return head, len(head) >= min_size
+        next_offset = offset + len(rows)
+        if next_offset % min_size or not self.fetch_page(next_offset // min_size + 1, min_size):
+            return rows, False
+        sizer.limit_to(len(rows))
+        return rows, True
+
+    def __iter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="bxm-page")
+        futures = self._futures
+        offset = next_submit = self.start_offset
+        try:
+            for _ in range(self.max_in_flight):
+                next_submit = self._submit(next_submit)
+
+            while offset in futures:
+                size, future = futures.pop(offset)
+                rows = future.result()
+                if self.page_sizer is not None:
+                    self.page_sizer.observe(size, rows)
+                if len(rows) < size:
+                    rows, limited = self._check_server_limit(offset, size, rows)
+                    if not limited:
+                        # 마지막 페이지: 뒤에 보낸 요청은 더 기다리지 않음
+                        if rows:
+                            yield offset, rows
+                        return
+                    # 서버 최대 건수 제한: 보낸 요청은 버리고 받은 행 다음 위치부터 줄어든 크기로 다시 요청
+                    self._cancel_pending()
+                    yield offset, rows
+                    offset = next_submit = offset + len(rows)
+                    for _ in range(self.max_in_flight):
+                        if self.should_continue():
+                            next_submit = self._submit(next_submit)
+                    continue
+                # 결과를 넘기기 전에 빈 자리를 채워 요청 수를 유지
+                if self.should_continue():
+                    next_submit = self._submit(next_submit)
+                yield offset, rows
+                offset += size
+        finally:
+            self.close()
+
+    def _cancel_pending(self):
+        for _size, future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+    def close(self):
+        """대기 중인 요청 취소 (진행 중인 요청은 끝나는 대로 버림)"""
+        self._cancel_pending()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,215 @@
+# app/workers/range_splitter.py
+"""
+조회 기간 분할 병렬 스캐너.
+긴 조회 기간을 구간(기본 1시간)으로 나누어 구간별로 따로 페이지 조회를 병렬 진행하고,
+구간별 부분 집계기를 시간 순서대로 넘겨준다 (LogAggregator.merge 로 합치면 단일 구간 조회와 동일).
+
+- 구간 경계: 서버의 종료 시각 조건은 경계를 포함하므로, 각 구간은 [시작, 다음 구간 시작) 으로
+  클라이언트에서 한 번 더 걸러 경계 시각의 로그가 두 구간에 중복 집계되지 않도록 한다.
+- 적응형 분할: 구간의 첫 페이지가 가득 차면 그 페이지의 시각 분포로 밀도(분당 건수)를 추정하여
+  구간당 target_pages 페이지 안팎이 되도록 더 잘게 나눈다 (최소 min_split_minutes 분).
+  더 나눌 수 없는 구간은 그대로 페이지를 넘기며 조회한다.
+- BXM 조회 결과가 발생 시각 순서라는 전제에서 순차 조회와 같은 순서로 집계된다.
+"""
+
+import math
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 한 구간을 최대 몇 개로 다시 나눌지
+MAX_SPLIT_PARTS = 16
+
+
+def _parse_time(text):
+    """ "YYYY-MM-DD HH:MM[:SS...]" -> datetime (초 단위까지, 파싱 불가 시 None)"""
+    try:
+        return datetime.fromisoformat(text[:19])
+    except (TypeError, ValueError):
+        return None
+
+
+def drop_seen_rows(rows, mark, skip):
+    """
+    증분 조회 시 이전 스캔에서 이미 반영한 행 제외.
+    조회 시작 시각 mark(초 단위)와 같은 시각의 앞쪽 skip 건이 이전에 집계한 행이다 (조회 결과는 시각 순).
+    :return: (남길 행, 다음 페이지에서 더 건너뛸 건수)
+    """
+    for idx, row in enumerate(rows):
+        if skip <= 0:
+            return rows[idx:], 0
+        ts = row.get('time')
+        if isinstance(ts, str) and ts.strip("[]")[:19] > mark:
+            # mark 이후 시각부터는 모두 새 행
+            return rows[idx:], 0
+        skip -= 1
+    return [], skip
+
+
+class SplitRangeScanner:
+    """
+    사용 예)
+        scanner = SplitRangeScanner(lambda s, e, page: client.get_today_error_logs(url, cookies, s, e, page_num=page),
+                                    "2024-01-01 00:00:00", "2024-01-01 23:59:59", LogAggregator)
+        for range_start, range_end, partial, fetched in scanner:
+            aggregator.merge(partial)
+    """
+
+    def __init__(self, fetch_page, start_dt, end_dt, aggregator_factory, page_size=100, max_workers=4,
+                 split_minutes=60, min_split_minutes=5, target_pages=5, should_continue=None):
+        """
+        :param fetch_page: (start, end, page_num) -> 행 리스트 (워커 스레드에서 호출)
+        :param aggregator_factory: (start, end) -> 빈 부분 집계기
+        :param max_workers: 동시에 조회할 구간 수
+        :param split_minutes: 초기 분할 단위 (분, 시계 기준 정각 정렬)
+        :param min_split_minutes: 적응형 분할의 최소 구간 길이 (분)
+        :param target_pages: 적응형 분할 시 구간당 목표 페이지 수
+        """
+        self.fetch_page = fetch_page
+        self.start = _parse_time(start_dt)
+        self.end_text = end_dt
+        self.end = _parse_time(end_dt)
+        if self.start is None or self.end is None:
+            raise ValueError(f"조회 기간 형식 오류: {start_dt} ~ {end_dt}")
+        self.aggregator_factory = aggregator_factory
+        self.page_size = page_size
+        self.max_workers = max(1, int(max_workers))
+        self.split_minutes = max(1, int(split_minutes))
+        self.min_split_minutes = max(1, int(min_split_minutes))
+        self.target_pages = max(1, int(target_pages))
+        self.should_continue = should_continue or (lambda: True)
+        self.split_count = 0
+
+    def initial_ranges(self):
+        """[(시작, 다음 구간 시작 or None)] - 첫 구간 이후 경계는 split_minutes 정각 단위"""
+        step = timedelta(minutes=self.split_minutes)
+        day_start = datetime(self.start.year, self.start.month, self.start.day)
+        offset = (self.start - day_start) // step + 1
+        boundary = day_start + offset * step
+        ranges = []
+        lo = self.start
+        while boundary <= self.end:
+            ranges.append((lo, boundary))
+            lo = boundary
+            boundary += step
+        ranges.append((lo, None))
+        return ranges
+
+    def _query_bounds(self, rng):
+        lo, hi = rng
+        return lo.strftime(TIME_FORMAT), (hi.strftime(TIME_FORMAT) if hi is not None else self.end_text)
+
+    @staticmethod
+    def _within(rows, lo_text, hi_text):
+        """[lo, hi) 구간의 행만 남김 (행 시각의 길이에 맞춰 경계 문자열을 잘라 비교)"""
+        kept = []
+        for row in rows:
+            ts = row.get('time')
+            if isinstance(ts, str):
+                ts = ts.strip("[]")[:19]
+                if ts < lo_text[:len(ts)] or (hi_text is not None and ts >= hi_text[:len(ts)]):
+                    continue
+            kept.append(row)
+        return kept
+
+    def _split(self, rng, rows):
+        """첫 페이지가 가득 찬 구간의 하위 구간 목록 (더 나눌 수 없으면 None)"""
+        lo, hi = rng
+        end = hi if hi is not None else self.end
+        span_minutes = (end - lo).total_seconds() / 60
+        max_parts = int(span_minutes // self.min_split_minutes)
+        if max_parts < 2:
+            return None
+
+        times = [t for t in (_parse_time(row.get('time', '').strip("[]")) for row in rows
+                             if isinstance(row.get('time'), str)) if t is not None]
+        parts = 2
+        if len(times) >= 2:
+            # 첫 페이지의 시각 분포로 분당 건수를 추정하여 구간 전체 예상 건수 계산
+            page_minutes = max((max(times) - min(times)).total_seconds() / 60, 1.0)
+            expected_rows = len(rows) / page_minutes * span_minutes
+            parts = math.ceil(expected_rows / (self.target_pages * self.page_size))
+            if parts < 2:
+                # 목표 페이지 수 안에 끝날 구간은 나누지 않고 그대로 페이지 조회 (첫 페이지 재사용)
+                return None
+        parts = min(parts, max_parts, MAX_SPLIT_PARTS)
+
+        # 분 단위 경계로 균등 분할
+        width = math.ceil(span_minutes / parts)
+        children = []
+        child_lo = lo
+        for _ in range(parts - 1):
+            boundary = (child_lo + timedelta(minutes=width)).replace(second=0, microsecond=0)
+            if boundary >= end:
+                break
+            children.append((child_lo, boundary))
+            child_lo = boundary
+        children.append((child_lo, hi))
+        return children if len(children) > 1 else None
+
+    def _scan_range(self, rng):
+        """
+        구간 하나 조회 (워커 스레드)
+        :return: ("split", 하위 구간 목록) / ("done", 부분 집계기, 집계 건수) / ("stopped",)
+        """
+        start_text, end_text = self._query_bounds(rng)
+        lo_text = start_text
+        hi_text = rng[1].strftime(TIME_FORMAT) if rng[1] is not None else None
+
+        rows = self.fetch_page(start_text, end_text, 1)
+        if len(rows) >= self.page_size:
+            children = self._split(rng, rows)
+            if children:
+                return "split", children
+
+        aggregator = self.aggregator_factory(start_text, end_text)
+        fetched = 0
+        page = 1
+        while True:
+            kept = self._within(rows, lo_text, hi_text)
+            if kept:
+                fetched += aggregator.process_batch(kept)
+            if len(rows) < self.page_size:
+                return "done", aggregator, fetched
+            if not self.should_continue():
+                return ("stopped",)
+            page += 1
+            rows = self.fetch_page(start_text, end_text, page)
+
+    def __iter__(self):
+        """
+        (구간 시작, 다음 구간 시작 or None, 부분 집계기, 집계 건수) 를 시간 순서대로 반환
+        조회 중단(should_continue False) 시 그 시점까지 연속으로 완료된 구간까지만 반환한다.
+        """
+        order = self.initial_ranges()
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bxm-range")
+        futures = {executor.submit(self._scan_range, rng): rng for rng in order}
+        try:
+            while futures:
+                done, _pending = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rng = futures.pop(future)
+                    outcome = future.result()
+                    if outcome[0] == "split":
+                        children = outcome[1]
+                        self.split_count += 1
+                        idx = order.index(rng)
+                        order[idx:idx + 1] = children
+                        if self.should_continue():
+                            for child in children:
+                                futures[executor.submit(self._scan_range, child)] = child
+                    elif outcome[0] == "done":
+                        results[rng] = outcome[1:]
+
+                # 앞 구간부터 연속으로 완료된 구간만 순서대로 전달
+                while order and order[0] in results:
+                    rng = order.pop(0)
+                    aggregator, fetched = results.pop(rng)
+                    yield rng[0], rng[1], aggregator, fetched
+                if not self.should_continue():
+                    return
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
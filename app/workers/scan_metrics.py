@@ -0,0 +1,172 @@
+# app/workers/scan_metrics.py
+"""
+스캔(MonitorWorker.run) 단계별 소요 시간 / 카운터 수집.
+느린 스캔이 어디서 시간을 쓰는지(로그인, 페이지 조회, 집계, 내보내기, Dify 분석) 확인하기 위한 가벼운 계측 도구.
+
+- 단계(span): 호출 횟수, 누적 시간, 최대 시간. 페이지 조회처럼 여러 스레드에서 동시에 기록되는 단계는
+  누적 시간이 실제 경과 시간보다 클 수 있다 (경과 시간은 fetch 단계 참고)
+- 카운터: 수신 행/바이트, 캐시 적중, 재시도, 재로그인 등 (BxmApiClient 도 metrics 로 받아 기록)
+- summary(): 구조화된 결과 dict (MonitorWorker.metrics_signal 로 전달, write() 로 스캔별 JSON 파일 저장)
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+METRICS_FORMAT = 1
+
+
+class ScanMetrics:
+    """
+    사용 예)
+        metrics = ScanMetrics("ch1", start_dt, end_dt)
+        with metrics.span("login"):
+            client.login(...)
+        metrics.add("relogins")
+        metrics.write(AppConfig.SCAN_METRICS_DIR)
+    """
+
+    def __init__(self, channel, start_dt=None, end_dt=None):
+        self.channel = channel
+        self.start_dt = start_dt
+        self.end_dt = end_dt
+        self.started_at = datetime.now()
+        self.status = None
+        self.result = None
+        self._started = time.perf_counter()
+        self._stages = {}     # {단계: [횟수, 누적 초, 최대 초]}
+        self._counters = {}   # {이름: 값}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ 기록
+
+    @contextmanager
+    def span(self, stage):
+        """with 블록 실행 시간을 stage 에 기록 (예외로 끝나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def record(self, stage, seconds):
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                self._stages[stage] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def add(self, name, value=1):
+        """카운터 증가 (스레드 안전)"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set(self, name, value):
+        """측정값 기록 (마지막 값 유지)"""
+        with self._lock:
+            self._counters[name] = value
+
+    def timed_fetch(self, fetch):
+        """
+        페이지 조회 함수를 감싸 page_fetch 단계 시간과 수신 행/바이트/캐시 적중/서버 응답 시간을 기록
+        :param fetch: ErrorLogPage(또는 list)를 반환하는 조회 함수
+        """
+        def wrapper(*args, **kwargs):
+            try:
+                with self.span("page_fetch"):
+                    page = fetch(*args, **kwargs)
+            except Exception:
+                self.add("page_errors")
+                raise
+            self.add("pages")
+            self.add("rows_received", len(page))
+            self.add("bytes_received", getattr(page, "nbytes", 0))
+            if getattr(page, "cached", False):
+                self.add("cache_hits")
+            else:
+                elapsed = getattr(page, "elapsed", None)
+                if elapsed is not None:
+                    self.add("server_seconds", elapsed)
+            return page
+        return wrapper
+
+    def finish(self, status, result=None):
+        """
+        :param status: success / empty / failed / stopped
+        :param result: finished_signal 로 보내는 결과 값 (에러 건수, 실패 시 -1)
+        """
+        self.status = status
+        self.result = result
+
+    # ------------------------------------------------------------------ 결과
+
+    def summary(self):
+        """구조화된 측정 결과 (JSON 직렬화 가능)"""
+        with self._lock:
+            stages = {name: {"count": count, "seconds": round(total, 6), "max_seconds": round(longest, 6)}
+                      for name, (count, total, longest) in self._stages.items()}
+            counters = {name: round(value, 6) if isinstance(value, float) else value
+                        for name, value in self._counters.items()}
+        fetch_seconds = stages.get("fetch", {}).get("seconds", 0.0)
+        rates = {}
+        if fetch_seconds > 0:
+            rates["rows_per_sec"] = round(counters.get("rows_received", 0) / fetch_seconds, 1)
+            rates["bytes_per_sec"] = round(counters.get("bytes_received", 0) / fetch_seconds, 1)
+        aggregate_seconds = stages.get("aggregate", {}).get("seconds", 0.0)
+        if aggregate_seconds > 0:
+            rates["aggregate_rows_per_sec"] = round(counters.get("rows_aggregated", 0) / aggregate_seconds, 1)
+        return {
+            "format": METRICS_FORMAT,
+            "channel": self.channel,
+            "range": {"start": self.start_dt, "end": self.end_dt},
+            "started": self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "status": self.status,
+            "result": self.result,
+            "wall_seconds": round(time.perf_counter() - self._started, 6),
+            "stages": stages,
+            "counters": counters,
+            "rates": rates,
+        }
+
+    def brief(self):
+        """로그 표시용 한 줄 요약"""
+        summary = self.summary()
+        stages = summary["stages"]
+        parts = [f"{name} {stages[name]['seconds']:.2f}초"
+                 for name in ("login", "fetch", "aggregate", "export", "dify") if name in stages]
+        text = f"스캔 소요 시간 {summary['wall_seconds']:.2f}초: " + " / ".join(parts)
+        if "rows_per_sec" in summary["rates"]:
+            text += f" (조회 {summary['rates']['rows_per_sec']:,.0f}행/초)"
+        return text
+
+    def write(self, directory, keep=0):
+        """
+        스캔별 JSON 파일로 저장 ({채널}_{시작 시각}.json)
+        :param keep: 채널별로 남길 최근 파일 수 (0 이면 정리하지 않음)
+        :return: 저장한 파일 경로
+        """
+        os.makedirs(directory, exist_ok=True)
+        safe_key = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in str(self.channel))
+        prefix = f"{safe_key}_"
+        path = os.path.join(directory, f"{prefix}{self.started_at:%Y%m%d_%H%M%S_%f}.json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+        if keep > 0:
+            names = sorted(name for name in os.listdir(directory)
+                           if name.startswith(prefix) and name.endswith(".json")
+                           and name[len(prefix):-5].replace("_", "").isdigit())
+            for name in names[:-keep]:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+        return path
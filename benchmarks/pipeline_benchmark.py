@@ -0,0 +1,382 @@
+# benchmarks/pipeline_benchmark.py
+"""
+에러 로그 처리 파이프라인 벤치마크 (파싱 -> 집계 -> 내보내기 -> 차트 -> PDF).
+MockLogGenerator 로 고정 seed 합성 데이터셋(10k / 100k / 1M 행 x 저/고 카디널리티)을 만들어
+단계별 소요 시간, 처리량(행/초), 메모리 사용량을 측정하고 JSON 으로 저장한다.
+커밋 간 비교는 --compare 로 이전 결과 파일을 지정한다.
+
+단계 (fetch 이후 MonitorWorker 와 같은 순서)
+- generate:   합성 원본 행 생성 (참고용, 파이프라인 합계에서 제외)
+- parse:      BxmApiClient._parse_logs (BXM 원본 행 -> 표준 로그 dict, 메시지 템플릿 적용)
+- parse_text: LogParser.parse_line (같은 행을 텍스트 로그 라인으로 만든 뒤 파싱, 라인 생성 시간은 제외)
+- aggregate:  LogAggregator.process_batch (페이지 단위)
+- export:     export_to_dify_format + Dify 요청 본문 직렬화 (DifyClient 와 같은 IssuePayloadBuilder, 묶음 수 제한 없음)
+- chart:      ChartGenerator.generate_time_series_chart
+- pdf:        PDFGenerator.create_report (차트 생성 포함)
+
+메모리는 시간 측정을 왜곡하지 않도록 tracemalloc 을 켠 별도 회차에서 측정한다.
+- 단계별 peak_mb: 단계 실행 중 늘어난 최대 할당량 (단계 시작 시점 대비)
+- retained_mb:    aggregate 단계 이후 남아 있는 집계 상태 크기
+
+실행: python -m benchmarks.pipeline_benchmark --sizes 10k,100k --compare data/benchmarks/이전결과.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from itertools import islice
+
+# 차트 생성은 화면 없이 파일로만 저장
+os.environ.setdefault("MPLBACKEND", "Agg")
+# 한글 폰트가 없는 환경의 글리프 누락 경고는 결과 출력과 무관
+warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+
+from app.api.bxm_client import BxmApiClient
+from app.api.mock_log_generator import MockLogGenerator
+from app.core.aggregator import LogAggregator
+from app.core.log_parser import LogParser
+from app.services.dify_payload import IssuePayloadBuilder
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULT_DIR = os.path.join(ROOT_DIR, "data", "benchmarks")
+RESULT_FORMAT = 1
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+# 카디널리티 프로파일 (MockLogGenerator 옵션)
+#   low:  소수 그룹 + 고정 문구 메시지 -> 템플릿 캐시 / 그룹 조회가 대부분 적중
+#   high: 그룹 수가 많고 가변 토큰 종류도 많음 -> 그룹/시계열 시리즈 수가 커지는 경우
+CARDINALITIES = {
+    "low": {"groups": 20, "variable_tokens": False},
+    "high": {"groups": 20_000, "token_cardinality": 1_000_000},
+}
+STAGES = ("generate", "parse", "parse_text", "aggregate", "export", "chart", "pdf")
+# 파이프라인 합계에 넣는 단계 (generate 는 데이터 준비, parse_text 는 별도 입력 경로)
+PIPELINE_STAGES = ("parse", "aggregate", "export", "chart", "pdf")
+
+DATASET_DATE = "2025-01-06"
+ANALYSIS_TEXT = "## 벤치마크\n고정 분석 문구입니다.\n**주요 이슈** 없음\n" * 20
+
+
+class StageTimer:
+    """단계별 누적 시간과 (메모리 측정 회차일 때) 단계 실행 중 최대 증가 메모리"""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.peak_bytes = dict.fromkeys(STAGES, 0)
+        self.max_traced = 0   # 전체 실행 중 최대 할당량 (단계마다 peak 를 초기화하므로 따로 보관)
+
+    def run(self, stage, func, *args):
+        if self.trace_memory:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        result = func(*args)
+        self.seconds[stage] += time.perf_counter() - started
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_bytes[stage] = max(self.peak_bytes[stage], peak - base)
+            self.max_traced = max(self.max_traced, peak)
+        return result
+
+
+def _to_text_lines(rows):
+    """BXM 원본 행 -> LogParser 텍스트 로그 라인"""
+    return [f"[{row['logOccurDttm']}] [{row['application']}] {row['service']}.{row['operation']} - "
+            f"{row['errCd']} {row['msgType']}" for row in rows]
+
+
+def _parse_lines(lines):
+    parse_line = LogParser.parse_line
+    return [parse_line(line) for line in lines]
+
+
+def _export(aggregator):
+    data = aggregator.export_to_dify_format()
+    chunks, _omitted = IssuePayloadBuilder(max_chunks=0).build(data.get("issue_groups", []))
+    return data, sum(len(chunk.encode("utf-8")) for chunk in chunks)
+
+
+def _verify(generator, aggregator, data):
+    """
+    파이프라인 결과 검증 (필드가 빠져 처리량만 좋아 보이는 결과를 저장하지 않도록)
+    - 집계 건수가 생성 건수와 같은지
+    - 생성 행의 nodeName 이 이슈의 nodes 까지 전달되는지
+    :return: 이슈에 나타난 고유 노드 수
+    """
+    if aggregator.total_logs != len(generator):
+        raise RuntimeError(f"집계 건수 불일치: 생성 {len(generator)}건 / 집계 {aggregator.total_logs}건")
+    nodes = {node for issue in data.get("issue_groups", []) for node in issue.get("nodes", [])}
+    if data.get("issue_groups") and not nodes:
+        raise RuntimeError("생성 행의 nodeName 이 이슈 노드 목록에 반영되지 않음 (BxmApiClient._parse_logs 확인)")
+    return len(nodes)
+
+
+def _optional_renderers():
+    """
+    차트 / PDF 생성기 (matplotlib / reportlab 미설치 시 해당 단계는 건너뜀)
+    :return: (ChartGenerator 클래스 또는 None, PDFGenerator 클래스 또는 None, 건너뛴 사유 dict)
+    """
+    skipped = {}
+    try:
+        from app.services.chart_generator import ChartGenerator
+    except ImportError as e:
+        ChartGenerator = None
+        skipped["chart"] = str(e)
+    try:
+        from app.services.pdf_generator import PDFGenerator
+    except ImportError as e:
+        PDFGenerator = None
+        skipped["pdf"] = str(e)
+    return ChartGenerator, PDFGenerator, skipped
+
+
+def run_pipeline(size_name, cardinality, page_size, seed, trace_memory=False):
+    """
+    데이터셋 하나에 대해 전체 파이프라인 1회 실행
+    :return: (StageTimer, 데이터셋 통계 dict)
+    """
+    rows_total = SIZES[size_name]
+    generator = MockLogGenerator(DATASET_DATE, rows_per_day=rows_total, seed=seed,
+                                 **CARDINALITIES[cardinality])
+    client = BxmApiClient()
+    aggregator = LogAggregator(f"{DATASET_DATE} 00:00:00", f"{DATASET_DATE} 23:59:59")
+    timer = StageTimer(trace_memory)
+    ChartGenerator, PDFGenerator, skipped = _optional_renderers()
+
+    rows_iter = generator.iter_rows()
+    next_page = lambda: list(islice(rows_iter, page_size))
+    while True:
+        raw_rows = timer.run("generate", next_page)
+        if not raw_rows:
+            break
+        parsed = timer.run("parse", client._parse_logs, raw_rows)
+        lines = _to_text_lines(raw_rows)
+        timer.run("parse_text", _parse_lines, lines)
+        timer.run("aggregate", aggregator.process_batch, parsed)
+        del raw_rows, parsed, lines
+    retained = tracemalloc.get_traced_memory()[0] if trace_memory else None
+
+    data, payload_bytes = timer.run("export", _export, aggregator)
+    nodes = _verify(generator, aggregator, data)
+    with tempfile.TemporaryDirectory(prefix="errlog_bench_") as output_dir:
+        if ChartGenerator is not None:
+            charts = ChartGenerator(output_dir=os.path.join(output_dir, "charts"))
+            timer.run("chart", charts.generate_time_series_chart, data.get("time_series_data", {}))
+        if PDFGenerator is not None:
+            font_path = os.path.join(ROOT_DIR, "app", "assets", "fonts", "NanumGothic.ttf")
+            pdf = PDFGenerator(output_dir=output_dir, font_path=font_path)
+            timer.run("pdf", pdf.create_report, f"BENCH-{size_name}-{cardinality}", ANALYSIS_TEXT, data)
+
+    stats = {
+        "rows": aggregator.total_logs,
+        "groups": len(aggregator.groups),
+        "nodes": nodes,
+        "series": len(data.get("time_series_data", {}).get("series", {})),
+        "payload_bytes": payload_bytes,
+        "skipped": skipped,
+    }
+    if retained is not None:
+        stats["retained_bytes"] = retained
+    return timer, stats
+
+
+def benchmark_dataset(size_name, cardinality, page_size, seed, repeat, measure_memory):
+    """
+    :return: 데이터셋 결과 dict (단계별 seconds 는 repeat 회 중 최솟값)
+    """
+    samples = []
+    stats = None
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        timer, stats = run_pipeline(size_name, cardinality, page_size, seed)
+        samples.append(timer.seconds)
+
+    memory = None
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            memory, memory_stats = run_pipeline(size_name, cardinality, page_size, seed, trace_memory=True)
+        finally:
+            tracemalloc.stop()
+        stats["retained_bytes"] = memory_stats["retained_bytes"]
+
+    rows = stats["rows"]
+    stages = {}
+    for stage in STAGES:
+        if stage in stats["skipped"]:
+            stages[stage] = {"skipped": stats["skipped"][stage]}
+            continue
+        seconds = min(sample[stage] for sample in samples)
+        result = {
+            "seconds": round(seconds, 6),
+            "samples": [round(sample[stage], 6) for sample in samples],
+            "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+        }
+        if memory is not None:
+            result["peak_mb"] = round(memory.peak_bytes[stage] / 1024 / 1024, 3)
+        stages[stage] = result
+
+    pipeline_seconds = sum(stages[stage].get("seconds", 0.0) for stage in PIPELINE_STAGES)
+    result = {
+        "dataset": f"{size_name}-{cardinality}",
+        "size": size_name,
+        "cardinality": cardinality,
+        "rows": rows,
+        "groups": stats["groups"],
+        "series": stats["series"],
+        "payload_bytes": stats["payload_bytes"],
+        "stages": stages,
+        "pipeline": {
+            "seconds": round(pipeline_seconds, 6),
+            "rows_per_sec": round(rows / pipeline_seconds, 1) if pipeline_seconds > 0 else None,
+        },
+    }
+    if memory is not None:
+        result["pipeline"]["peak_mb"] = round(memory.max_traced / 1024 / 1024, 3)
+        result["retained_mb"] = round(stats["retained_bytes"] / 1024 / 1024, 3)
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _max_rss_mb():
+    """프로세스 최대 RSS (MB, resource 모듈이 없는 Windows 에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 바이트 단위
+    return round(rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024, 1)
+
+
+def compare(current, baseline):
+    """
+    두 결과의 데이터셋/단계별 소요 시간과 메모리 비율 (현재 / 기준)
+    :return: [(dataset, stage, 기준 seconds, 현재 seconds, 시간 비율, 메모리 비율)]
+    """
+    base_by_name = {item["dataset"]: item for item in baseline.get("results", [])}
+    rows = []
+    for item in current.get("results", []):
+        base = base_by_name.get(item["dataset"])
+        if base is None:
+            continue
+        pairs = [(stage, item["stages"].get(stage, {}), base["stages"].get(stage, {})) for stage in STAGES]
+        pairs.append(("pipeline", item["pipeline"], base["pipeline"]))
+        for stage, now, before in pairs:
+            if "seconds" not in now or "seconds" not in before:
+                continue
+            time_ratio = now["seconds"] / before["seconds"] if before["seconds"] else None
+            memory_ratio = None
+            if now.get("peak_mb") is not None and before.get("peak_mb"):
+                memory_ratio = now["peak_mb"] / before["peak_mb"]
+            rows.append((item["dataset"], stage, before["seconds"], now["seconds"], time_ratio, memory_ratio))
+    return rows
+
+
+def _print_result(result):
+    print(f"\n[{result['dataset']}] {result['rows']}행 / 그룹 {result['groups']}개 / "
+          f"시리즈 {result['series']}개 / 요청 본문 {result['payload_bytes'] / 1024:.1f}KB")
+    for stage, value in list(result["stages"].items()) + [("pipeline", result["pipeline"])]:
+        if "skipped" in value:
+            print(f"  {stage:<10} 건너뜀 ({value['skipped']})")
+            continue
+        peak = f"  peak {value['peak_mb']:.1f}MB" if value.get("peak_mb") is not None else ""
+        rate = f"{value['rows_per_sec']:>14,.0f} 행/초" if value.get("rows_per_sec") else ""
+        print(f"  {stage:<10} {value['seconds']:>10.3f}초 {rate}{peak}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에러 로그 처리 파이프라인 벤치마크")
+    parser.add_argument("--sizes", default=",".join(SIZES), help=f"데이터셋 크기 ({', '.join(SIZES)})")
+    parser.add_argument("--cardinality", default=",".join(CARDINALITIES),
+                        help=f"카디널리티 프로파일 ({', '.join(CARDINALITIES)})")
+    parser.add_argument("--page-size", type=int, default=1000, help="파싱/집계 단위 행 수 (조회 페이지 크기)")
+    parser.add_argument("--repeat", type=int, default=1, help="시간 측정 반복 횟수 (단계별 최솟값 기록)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="메모리 측정 회차 생략")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: data/benchmarks/bench_<시각>_<커밋>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    sizes = [name.strip().lower() for name in args.sizes.split(",") if name.strip()]
+    cardinalities = [name.strip().lower() for name in args.cardinality.split(",") if name.strip()]
+    unknown = [name for name in sizes if name not in SIZES] + [name for name in cardinalities
+                                                               if name not in CARDINALITIES]
+    if unknown:
+        parser.error(f"알 수 없는 데이터셋: {', '.join(unknown)}")
+
+    commit = _git_commit()
+    started = datetime.now()
+    results = []
+    for size_name in sizes:
+        for cardinality in cardinalities:
+            result = benchmark_dataset(size_name, cardinality, args.page_size, args.seed, args.repeat,
+                                       not args.no_memory)
+            _print_result(result)
+            results.append(result)
+
+    report = {
+        "format": RESULT_FORMAT,
+        "created": started.strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": commit,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "max_rss_mb": _max_rss_mb(),
+        },
+        "options": {
+            "page_size": args.page_size,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "memory": not args.no_memory,
+            "dataset_date": DATASET_DATE,
+            "cardinalities": {name: CARDINALITIES[name] for name in cardinalities},
+        },
+        "results": results,
+    }
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULT_DIR, exist_ok=True)
+        output = os.path.join(RESULT_DIR, f"bench_{started:%Y%m%d_%H%M%S}_{commit or 'nogit'}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\n비교 기준: {args.compare} (commit {baseline.get('commit')})")
+        differs = [key for key in ("page_size", "seed", "dataset_date")
+                   if baseline.get("options", {}).get(key) != report["options"][key]]
+        if differs:
+            print(f"  [주의] 측정 옵션이 다름: {', '.join(differs)}")
+        for dataset, stage, before, now, time_ratio, memory_ratio in compare(report, baseline):
+            memory = f"  메모리 x{memory_ratio:.2f}" if memory_ratio is not None else ""
+            ratio = f"x{time_ratio:.2f}" if time_ratio is not None else "-"
+            print(f"  {dataset:<10} {stage:<10} {before:>9.3f}초 -> {now:>9.3f}초  {ratio}{memory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,16 @@ class AppConfig:
     # Dify 설정
     DIFY_API_URL = "https://api.dify.ai/v1/workflows/run"
     DIFY_API_KEY = "YOUR_API_KEY_HERE"
+    # Dify 분석 요청 크기: issue_groups 입력 하나의 최대 크기 (바이트 / 추정 토큰, 0 이면 제한 없음)
+    # 넘으면 여러 요청으로 나누어 DIFY_MAX_PARALLEL 개씩 동시에 분석하고 결과를 합침
+    # DIFY_MAX_CHUNKS 는 요청 수 상한 (0 이면 제한 없음). 지정 시 넘는 하위 이슈 그룹은 분석에서 제외하고 리포트에 제외 건수 기록
+    # settings.json 의 dify_config 에 payload_max_bytes / payload_max_tokens / max_chunks / max_parallel 이 있으면 우선 적용
+    DIFY_PAYLOAD_MAX_BYTES = 64 * 1024
+    DIFY_PAYLOAD_MAX_TOKENS = 0
+    DIFY_SNAPSHOTS_PER_ISSUE = 2      # 이슈당 전송할 peak 스냅샷 수
+    DIFY_SNAPSHOT_MAX_CHARS = 300     # 스냅샷 한 줄 최대 길이
+    DIFY_MAX_CHUNKS = 0
+    DIFY_MAX_PARALLEL = 4
     
     # UI 색상 테마 (이미지 참고)
     COLOR_BG = "#111827"       # 다크 네이비 배경
@@ -17,4 +27,72 @@ class AppConfig:
     # [수정 요청 1] 기본 로그 경로: 프로그램 설치 경로/logs
     # 현재 실행 위치(os.getcwd()) 기준 logs 폴더
     BASE_DIR = os.getcwd()
-    DEFAULT_LOG_PATH = os.path.join(BASE_DIR, "logs")
\ No newline at end of file
+    DEFAULT_LOG_PATH = os.path.join(BASE_DIR, "logs")
+
+    # 집계 체크포인트 (스캔 중단 시 마지막 저장 시점부터 재개)
+    # 채널 설정(settings.json)에 checkpoint_interval_sec / checkpoint_every_pages 가 있으면 우선 적용
+    CHECKPOINT_DIR = os.path.join(BASE_DIR, "data", "checkpoints")
+    CHECKPOINT_INTERVAL_SEC = 30   # 마지막 저장 후 경과 시간 기준 (초, 0 이면 사용 안 함)
+    CHECKPOINT_EVERY_PAGES = 20    # 마지막 저장 후 처리한 페이지 수 기준 (0 이면 사용 안 함)
+
+    # BXM 로그인 쿠키 재사용 시간 (초). 마지막 요청 후 이 시간이 지나면 다음 스캔에서 다시 로그인
+    # (서버 세션 타임아웃보다 짧게 설정. 그 전에 만료되어도 조회 중 인증 실패 시 자동으로 재로그인)
+    LOGIN_SESSION_IDLE_SEC = 1500
+
+    # BXM 관리 서버 보호: 서버별 초당 요청 수 한도(0 이면 제한 없음)와 대기 없이 연속 전송할 수 있는 요청 수
+    # 여러 채널이 같은 서버를 조회하면 한도를 나누어 사용
+    BXM_RATE_LIMIT_RPS = 20
+    BXM_RATE_LIMIT_BURST = 4
+    # 연속 실패가 THRESHOLD 회에 이르면 RESET_SEC 동안 해당 서버로 요청을 보내지 않고 오류로 알림
+    BXM_BREAKER_THRESHOLD = 5
+    BXM_BREAKER_RESET_SEC = 30
+    # 로그인 실패 시 가상(Mock) 로그로 대체할지 여부 (개발용. 조회 중 오류는 항상 오류로 처리)
+    BXM_MOCK_FALLBACK = False
+
+    # BXM 에러 로그 페이지 동시 요청 수 (채널 설정의 max_in_flight 가 있으면 우선 적용)
+    FETCH_MAX_IN_FLIGHT = 4
+
+    # 집계 메모리 한도 (MB). 초과하면 상위 그룹만 유지하는 bounded(근사) 집계로 전환하여 계속 수집
+    # 채널 설정의 memory_limit_mb 가 있으면 우선 적용
+    AGGREGATOR_MEMORY_LIMIT_MB = 512
+    MEMORY_CHECK_EVERY_PAGES = 10  # 메모리 사용량 점검 주기 (페이지)
+
+    # 에러 로그 페이지 크기 (건). 채널 설정의 page_size / page_size_min / page_size_max 가 있으면 우선 적용
+    # ADAPTIVE_PAGE_SIZE 면 PAGE_SIZE 에서 시작해 행당 응답 시간이 줄어드는 동안 MIN x 2^k 단계로 키우고,
+    # 응답 시간 초과 / 응답 크기가 PAGE_MAX_PAYLOAD_MB 를 넘으면 줄임 (채널 설정 adaptive_page_size)
+    PAGE_SIZE = 100
+    PAGE_SIZE_MIN = 50
+    PAGE_SIZE_MAX = 1600
+    ADAPTIVE_PAGE_SIZE = True
+    PAGE_MAX_PAYLOAD_MB = 8
+
+    # 조회 기간 분할 단위 (분). 구간별로 병렬 조회하며 밀집 구간은 자동으로 더 잘게 나눈다
+    # 0 이면 단일 구간으로 페이지 조회. 채널 설정의 split_minutes 가 있으면 우선 적용
+    SPLIT_MINUTES = 60
+
+    # 증분 조회: 완료된 스캔의 집계 상태와 high-water mark(마지막 반영 시각)를 채널별 체크포인트로 남겨 두고,
+    # 같은 시작 시각으로 다시 검사하면 그 이후 로그만 조회하여 병합. 채널 설정의 delta_scan 이 있으면 우선 적용
+    DELTA_SCAN = True
+
+    # BXM 에러 로그 조회 응답 디스크 캐시 (조회 조건별 응답 본문 저장). 채널 설정 response_cache 로 끌 수 있음
+    # 종료 시각이 SETTLE_SEC 이상 지난 기간은 만료 없이 보관, 현재를 포함하는 기간은 TTL_SEC 동안만 사용
+    RESPONSE_CACHE_ENABLED = True
+    RESPONSE_CACHE_DIR = os.path.join(BASE_DIR, "data", "response_cache")
+    RESPONSE_CACHE_MAX_MB = 256
+    RESPONSE_CACHE_TTL_SEC = 60
+    RESPONSE_CACHE_SETTLE_SEC = 300
+
+    # Dify 분석 결과 디스크 캐시 (워크플로 URL/API 키 + 이슈 그룹 입력 해시별 result 저장, 같은 입력은 재호출 없이 재사용)
+    # DIFY_CACHE_PER_GROUP 이면 이슈 그룹 단위로 저장하여 새로 생기거나 바뀐 그룹만 분석 (결과 항목에 error_id 필요)
+    # dify_config 의 analysis_cache / cache_per_group 이 있으면 우선 적용. TTL 0 이면 만료 없음
+    DIFY_CACHE_ENABLED = True
+    DIFY_CACHE_DIR = os.path.join(BASE_DIR, "data", "analysis_cache")
+    DIFY_CACHE_MAX_MB = 64
+    DIFY_CACHE_TTL_SEC = 7 * 24 * 3600
+    DIFY_CACHE_PER_GROUP = False
+
+    # 스캔별 단계 소요 시간 / 카운터 측정 결과 파일 (채널별 최근 SCAN_METRICS_KEEP 개 보관, 0 이면 모두 보관)
+    # 채널 설정의 scan_metrics 가 False 면 파일로 저장하지 않음 (metrics_signal 은 항상 전달)
+    SCAN_METRICS_ENABLED = True
+    SCAN_METRICS_DIR = os.path.join(BASE_DIR, "data", "metrics")
+    SCAN_METRICS_KEEP = 100